@@ -0,0 +1,51 @@
+import argparse
+
+from .harness import (
+    CHECKERS,
+    ID_INDEXES,
+    Measurement,
+    bench_checker,
+    bench_facts_extractor,
+    bench_plugin,
+    bench_visitor,
+    extract_facts,
+    measure,
+    measure_id_index,
+    measure_import_time
+)
+
+
+def print_row(name: str, result: Measurement) -> None:
+    print(f'{name:<28}{result.size:>10}{result.seconds:>12.3f}'
+          f'{result.seconds_per_scenario * 1e6:>14.2f}{result.peak_bytes / 1024:>12.0f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    print(f'flake8_vedro_allure.plugins import: {measure_import_time() * 1000:.1f} ms\n')
+    print(f'{"benchmark":<28}{"scenarios":>10}{"total, s":>12}{"us/scenario":>14}{"peak, KiB":>12}')
+    for size in sizes:
+        print_row('ScenarioVisitor', measure(bench_visitor, size))
+        print_row('VedroAllurePlugin.run', measure(bench_plugin, size))
+        for extractor in ('ast', 'tokens'):
+            print_row(f'facts extractor: {extractor}',
+                      measure(lambda size: bench_facts_extractor(size, extractor), size))
+        facts = extract_facts(size)
+        for checker_cls in CHECKERS:
+            print_row(checker_cls.__name__,
+                      measure(lambda _: bench_checker(checker_cls, facts), size))
+
+    print(f'\n{"allure id index":<28}{"ids":>10}{"per file":>12}{"bytes/id":>14}{"kept, KiB":>12}')
+    for size in sizes:
+        for scenarios_per_file in (1, 10):
+            for index_cls in ID_INDEXES:
+                result = measure_id_index(index_cls, size, scenarios_per_file)
+                print(f'{index_cls.__name__:<28}{size:>10}{scenarios_per_file:>12}'
+                      f'{result.bytes_per_scenario:>14.0f}{result.peak_bytes / 1024:>12.0f}')
+
+
+main()
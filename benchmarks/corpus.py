@@ -0,0 +1,80 @@
+import os
+import random
+from typing import Iterator, NamedTuple, Tuple
+
+LABELS = ('Feature', 'Story', 'Priority', 'Owner')
+
+
+class CorpusMix(NamedTuple):
+    # shares of scenarios, each one is checked independently
+    allure_labels: float = 0.9
+    allure_id_decorator: float = 0.6
+    imported_id_decorator: float = 0.2
+    dynamic_id_call: float = 0.1
+    duplicate_id: float = 0.01
+    # @params cases with their own allure ids on __init__ of scenarios with dynamic ids
+    params_cases: int = 0
+
+
+class CorpusFile(NamedTuple):
+    filename: str
+    source: str
+
+
+def _scenario_source(index: int, allure_id: int, mix: CorpusMix, rnd: random.Random) -> str:
+    imports = ['import vedro', 'import allure']
+    decorators = []
+    body = [f'    subject = "scenario {index}"', '']
+
+    if rnd.random() < mix.allure_labels:
+        tags = [f'{label}.Value{rnd.randrange(10)}' for label in LABELS if rnd.random() < 0.8]
+        decorators.append(f'@allure_labels({", ".join(tags)})')
+
+    id_kind = rnd.random()
+    if id_kind < mix.allure_id_decorator:
+        decorators.append(f'@allure.id({allure_id})')
+    elif id_kind < mix.allure_id_decorator + mix.imported_id_decorator:
+        imports.append('from allure import id')
+        decorators.append(f'@id({allure_id})')
+    elif id_kind < mix.allure_id_decorator + mix.imported_id_decorator + mix.dynamic_id_call:
+        body = [
+            f'    @vedro.params({case}, allure_id={allure_id * 1000 + case})' for case in range(mix.params_cases)
+        ] + [
+            '    def __init__(self, case, allure_id):' if mix.params_cases else '    def __init__(self, allure_id):',
+            '        allure.dynamic.id(allure_id)',
+            '',
+        ] + body
+
+    body += [
+        '    def given(self):',
+        '        self.user = create_user()',
+        '',
+        '    def when(self):',
+        '        self.response = get_user(self.user)',
+        '',
+        '    def then(self):',
+        '        assert self.response.status_code == 200',
+    ]
+    return '\n'.join(imports + [''] + decorators + ['class Scenario(vedro.Scenario):'] + body) + '\n'
+
+
+def generate_corpus(size: int, mix: CorpusMix = CorpusMix(), seed: int = 0) -> Iterator[CorpusFile]:
+    """Lazily generate `size` scenario files, one scenario per file."""
+    rnd = random.Random(seed)
+    for index in range(size):
+        allure_id = 100_000 + index
+        if index > 0 and rnd.random() < mix.duplicate_id:
+            allure_id = 100_000 + rnd.randrange(index)
+        filename = f'scenarios/group_{index // 100:04}/scenario_{index:06}.py'
+        yield CorpusFile(filename, _scenario_source(index, allure_id, mix, rnd))
+
+
+def write_corpus(path: str, size: int, mix: CorpusMix = CorpusMix(), seed: int = 0) -> Tuple[str, ...]:
+    filenames = []
+    for corpus_file in generate_corpus(size, mix, seed):
+        filename = os.path.join(path, corpus_file.filename)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as f:
+            f.write(corpus_file.source)
+        filenames.append(filename)
+    return tuple(filenames)
@@ -0,0 +1,226 @@
+import ast
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from flake8_vedro_allure.abstract_checkers import ScenarioChecker
+from flake8_vedro_allure.config import Config, DefaultConfig
+from flake8_vedro_allure.facts import ScenarioFacts, TokenFactsExtractor
+from flake8_vedro_allure.id_index import (
+    AllureIdIndex,
+    AllureIdInScenario,
+    InMemoryAllureIdIndex
+)
+from flake8_vedro_allure.plugins import VedroAllurePlugin
+from flake8_vedro_allure.visitors import Context, ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    AllureLabelsChecker,
+    AllureRequiredTagsChecker,
+    AllureUniqueTagsChecker,
+    DuplicateAllureIdChecker
+)
+
+from .corpus import CorpusMix, generate_corpus
+
+CHECKERS = (
+    AllureLabelsChecker,
+    AllureRequiredTagsChecker,
+    AllureUniqueTagsChecker,
+    AllureIdRequiredChecker,
+    DuplicateAllureIdChecker,
+)
+
+BENCH_CONFIG = DefaultConfig(
+    is_allure_labels_optional=False,
+    required_allure_labels=['Feature', 'Story'],
+    unique_allure_labels=['Priority'],
+    is_allure_id_required=True,
+)
+
+
+class Measurement(NamedTuple):
+    size: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def seconds_per_scenario(self) -> float:
+        return self.seconds / self.size
+
+    @property
+    def bytes_per_scenario(self) -> float:
+        return self.peak_bytes / self.size
+
+
+def register_all_checkers() -> None:
+    ScenarioVisitor.deregister_all()
+    for checker in CHECKERS:
+        ScenarioVisitor.register_scenario_checker(checker)
+
+
+def bench_visitor(size: int, config: Config = BENCH_CONFIG, mix: CorpusMix = CorpusMix()) -> float:
+    register_all_checkers()
+    elapsed = 0.0
+    for corpus_file in generate_corpus(size, mix):
+        tree = ast.parse(corpus_file.source)
+        started = time.perf_counter()
+        ScenarioVisitor(config=config, filename=corpus_file.filename).visit(tree)
+        elapsed += time.perf_counter() - started
+    return elapsed
+
+
+def bench_facts_extractor(size: int, extractor: str = 'ast', mix: CorpusMix = CorpusMix()) -> float:
+    """Time to read facts of corpus files from source bytes, ast parsing included."""
+    sources = [corpus_file.source.encode() for corpus_file in generate_corpus(size, mix)]
+    started = time.perf_counter()
+    if extractor == 'tokens':
+        token_extractor = TokenFactsExtractor()
+        for source in sources:
+            token_extractor.extract_file_facts(source)
+    else:
+        for source in sources:
+            ScenarioVisitor(checkers=[]).visit(ast.parse(source))
+    return time.perf_counter() - started
+
+
+def extract_facts(size: int, mix: CorpusMix = CorpusMix()) -> List[Tuple[str, ScenarioFacts]]:
+    facts = []
+    for corpus_file in generate_corpus(size, mix):
+        visitor = ScenarioVisitor(filename=corpus_file.filename, checkers=[])
+        visitor.visit(ast.parse(corpus_file.source))
+        facts.extend((corpus_file.filename, scenario_facts) for scenario_facts in visitor.scenarios_facts)
+    return facts
+
+
+def bench_checker(checker_cls: Type[ScenarioChecker], facts: Sequence[Tuple[str, ScenarioFacts]],
+                  config: Config = BENCH_CONFIG) -> float:
+    checker = checker_cls()
+    contexts = [Context(facts=scenario_facts, filename=filename) for filename, scenario_facts in facts]
+    started = time.perf_counter()
+    for context in contexts:
+        checker.check_scenario(context, config)
+    return time.perf_counter() - started
+
+
+def bench_plugin(size: int, config: Config = BENCH_CONFIG, mix: CorpusMix = CorpusMix()) -> float:
+    register_all_checkers()
+    elapsed = 0.0
+    with VedroAllurePlugin.test_config(config):
+        for corpus_file in generate_corpus(size, mix):
+            tree = ast.parse(corpus_file.source)
+            lines = corpus_file.source.splitlines(True)
+            started = time.perf_counter()
+            for _ in VedroAllurePlugin(tree, corpus_file.filename, lines).run():
+                pass
+            elapsed += time.perf_counter() - started
+    return elapsed
+
+
+def measure_time(bench: Callable[[int], float], size: int, repeat: int = 1) -> Measurement:
+    return Measurement(size, min(bench(size) for _ in range(repeat)), 0)
+
+
+def measure(bench: Callable[[int], float], size: int, repeat: int = 1) -> Measurement:
+    seconds = min(bench(size) for _ in range(repeat))
+
+    tracemalloc.start()
+    try:
+        bench(size)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(size, seconds, peak_bytes)
+
+
+class DictAllureIdIndex(AllureIdIndex):
+    """Previous in-memory index with a tuple per id, a reference for memory benchmarks."""
+
+    def __init__(self):
+        self._allure_ids: Dict[str, AllureIdInScenario] = {}
+
+    def add(self, allure_id: str, scenario_path: str, lineno: int) -> None:
+        occurrence = AllureIdInScenario(scenario_path, lineno)
+        owner = self._allure_ids.get(allure_id)
+        if owner is None or occurrence < owner:
+            self._allure_ids[allure_id] = occurrence
+
+    def owner(self, allure_id: str) -> Optional[AllureIdInScenario]:
+        return self._allure_ids.get(allure_id)
+
+    def reset(self) -> None:
+        self._allure_ids = {}
+
+
+ID_INDEXES = (DictAllureIdIndex, InMemoryAllureIdIndex)
+
+
+def generate_allure_ids(size: int, scenarios_per_file: int = 1) -> Iterator[Tuple[str, str, int]]:
+    # strings are created for every id, as they are when read from manifests, shards or sqlite
+    for index in range(size):
+        file_number = index // scenarios_per_file
+        yield (str(100000 + index), f'scenarios/feature_{file_number % 200}/scenario_{file_number}.py',
+               4 + 20 * (index % scenarios_per_file))
+
+
+def measure_id_index(index_cls: Type[AllureIdIndex], size: int, scenarios_per_file: int = 1) -> Measurement:
+    """Memory kept by the index with `size` ids, peak_bytes is what is retained after it is built."""
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        index = index_cls()
+        index.add_many(generate_allure_ids(size, scenarios_per_file))
+        seconds = time.perf_counter() - started
+        retained_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del index
+    return Measurement(size, seconds, retained_bytes)
+
+
+def growth(measurements: Sequence[Measurement], attribute: str) -> float:
+    """Per scenario cost of the largest run relative to the smallest one."""
+    smallest, largest = measurements[0], measurements[-1]
+    return getattr(largest, attribute) / getattr(smallest, attribute)
+
+
+# flake8 itself is loaded before plugins, so it is not counted in plugin import time
+IMPORT_BASELINE = ('flake8.main.application', 'flake8.checker', 'flake8_plugin_utils')
+
+
+def _import_seconds(module: str, preloaded: Sequence[str] = IMPORT_BASELINE) -> float:
+    """Cumulative `-X importtime` of the package of module in a fresh interpreter, preloaded modules excluded."""
+    code = f'import {", ".join(preloaded)}; import {module}' if preloaded else f'import {module}'
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True).stderr
+    package = module.split('.')[0]
+    microseconds = 0
+    for line in output.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # top level entries have a single space before module name
+        if name == f' {package}' or name.startswith(f' {package}.'):
+            microseconds += int(cumulative)
+    return microseconds / 1e6
+
+
+def measure_import_time(module: str = 'flake8_vedro_allure.plugins', repeat: int = 5) -> float:
+    """Median cumulative `-X importtime` of module in fresh interpreters, in seconds."""
+    return statistics.median(_import_seconds(module) for _ in range(repeat))
+
+
+def measure_import_ratio(module: str = 'flake8_vedro_allure.plugins', baseline: str = 'flake8_plugin_utils',
+                         repeat: int = 5) -> float:
+    """
+    Median ratio of import time of module to a cold import of baseline.
+
+    Samples of both are taken in turns, so a slow or busy machine slows
+    both of them down.
+    """
+    return statistics.median(_import_seconds(module) / _import_seconds(baseline, preloaded=())
+                             for _ in range(repeat))
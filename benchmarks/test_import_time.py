@@ -0,0 +1,13 @@
+import os
+
+from .harness import measure_import_ratio
+
+# import of the plugin after flake8 relative to a cold import of flake8_plugin_utils (flake8 included):
+# eager import of checkers, sqlite cache and index took ~0.6 of it, lazy one takes ~0.35
+IMPORT_BUDGET_RATIO = float(os.environ.get('VEDRO_ALLURE_IMPORT_BUDGET_RATIO', '0.5'))
+
+
+def test_plugin_import_time_is_within_budget():
+    ratio = measure_import_ratio()
+
+    assert ratio < IMPORT_BUDGET_RATIO, ratio
@@ -0,0 +1,46 @@
+import os
+import pytest
+
+from .harness import (
+    CHECKERS,
+    bench_checker,
+    bench_plugin,
+    bench_visitor,
+    extract_facts,
+    growth,
+    measure,
+    measure_time
+)
+
+SIZES = [int(size) for size in os.environ.get('VEDRO_ALLURE_BENCH_SIZES', '1000,10000,100000').split(',')]
+
+# Linear code keeps per scenario cost flat, quadratic one grows with corpus size (x100 for 1k -> 100k)
+MAX_GROWTH = 3.0
+
+
+@pytest.fixture(scope='module')
+def facts_by_size():
+    return {size: extract_facts(size) for size in SIZES}
+
+
+def test_plugin_run_scales_linearly():
+    measurements = [measure(bench_plugin, size) for size in SIZES]
+
+    assert growth(measurements, 'seconds_per_scenario') < MAX_GROWTH, measurements
+    assert growth(measurements, 'bytes_per_scenario') < MAX_GROWTH, measurements
+
+
+def test_visitor_scales_linearly():
+    measurements = [measure_time(bench_visitor, size) for size in SIZES]
+
+    assert growth(measurements, 'seconds_per_scenario') < MAX_GROWTH, measurements
+
+
+@pytest.mark.parametrize('checker_cls', CHECKERS, ids=lambda checker_cls: checker_cls.__name__)
+def test_checker_scales_linearly(checker_cls, facts_by_size):
+    measurements = [
+        measure_time(lambda _: bench_checker(checker_cls, facts_by_size[size]), size, repeat=5)
+        for size in SIZES
+    ]
+
+    assert growth(measurements, 'seconds_per_scenario') < MAX_GROWTH, measurements
@@ -0,0 +1,9 @@
+__all__ = ['LintSession']
+
+
+def __getattr__(name):
+    # flake8 loads only the plugin, the embedding API is imported on demand
+    if name == 'LintSession':
+        from .session import LintSession
+        return LintSession
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
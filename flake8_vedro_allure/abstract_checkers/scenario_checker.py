@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 
 from flake8_plugin_utils import Error
 
@@ -7,6 +7,8 @@ from .scenario_helper import ScenarioHelper
 
 
 class ScenarioChecker(ScenarioHelper, ABC):
+    # codes of errors the checker can emit, checkers without codes always run
+    error_codes: Tuple[str, ...] = ()
 
     @abstractmethod
     def check_scenario(self, context, config) -> List[Error]:
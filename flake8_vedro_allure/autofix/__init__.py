@@ -0,0 +1,3 @@
+from .allocator import DirectoryAllocators, FreeIdAllocator, IdRange, parse_directory_ranges, parse_id_range
+from .edits import FileFix, FixResult, ScenarioFix, apply_fixes, insert_allure_ids
+from .plan import build_id_index, plan_fixes
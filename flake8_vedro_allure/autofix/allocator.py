@@ -0,0 +1,113 @@
+import os
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class IdRange(NamedTuple):
+    start: int
+    # exclusive
+    stop: int
+
+    def __contains__(self, allure_id: object) -> bool:
+        return isinstance(allure_id, int) and self.start <= allure_id < self.stop
+
+
+def parse_id_range(value: str) -> IdRange:
+    """`START-END` with both ends included."""
+    start, sep, end = value.strip().partition('-')
+    if not sep or not start.strip().isdigit() or not end.strip().isdigit():
+        raise ValueError(f'allure id range should be START-END, got {value!r}')
+    id_range = IdRange(int(start), int(end) + 1)
+    if id_range.start >= id_range.stop:
+        raise ValueError(f'allure id range {value!r} is empty')
+    return id_range
+
+
+def parse_directory_ranges(values: Sequence[str]) -> List[Tuple[str, IdRange]]:
+    """`DIR=START-END` items, ranges of directories must not overlap."""
+    directory_ranges = []
+    for value in values:
+        directory, sep, id_range = value.partition('=')
+        if not sep or not directory.strip():
+            raise ValueError(f'allure id range of a directory should be DIR=START-END, got {value!r}')
+        directory_ranges.append((directory.strip(), parse_id_range(id_range)))
+    ranges = sorted(id_range for _, id_range in directory_ranges)
+    for previous, current in zip(ranges, ranges[1:]):
+        if current.start < previous.stop:
+            raise ValueError(f'allure id ranges {previous.start}-{previous.stop - 1} and '
+                             f'{current.start}-{current.stop - 1} overlap')
+    return directory_ranges
+
+
+class FreeIdAllocator:
+    """
+    Free allure ids of a range, lowest first.
+
+    Used ids of the range are kept sorted and gaps between them are found
+    lazily. The cursor and the position in used ids only move forward, so
+    memory depends on the number of used ids, not on the size of the range,
+    and n allocations cost O(n + used) in total.
+    """
+
+    def __init__(self, id_range: IdRange, used_ids: Iterable[int] = ()):
+        self.id_range = id_range
+        self._used_ids = sorted({allure_id for allure_id in used_ids if allure_id in id_range})
+        self._used_index = 0
+        self._cursor = id_range.start
+
+    def allocate(self) -> Optional[int]:
+        """The lowest free id, None if the range is exhausted."""
+        used_ids = self._used_ids
+        index = self._used_index
+        allure_id = self._cursor
+        while index < len(used_ids) and used_ids[index] == allure_id:
+            index += 1
+            allure_id += 1
+        self._used_index = index
+        if allure_id >= self.id_range.stop:
+            self._cursor = self.id_range.stop
+            return None
+        self._cursor = allure_id + 1
+        return allure_id
+
+
+class DirectoryAllocators:
+    """
+    Allocators of directory ranges and of the default range for other files.
+
+    Without a default range ids of other files are allocated above the
+    highest used id and the highest id of directory ranges. Used ids are
+    sorted, `needed` is the number of ids to allocate.
+    """
+
+    def __init__(self, used_ids: Sequence[int], needed: int,
+                 default_range: Optional[IdRange] = None,
+                 directory_ranges: Sequence[Tuple[str, IdRange]] = ()):
+        self._directories: List[Tuple[str, FreeIdAllocator]] = sorted(
+            ((os.path.abspath(directory), self._make_allocator(id_range, used_ids))
+             for directory, id_range in directory_ranges),
+            key=lambda item: len(item[0]), reverse=True
+        )
+        if default_range is None:
+            start = max([*used_ids[-1:], *(id_range.stop - 1 for _, id_range in directory_ranges), 0]) + 1
+            default_range = IdRange(start, start + max(needed, 1))
+        for _, id_range in directory_ranges:
+            if id_range.start < default_range.stop and default_range.start < id_range.stop:
+                raise ValueError(f'allure id range {default_range.start}-{default_range.stop - 1} overlaps '
+                                 f'range {id_range.start}-{id_range.stop - 1} of a directory')
+        self.default = self._make_allocator(default_range, used_ids)
+
+    @staticmethod
+    def _make_allocator(id_range: IdRange, used_ids: Sequence[int]) -> FreeIdAllocator:
+        start = bisect_left(used_ids, id_range.start)
+        return FreeIdAllocator(id_range, used_ids[start:bisect_left(used_ids, id_range.stop, start)])
+
+    def get_allocator(self, filename: str) -> FreeIdAllocator:
+        path = os.path.abspath(filename)
+        for directory, allocator in self._directories:
+            if path.startswith(directory + os.sep):
+                return allocator
+        return self.default
+
+    def allocate(self, filename: str) -> Optional[int]:
+        return self.get_allocator(filename).allocate()
@@ -0,0 +1,142 @@
+import ast
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from flake8_vedro_allure.facts import AllureImportAliases, AstFactsExtractor
+from flake8_vedro_allure.facts.import_aliases import ALLURE_MODULE
+
+FIX_BATCH_SIZE = 64
+
+
+class ScenarioFix(NamedTuple):
+    # position of the `class` keyword of the scenario
+    lineno: int
+    col_offset: int
+    allure_id: int
+
+
+class FileFix(NamedTuple):
+    filename: str
+    scenarios: Tuple[ScenarioFix, ...]
+
+
+class FixResult(NamedTuple):
+    filename: str
+    fixed: int
+    error: Optional[str] = None
+
+
+class StaleFixError(Exception):
+    """The file was changed after it was linted, its fix doesn't match its scenarios."""
+
+
+def _id_decorator_name(tree: ast.Module) -> Optional[str]:
+    """Name the module calls allure.id by, None if allure is not imported at module level."""
+    id_names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == ALLURE_MODULE:
+                    return f'{alias.asname or alias.name}.id'
+        elif isinstance(node, ast.ImportFrom) and node.module == ALLURE_MODULE:
+            id_names.extend(alias.asname or alias.name for alias in node.names if alias.name == 'id')
+    return id_names[0] if id_names else None
+
+
+def _statement_start(node: ast.stmt) -> int:
+    decorators = getattr(node, 'decorator_list', [])
+    return min([node.lineno] + [decorator.lineno for decorator in decorators])
+
+
+def _import_insertion(tree: ast.Module, newline: bytes) -> Tuple[int, bytes]:
+    """Line index and text of `import allure`: above the first import, after the docstring otherwise."""
+    body = tree.body
+    index = 0
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+            and isinstance(body[0].value.value, str):
+        index = 1
+    while index < len(body) and isinstance(body[index], ast.ImportFrom) and body[index].module == '__future__':
+        index += 1
+    text = f'import {ALLURE_MODULE}'.encode() + newline
+    # a scenario class is in the body, so there is a statement after the docstring
+    node = body[index]
+    if not isinstance(node, (ast.Import, ast.ImportFrom)):
+        # the import is the only one, it is separated from the code as flake8 wants
+        text += newline * (2 if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) else 1)
+    return _statement_start(node) - 1, text
+
+
+def _check_scenarios(tree: ast.Module, scenarios: Sequence[ScenarioFix]) -> None:
+    classes = {(node.lineno, node.col_offset): node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)}
+    aliases = AllureImportAliases()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            aliases.add_import(node)
+        elif isinstance(node, ast.ImportFrom):
+            aliases.add_import_from(node)
+    extractor = AstFactsExtractor()
+    for scenario in scenarios:
+        node = classes.get((scenario.lineno, scenario.col_offset))
+        if node is None:
+            raise StaleFixError(f'no class at line {scenario.lineno}')
+        if extractor.extract_scenario_facts(node, aliases=aliases).has_allure_id:
+            raise StaleFixError(f'class at line {scenario.lineno} already has an allure id')
+
+
+def insert_allure_ids(source: bytes, scenarios: Sequence[ScenarioFix]) -> bytes:
+    """
+    Source with `@allure.id(N)` lines inserted right above the `class` lines of scenarios.
+
+    Other lines are kept byte for byte, `import allure` is added only if
+    allure and allure.id are not imported at module level.
+    """
+    tree = ast.parse(source)
+    _check_scenarios(tree, scenarios)
+    lines: List[bytes] = source.splitlines(keepends=True)
+    newline = b'\r\n' if lines[0].endswith(b'\r\n') else b'\n'
+
+    # (line index, order at the same index, text), inserted from the end so indexes stay valid
+    insertions: List[Tuple[int, int, bytes]] = []
+    decorator = _id_decorator_name(tree)
+    if decorator is None:
+        decorator = f'{ALLURE_MODULE}.id'
+        index, text = _import_insertion(tree, newline)
+        insertions.append((index, 0, text))
+    for scenario in scenarios:
+        indent = lines[scenario.lineno - 1][:scenario.col_offset]
+        text = indent + f'@{decorator}({scenario.allure_id})'.encode() + newline
+        insertions.append((scenario.lineno - 1, 1, text))
+
+    for index, _, text in sorted(insertions, reverse=True):
+        lines.insert(index, text)
+    return b''.join(lines)
+
+
+def write_atomically(path: str, data: bytes) -> None:
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def apply_file_fix(fix: FileFix) -> FixResult:
+    try:
+        with open(fix.filename, 'rb') as f:
+            source = f.read()
+        write_atomically(fix.filename, insert_allure_ids(source, fix.scenarios))
+    except (OSError, SyntaxError, ValueError, StaleFixError) as e:
+        return FixResult(fix.filename, 0, str(e))
+    return FixResult(fix.filename, len(fix.scenarios))
+
+
+def apply_fixes(fixes: Sequence[FileFix], jobs: Optional[int] = None,
+                batch_size: int = FIX_BATCH_SIZE) -> List[FixResult]:
+    """Edit files in worker processes, every file is replaced at once, so readers never see half of it."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(fixes) <= batch_size:
+        return [apply_file_fix(fix) for fix in fixes]
+    with ProcessPoolExecutor(jobs) as executor:
+        return list(executor.map(apply_file_fix, fixes, chunksize=batch_size))
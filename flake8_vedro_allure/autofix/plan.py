@@ -0,0 +1,65 @@
+import os
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from flake8_vedro_allure.errors import NoAllureIdError
+from flake8_vedro_allure.id_index import InMemoryAllureIdIndex
+
+from .allocator import DirectoryAllocators, IdRange
+from .edits import FileFix, ScenarioFix
+
+if TYPE_CHECKING:
+    from flake8_vedro_allure.id_manifest import AllureIdRecord
+    from flake8_vedro_allure.runner import FileReport
+
+
+def build_id_index(reports: Sequence['FileReport'],
+                   baseline: Sequence['AllureIdRecord'] = ()) -> InMemoryAllureIdIndex:
+    """Ids of scenarios and params cases of all reports and of baseline files which were not linted."""
+    index = InMemoryAllureIdIndex()
+    index.add_many((record.allure_id, record.path, record.lineno) for record in baseline)
+    index.add_many(
+        (allure_id, report.filename, lineno)
+        for report in reports for scenario in report.file_facts.scenarios
+        for allure_id, lineno, *_ in scenario.iter_allure_ids()
+    )
+    return index
+
+
+def find_missing_ids(reports: Sequence['FileReport']) -> List[Tuple[str, List[Tuple[int, int]]]]:
+    """Files with positions of scenarios reported with ALR004, ordered by path and line."""
+    missing = []
+    for report in sorted(reports, key=lambda report: os.path.normpath(report.filename)):
+        positions = sorted({(error.lineno, error.col_offset) for error in report.errors
+                            if error.code == NoAllureIdError.code})
+        if positions:
+            missing.append((report.filename, positions))
+    return missing
+
+
+def plan_fixes(reports: Sequence['FileReport'], default_range: Optional[IdRange] = None,
+               directory_ranges: Sequence[Tuple[str, IdRange]] = (),
+               baseline: Sequence['AllureIdRecord'] = ()) -> Tuple[List[FileFix], int]:
+    """
+    Free allure ids for scenarios reported with ALR004 and the number of scenarios left without ids.
+
+    Numeric ids used anywhere are taken from the id index, so ids are
+    never reused. Files are visited by path, so the same tree always gets
+    the same ids.
+    """
+    missing = find_missing_ids(reports)
+    allocators = DirectoryAllocators(build_id_index(reports, baseline).numeric_ids(),
+                                     sum(len(positions) for _, positions in missing),
+                                     default_range, directory_ranges)
+    fixes = []
+    unassigned = 0
+    for filename, positions in missing:
+        scenarios = []
+        for lineno, col_offset in positions:
+            allure_id = allocators.allocate(filename)
+            if allure_id is None:
+                unassigned += 1
+            else:
+                scenarios.append(ScenarioFix(lineno, col_offset, allure_id))
+        if scenarios:
+            fixes.append(FileFix(filename, tuple(scenarios)))
+    return fixes, unassigned
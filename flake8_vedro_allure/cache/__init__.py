@@ -0,0 +1,4 @@
+from .class_cache import ClassCache, get_class_cache
+from .facts_cache import FactsCache, get_facts_cache
+from .lru import SqliteLruCache
+from .result_cache import CachedResult, ResultCache, get_result_cache
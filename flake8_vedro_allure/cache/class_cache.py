@@ -0,0 +1,40 @@
+import hashlib
+import json
+from typing import Optional
+
+from flake8_vedro_allure.class_index.definitions import ModuleClasses
+
+from .lru import SqliteLruCache, get_cache
+
+CLASS_CACHE_FILENAME = 'classes.sqlite'
+CLASS_CACHE_VERSION = '1'
+
+
+class ClassCache(SqliteLruCache):
+    """
+    On-disk cache of module classes and imports keyed by module name and file content.
+
+    Only the class hierarchy index reads it, so unchanged modules of a repo
+    are not parsed again to find bases of scenarios.
+    """
+
+    filename = CLASS_CACHE_FILENAME
+    table = 'module_classes'
+    columns = ('classes',)
+
+    def make_key(self, source: bytes, module: str) -> str:
+        content_hash = hashlib.sha256(source).hexdigest()
+        return f'{CLASS_CACHE_VERSION}:{module}:{content_hash}'
+
+    def get(self, key: str) -> Optional[ModuleClasses]:
+        row = self._get_row(key)
+        if row is None:
+            return None
+        return ModuleClasses.from_dict(json.loads(row[0]))
+
+    def put(self, key: str, module_classes: ModuleClasses) -> None:
+        self._put_row(key, json.dumps(module_classes.to_dict()))
+
+
+def get_class_cache(cache_dir: str) -> ClassCache:
+    return get_cache(ClassCache, cache_dir)
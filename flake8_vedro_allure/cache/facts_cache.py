@@ -0,0 +1,38 @@
+import hashlib
+import json
+from typing import Optional, Sequence
+
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.facts import FileFacts
+
+from .lru import SqliteLruCache, get_cache
+
+FACTS_CACHE_FILENAME = 'facts.sqlite'
+FACTS_CACHE_VERSION = '5'
+
+
+class FactsCache(SqliteLruCache):
+    """On-disk cache of scenario facts keyed by file content and config hash."""
+
+    filename = FACTS_CACHE_FILENAME
+    table = 'file_facts'
+    columns = ('facts',)
+
+    def make_key(self, source: bytes, config: Config, scenario_classes: Sequence[str] = ()) -> str:
+        """Scenario classes found by their bases are a part of the key, they depend on other files."""
+        content_hash = hashlib.sha256(source).hexdigest()
+        key = f'{FACTS_CACHE_VERSION}:{config.fingerprint}:{content_hash}'
+        return f'{key}:{",".join(scenario_classes)}' if scenario_classes else key
+
+    def get(self, key: str) -> Optional[FileFacts]:
+        row = self._get_row(key)
+        if row is None:
+            return None
+        return FileFacts.from_dict(json.loads(row[0]))
+
+    def put(self, key: str, file_facts: FileFacts) -> None:
+        self._put_row(key, json.dumps(file_facts.to_dict()))
+
+
+def get_facts_cache(cache_dir: str) -> FactsCache:
+    return get_cache(FactsCache, cache_dir)
@@ -0,0 +1,90 @@
+import os
+import sqlite3
+import time
+from typing import Dict, Optional, Tuple, Type, TypeVar, cast
+
+from flake8_vedro_allure.sqlite_connection import ProcessLocalConnection
+
+DEFAULT_MAX_ENTRIES = 100_000
+EVICTION_INTERVAL = 1_000
+
+
+class SqliteLruCache:
+    """
+    On-disk cache of text columns keyed by a string, shared by all processes of a run.
+
+    Subclasses set the file, table and columns and encode their entries. The
+    least recently used entries are evicted once the cache holds more than
+    max_entries keys. Workers write with their own connections to a WAL
+    database, a failed read is a miss and a failed write is skipped.
+    """
+
+    filename: str
+    table: str
+    columns: Tuple[str, ...]
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, self.filename)
+        self.max_entries = max_entries
+        self._connection = ProcessLocalConnection(self.path, self._schema())
+        self._writes = 0
+        # Schema is created before flake8 starts workers, so they never race on it
+        self._connection.get()
+
+    def _schema(self) -> str:
+        columns = ''.join(f'    {column} TEXT NOT NULL,\n' for column in self.columns)
+        return (
+            f'CREATE TABLE IF NOT EXISTS {self.table} (\n'
+            f'    key TEXT PRIMARY KEY,\n{columns}    used_at REAL NOT NULL\n);\n'
+            f'CREATE INDEX IF NOT EXISTS {self.table}_used_at ON {self.table} (used_at);\n'
+        )
+
+    def _get_row(self, key: str) -> Optional[Tuple[str, ...]]:
+        try:
+            connection = self._connection.get()
+            row = connection.execute(
+                f'SELECT {", ".join(self.columns)} FROM {self.table} WHERE key = ?', (key,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(f'UPDATE {self.table} SET used_at = ? WHERE key = ?', (time.time(), key))
+        except sqlite3.Error:
+            return None
+        return row
+
+    def _put_row(self, key: str, *values: str) -> None:
+        placeholders = ', '.join('?' * (len(self.columns) + 2))
+        try:
+            self._connection.get().execute(
+                f'INSERT OR REPLACE INTO {self.table} (key, {", ".join(self.columns)}, used_at) '
+                f'VALUES ({placeholders})',
+                (key, *values, time.time())
+            )
+            if self._writes % EVICTION_INTERVAL == 0:
+                self.evict()
+        except sqlite3.Error:
+            return
+        self._writes += 1
+
+    def evict(self) -> None:
+        self._connection.get().execute(
+            f'DELETE FROM {self.table} WHERE key IN ('
+            f'SELECT key FROM {self.table} ORDER BY used_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,)
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+CacheT = TypeVar('CacheT', bound=SqliteLruCache)
+
+_caches: Dict[Tuple[type, str], SqliteLruCache] = {}
+
+
+def get_cache(cache_cls: Type[CacheT], cache_dir: str) -> CacheT:
+    """Cache of the class in the directory, opened once per process."""
+    key = (cache_cls, cache_dir)
+    if key not in _caches:
+        _caches[key] = cache_cls(cache_dir)
+    return cast(CacheT, _caches[key])
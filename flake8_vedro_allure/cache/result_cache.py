@@ -0,0 +1,60 @@
+import hashlib
+import json
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.facts import FileFacts
+
+from .lru import DEFAULT_MAX_ENTRIES, SqliteLruCache, get_cache
+
+RESULT_CACHE_FILENAME = 'results.sqlite'
+RESULT_CACHE_VERSION = '2'
+
+# lineno, col_offset, 'CODE message' as flake8 reports it
+CachedError = Tuple[int, int, str]
+
+
+class CachedResult(NamedTuple):
+    errors: List[CachedError]
+    file_facts: FileFacts
+
+
+class ResultCache(SqliteLruCache):
+    """
+    On-disk cache of reported errors keyed by file content, config fingerprint and plugin version.
+
+    Errors which depend on other files (ALR005) are not stored, facts are
+    stored with errors, so they are checked again against the current
+    allure id index.
+    """
+
+    filename = RESULT_CACHE_FILENAME
+    table = 'file_results'
+    columns = ('errors', 'facts')
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(cache_dir, max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, source: bytes, config: Config, plugin_version: str,
+                 scenario_classes: Sequence[str] = ()) -> str:
+        content_hash = hashlib.sha256(source).hexdigest()
+        key = f'{RESULT_CACHE_VERSION}:{plugin_version}:{config.fingerprint}:{content_hash}'
+        return f'{key}:{",".join(scenario_classes)}' if scenario_classes else key
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        row = self._get_row(key)
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        errors = [tuple(error) for error in json.loads(row[0])]
+        return CachedResult(errors, FileFacts.from_dict(json.loads(row[1])))
+
+    def put(self, key: str, errors: List[CachedError], file_facts: FileFacts) -> None:
+        self._put_row(key, json.dumps(errors), json.dumps(file_facts.to_dict()))
+
+
+def get_result_cache(cache_dir: str) -> ResultCache:
+    return get_cache(ResultCache, cache_dir)
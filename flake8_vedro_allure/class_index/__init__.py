@@ -0,0 +1,2 @@
+from .definitions import ModuleClasses, extract_module_classes, get_module_name
+from .index import SCENARIO_BASE, ClassHierarchyIndex, get_class_index, get_scenario_classes
@@ -0,0 +1,85 @@
+import ast
+import os
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class ModuleClasses(NamedTuple):
+    """
+    Module level classes of a module with qualified names of their bases.
+
+    `aliases` maps names imported into the module to what they refer to,
+    e.g. `helpers.BaseScenario` to `helpers.base.BaseScenario`, so bases
+    re-exported by packages are resolved.
+    """
+
+    module: str
+    classes: Dict[str, Tuple[str, ...]]
+    aliases: Dict[str, str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'module': self.module, 'classes': self.classes, 'aliases': self.aliases}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModuleClasses':
+        return cls(data['module'], {name: tuple(bases) for name, bases in data['classes'].items()},
+                   data['aliases'])
+
+
+def get_module_name(path: str, root: str) -> str:
+    """Dotted module name of the file relative to root, as it is imported when root is in sys.path."""
+    relative = os.path.relpath(os.path.abspath(path), root)
+    parts = os.path.splitext(relative)[0].split(os.sep)
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+
+def _resolve_relative(module: str, is_package: bool, level: int, name: Optional[str]) -> str:
+    package = module.split('.') if is_package else module.split('.')[:-1]
+    if level > 1:
+        package = package[:-(level - 1)]
+    return '.'.join(package + ([name] if name else []))
+
+
+def _dotted_name(node: ast.expr) -> Optional[List[str]]:
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return parts[::-1]
+
+
+def extract_module_classes(tree: ast.Module, module: str, is_package: bool = False) -> ModuleClasses:
+    """Classes and imports of the module body, bases which are not names or attributes are skipped."""
+    names: Dict[str, str] = {}
+    classes: Dict[str, Tuple[str, ...]] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    names[alias.name.split('.')[0]] = alias.name.split('.')[0]
+        elif isinstance(node, ast.ImportFrom):
+            source = node.module or ''
+            if node.level:
+                source = _resolve_relative(module, is_package, node.level, node.module)
+            for alias in node.names:
+                if alias.name != '*':
+                    names[alias.asname or alias.name] = f'{source}.{alias.name}'
+        elif isinstance(node, ast.ClassDef):
+            bases = []
+            for base in node.bases:
+                parts = _dotted_name(base)
+                if parts is not None:
+                    head = names.get(parts[0], f'{module}.{parts[0]}')
+                    bases.append('.'.join([head] + parts[1:]))
+            names[node.name] = f'{module}.{node.name}'
+            classes[node.name] = tuple(bases)
+
+    aliases = {f'{module}.{name}': target for name, target in names.items()
+               if name not in classes and target != f'{module}.{name}'}
+    return ModuleClasses(module, classes, aliases)
@@ -0,0 +1,233 @@
+import ast
+import os
+from collections import ChainMap
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple
+)
+
+from flake8_vedro_allure.config import Config
+
+from .definitions import ModuleClasses, extract_module_classes, get_module_name
+
+if TYPE_CHECKING:
+    from flake8_vedro_allure.cache import ClassCache
+
+SCENARIO_BASE = 'vedro.Scenario'
+# longest chain of re-exports followed to find a class
+MAX_ALIAS_DEPTH = 16
+
+
+class ClassHierarchyIndex:
+    """
+    Module level classes of a repo with their bases, resolved across files.
+
+    Scenarios are classes inheriting `vedro.Scenario` directly or through
+    base classes of the repo, which are not bases of other classes
+    themselves. They are found once for all modules when the index is
+    first queried, so every lookup is a set lookup. Classes of files
+    outside the index are resolved against it without being added.
+    """
+
+    def __init__(self, root: str, base: str = SCENARIO_BASE):
+        self.root = root
+        self.base = base
+        self._modules: Dict[str, ModuleClasses] = {}
+        self._scenarios: Optional[FrozenSet[str]] = None
+        self._bases_of: Dict[str, Tuple[str, ...]] = {}
+        self._is_subclass: Dict[str, bool] = {}
+        self._used_as_base: Set[str] = set()
+        # ((module, source), scenarios) of the last file outside the index, it is queried several times in a row
+        self._last_file: Optional[Tuple[Tuple[str, bytes], Tuple[str, ...]]] = None
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def add_module(self, module_classes: ModuleClasses) -> None:
+        self._modules[module_classes.module] = module_classes
+        self._scenarios = None
+        self._last_file = None
+
+    def remove_module(self, module: str) -> None:
+        if self._modules.pop(module, None) is not None:
+            self._scenarios = None
+            self._last_file = None
+
+    def add_file(self, path: str, source: bytes, cache: Optional['ClassCache'] = None) -> None:
+        module = get_module_name(path, self.root)
+        key = None
+        if cache is not None:
+            key = cache.make_key(source, module)
+            module_classes = cache.get(key)
+            if module_classes is not None:
+                self.add_module(module_classes)
+                return
+        try:
+            tree = ast.parse(source, path)
+        except (SyntaxError, ValueError):
+            self.remove_module(module)
+            return
+        module_classes = extract_module_classes(tree, module, os.path.basename(path) == '__init__.py')
+        if cache is not None:
+            cache.put(key, module_classes)
+        self.add_module(module_classes)
+
+    def add_files(self, paths: Iterable[str], cache: Optional['ClassCache'] = None) -> None:
+        for path in paths:
+            try:
+                with open(path, 'rb') as f:
+                    source = f.read()
+            except OSError:
+                continue
+            # files without classes and imports can't define or re-export a base
+            if b'class' in source or b'import' in source:
+                self.add_file(path, source, cache)
+
+    def _find_class(self, name: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        for _ in range(MAX_ALIAS_DEPTH):
+            module, _, class_name = name.rpartition('.')
+            module_classes = self._modules.get(module)
+            if module_classes is None:
+                return None
+            bases = module_classes.classes.get(class_name)
+            if bases is not None:
+                return name, bases
+            name = module_classes.aliases.get(name)
+            if name is None:
+                return None
+        return None
+
+    def _resolve_bases(self, module_classes: ModuleClasses) -> Dict[str, Tuple[str, ...]]:
+        return {
+            f'{module_classes.module}.{class_name}': tuple(
+                found[0] if found is not None else base
+                for base, found in ((base, self._find_class(base)) for base in bases)
+            )
+            for class_name, bases in module_classes.classes.items()
+        }
+
+    def _inherits_base(self, name: str, bases_of: MutableMapping[str, Tuple[str, ...]],
+                       is_subclass: MutableMapping[str, bool], visiting: Set[str]) -> bool:
+        if name not in is_subclass:
+            if name in visiting or name not in bases_of:
+                return False
+            visiting.add(name)
+            is_subclass[name] = any(self._inherits_base(base, bases_of, is_subclass, visiting)
+                                    for base in bases_of[name])
+        return is_subclass[name]
+
+    def _find_scenarios(self) -> FrozenSet[str]:
+        self._is_subclass = {self.base: True}
+        self._bases_of = {}
+        for module_classes in self._modules.values():
+            self._bases_of.update(self._resolve_bases(module_classes))
+        self._used_as_base = {base for bases in self._bases_of.values() for base in bases}
+        return frozenset(
+            name for name in self._bases_of
+            if name not in self._used_as_base and self._inherits_base(name, self._bases_of, self._is_subclass, set())
+        )
+
+    @property
+    def scenarios(self) -> FrozenSet[str]:
+        if self._scenarios is None:
+            self._scenarios = self._find_scenarios()
+        return self._scenarios
+
+    def is_scenario(self, module: str, class_name: str) -> bool:
+        return f'{module}.{class_name}' in self.scenarios
+
+    def get_module_scenarios(self, module: str) -> Tuple[str, ...]:
+        module_classes = self._modules.get(module)
+        if module_classes is None:
+            return ()
+        return tuple(sorted(name for name in module_classes.classes if self.is_scenario(module, name)))
+
+    def has_module(self, module: str) -> bool:
+        return module in self._modules
+
+    def get_outside_scenarios(self, module_classes: ModuleClasses) -> Tuple[str, ...]:
+        """Scenarios of a module which is not in the index, its bases are resolved through indexed modules."""
+        if self._scenarios is None:
+            # bases of indexed classes are resolved along with their scenarios
+            self._scenarios = self._find_scenarios()
+        module = module_classes.module
+        local_bases = self._resolve_bases(module_classes)
+        # lookups of the module are kept out of the index, it may be changed or checked again
+        bases_of = ChainMap(local_bases, self._bases_of)
+        is_subclass = ChainMap({}, self._is_subclass)
+        used_as_base = {base for bases in local_bases.values() for base in bases}
+        return tuple(sorted(
+            name for name in module_classes.classes
+            if f'{module}.{name}' not in used_as_base and f'{module}.{name}' not in self._used_as_base
+            and self._inherits_base(f'{module}.{name}', bases_of, is_subclass, set())
+        ))
+
+    def get_file_scenarios(self, path: str, source: Optional[bytes] = None,
+                           tree: Optional[ast.Module] = None) -> Tuple[str, ...]:
+        """Scenarios of the file, files outside the index are read from `tree`, `source` or the disk."""
+        module = get_module_name(path, self.root)
+        if module in self._modules:
+            # indexed modules hold base classes, subclasses of their scenarios may be outside the index
+            return ()
+        is_package = os.path.basename(path) == '__init__.py'
+        if tree is not None:
+            return self.get_outside_scenarios(extract_module_classes(tree, module, is_package))
+
+        if source is None:
+            try:
+                with open(path, 'rb') as f:
+                    source = f.read()
+            except OSError:
+                return ()
+        if self._last_file is not None and self._last_file[0] == (module, source):
+            return self._last_file[1]
+        scenarios: Tuple[str, ...] = ()
+        if b'class' in source:
+            try:
+                tree = ast.parse(source, path)
+            except (SyntaxError, ValueError):
+                tree = None
+            if tree is not None:
+                scenarios = self.get_outside_scenarios(extract_module_classes(tree, module, is_package))
+        self._last_file = ((module, source), scenarios)
+        return scenarios
+
+
+_class_indexes: Dict[Tuple[str, Tuple[str, ...], Optional[str]], ClassHierarchyIndex] = {}
+
+
+def get_class_index(config: Config) -> ClassHierarchyIndex:
+    """Index of classes under `scenario_base_paths` of the config, built once per process."""
+    from flake8_vedro_allure.runner.walker import iter_python_files
+
+    root = os.getcwd()
+    key = (root, config.scenario_base_paths, config.cache_dir)
+    if key not in _class_indexes:
+        cache = None
+        if config.cache_dir is not None:
+            from flake8_vedro_allure.cache import get_class_cache
+            cache = get_class_cache(config.cache_dir)
+        index = ClassHierarchyIndex(root)
+        index.add_files(iter_python_files(config.scenario_base_paths), cache)
+        _class_indexes[key] = index
+    return _class_indexes[key]
+
+
+def get_scenario_classes(config: Config, filename: Optional[str], source: Optional[bytes] = None,
+                         tree: Optional[ast.Module] = None) -> Sequence[str]:
+    """
+    Names of classes of the file found as scenarios by their bases, empty if the index is disabled.
+
+    Classes under `scenario_base_paths` are bases and never scenarios, files
+    outside these paths are resolved against the index.
+    """
+    if not config.scenario_base_paths or not filename:
+        return ()
+    return get_class_index(config).get_file_scenarios(filename, source, tree)
@@ -0,0 +1,26 @@
+import argparse
+from typing import FrozenSet, Iterable, Optional, Sequence
+
+from flake8.style_guide import Decision, DecisionEngine
+
+
+def get_enabled_codes(codes: Iterable[str], options: argparse.Namespace) -> FrozenSet[str]:
+    """Codes which flake8 reports with select, ignore, extend-select and extend-ignore options."""
+    decider = DecisionEngine(options)
+    return frozenset(code for code in codes if decider.decision_for(code) is Decision.Selected)
+
+
+def make_selection_options(
+        select: Optional[Sequence[str]] = None,
+        ignore: Optional[Sequence[str]] = None,
+        extend_select: Optional[Sequence[str]] = None,
+        extend_ignore: Optional[Sequence[str]] = None
+) -> argparse.Namespace:
+    return argparse.Namespace(
+        select=select,
+        ignore=ignore,
+        extend_select=extend_select,
+        extend_ignore=extend_ignore,
+        extended_default_select=['ALR'],
+        extended_default_ignore=[],
+    )
@@ -1,32 +1,149 @@
-from typing import List, Optional
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+# `tokens` reads facts in the standalone runner without ast, see TokenFactsExtractor
+FACTS_EXTRACTORS = ('ast', 'tokens')
+
+
+def str_to_bool(string):
+    return string.lower() in ('true', 'yes', 't', '1')
+
+
+def _to_bool(value: Union[bool, str]) -> bool:
+    return str_to_bool(value) if isinstance(value, str) else bool(value)
+
+
+def _to_labels(labels: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    # order of labels is kept for error messages, repeated ones are dropped
+    return tuple(dict.fromkeys(labels)) if labels else ()
 
 
 class Config:
+    """
+    Immutable settings of ALR rules, compiled once from options.
+
+    Labels are kept as ordered tuples for messages and frozensets for
+    lookups. Configs are hashable and picklable, `fingerprint` covers every
+    setting which changes reported errors and is stable across processes
+    and runs, so caches and shared indexes can be keyed on it.
+    """
+
+    FIELDS = ('is_allure_labels_optional', 'required_allure_labels', 'unique_allure_labels',
+              'is_allure_id_required', 'allure_id_index_path', 'cache_dir', 'is_scenarios_folder_only',
+              'metrics_dir', 'enabled_codes', 'id_manifest_dir', 'facts_extractor', 'scenario_base_paths')
+
+    __slots__ = FIELDS + ('required_label_set', 'unique_label_set', 'fingerprint')
+
     def __init__(
             self,
-            is_allure_labels_optional: bool,
-            required_allure_labels: Optional[List],
-            unique_allure_labels: Optional[List],
-            is_allure_id_required: bool = False
+            is_allure_labels_optional: Union[bool, str],
+            required_allure_labels: Optional[Iterable[str]],
+            unique_allure_labels: Optional[Iterable[str]],
+            is_allure_id_required: Union[bool, str] = False,
+            allure_id_index_path: Optional[str] = None,
+            cache_dir: Optional[str] = None,
+            is_scenarios_folder_only: Union[bool, str] = False,
+            metrics_dir: Optional[str] = None,
+            enabled_codes: Optional[Iterable[str]] = None,
+            id_manifest_dir: Optional[str] = None,
+            facts_extractor: str = 'ast',
+            scenario_base_paths: Optional[Iterable[str]] = None
     ):
-        self.is_allure_labels_optional = is_allure_labels_optional
-        self.required_allure_labels = required_allure_labels if required_allure_labels else []
-        self.unique_allure_labels = unique_allure_labels if unique_allure_labels else []
-        self.is_allure_id_required = is_allure_id_required
+        if facts_extractor not in FACTS_EXTRACTORS:
+            raise ValueError(f'Unknown facts extractor {facts_extractor!r}, expected one of {FACTS_EXTRACTORS}')
+        init = object.__setattr__
+        init(self, 'is_allure_labels_optional', _to_bool(is_allure_labels_optional))
+        init(self, 'required_allure_labels', _to_labels(required_allure_labels))
+        init(self, 'unique_allure_labels', _to_labels(unique_allure_labels))
+        init(self, 'is_allure_id_required', _to_bool(is_allure_id_required))
+        init(self, 'allure_id_index_path', allure_id_index_path)
+        init(self, 'cache_dir', cache_dir)
+        init(self, 'is_scenarios_folder_only', _to_bool(is_scenarios_folder_only))
+        init(self, 'metrics_dir', metrics_dir)
+        # None means that all error codes are enabled
+        init(self, 'enabled_codes', frozenset(enabled_codes) if enabled_codes is not None else None)
+        init(self, 'id_manifest_dir', id_manifest_dir)
+        init(self, 'facts_extractor', facts_extractor)
+        # classes inheriting vedro.Scenario through bases defined under these paths are scenarios too
+        init(self, 'scenario_base_paths', tuple(scenario_base_paths) if scenario_base_paths else ())
+        init(self, 'required_label_set', frozenset(self.required_allure_labels))
+        init(self, 'unique_label_set', frozenset(self.unique_allure_labels))
+        init(self, 'fingerprint', self._make_fingerprint())
+
+    def _make_fingerprint(self) -> str:
+        # paths of caches, indexes and reports don't change errors, so they are not a part of it
+        rules = {
+            'is_allure_labels_optional': self.is_allure_labels_optional,
+            'required_allure_labels': sorted(self.required_label_set),
+            'unique_allure_labels': sorted(self.unique_label_set),
+            'is_allure_id_required': self.is_allure_id_required,
+            'is_scenarios_folder_only': self.is_scenarios_folder_only,
+            'enabled_codes': sorted(self.enabled_codes) if self.enabled_codes is not None else None,
+            'scenario_base_paths': sorted(self.scenario_base_paths),
+        }
+        return hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).hexdigest()
+
+    def is_code_enabled(self, code: str) -> bool:
+        return self.enabled_codes is None or code in self.enabled_codes
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def replace(self, **changes: Any) -> 'Config':
+        return Config(**{**self.to_kwargs(), **changes})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable, use replace()')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Config):
+            return NotImplemented
+        return self.to_kwargs() == other.to_kwargs()
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, field) for field in self.FIELDS))
+
+    def __reduce__(self):
+        return Config, tuple(getattr(self, field) for field in self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({", ".join(f"{k}={v!r}" for k, v in self.to_kwargs().items())})'
 
 
 class DefaultConfig(Config):
+    __slots__ = ()
+
     def __init__(
             self,
-            is_allure_labels_optional: bool = True,
-            required_allure_labels: Optional[List] = None,
-            unique_allure_labels: Optional[List] = None,
-            is_allure_id_required: bool = False
+            is_allure_labels_optional: Union[bool, str] = True,
+            required_allure_labels: Optional[Iterable[str]] = None,
+            unique_allure_labels: Optional[Iterable[str]] = None,
+            is_allure_id_required: Union[bool, str] = False,
+            allure_id_index_path: Optional[str] = None,
+            cache_dir: Optional[str] = None,
+            is_scenarios_folder_only: Union[bool, str] = False,
+            metrics_dir: Optional[str] = None,
+            enabled_codes: Optional[Iterable[str]] = None,
+            id_manifest_dir: Optional[str] = None,
+            facts_extractor: str = 'ast',
+            scenario_base_paths: Optional[Iterable[str]] = None
     ):
 
         super().__init__(
             is_allure_labels_optional=is_allure_labels_optional,
             required_allure_labels=required_allure_labels,
             unique_allure_labels=unique_allure_labels,
-            is_allure_id_required=is_allure_id_required
+            is_allure_id_required=is_allure_id_required,
+            allure_id_index_path=allure_id_index_path,
+            cache_dir=cache_dir,
+            is_scenarios_folder_only=is_scenarios_folder_only,
+            metrics_dir=metrics_dir,
+            enabled_codes=enabled_codes,
+            id_manifest_dir=id_manifest_dir,
+            facts_extractor=facts_extractor,
+            scenario_base_paths=scenario_base_paths
         )
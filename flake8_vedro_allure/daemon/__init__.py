@@ -0,0 +1 @@
+from .protocol import DEFAULT_SOCKET, SOCKET_ENV, get_socket_path
@@ -0,0 +1,51 @@
+import argparse
+import json
+import socket
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+# the client is started for every file, so it imports nothing but stdlib
+from .protocol import ENCODING, get_socket_path
+
+
+def send_requests(socket_path: str, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(b''.join(json.dumps(request).encode(ENCODING) + b'\n' for request in requests))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as f:
+            return [json.loads(line) for line in f]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='vedro-allure-client',
+                                     description='Lint files with a running vedro-allure-daemon')
+    parser.add_argument('paths', nargs='*')
+    parser.add_argument('--socket', default=get_socket_path())
+    parser.add_argument('--stdin-filename', help='Lint source from stdin as this file')
+    parser.add_argument('--stop', action='store_true', help='Stop the daemon')
+    options = parser.parse_args(argv)
+
+    if options.stop:
+        requests = [{'command': 'shutdown'}]
+    elif options.stdin_filename is not None:
+        requests = [{'path': options.stdin_filename, 'source': sys.stdin.read()}]
+    else:
+        requests = [{'path': path} for path in options.paths]
+
+    try:
+        responses = send_requests(options.socket, requests)
+    except OSError as e:
+        sys.stderr.write(f'vedro-allure-daemon is not available on {options.socket}: {e}\n')
+        return 2
+
+    has_errors = False
+    for response in responses:
+        if 'error' in response:
+            sys.stderr.write(response['error'] + '\n')
+            return 2
+        for error in response.get('errors', []):
+            has_errors = True
+            sys.stdout.write(f"{error['filename']}:{error['lineno']}:{error['col_offset'] + 1}: "
+                             f"{error['code']} {error['message']}\n")
+    return 1 if has_errors else 0
@@ -0,0 +1,9 @@
+import os
+
+SOCKET_ENV = 'VEDRO_ALLURE_SOCKET'
+DEFAULT_SOCKET = '.vedro_allure.sock'
+ENCODING = 'utf-8'
+
+
+def get_socket_path() -> str:
+    return os.environ.get(SOCKET_ENV, DEFAULT_SOCKET)
@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+from flake8_vedro_allure.runner.cli import (
+    config_from_options,
+    create_parser,
+    parse_args,
+    split_list
+)
+
+from .protocol import ENCODING, get_socket_path
+from .state import WorkspaceState
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class DaemonRunningError(Exception):
+    """Another daemon answers on the socket, it is not replaced."""
+
+
+def is_socket_alive(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+class LintRequestHandler(socketserver.StreamRequestHandler):
+    server: 'LintServer'
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self.server.handle_request(json.loads(line))
+            except Exception as e:
+                response = {'error': f'{type(e).__name__}: {e}'}
+            self.wfile.write(json.dumps(response).encode(ENCODING) + b'\n')
+            self.wfile.flush()
+
+
+class LintServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Unix socket server which answers lint requests from the warm workspace state.
+
+    Every line of a connection is a JSON request, every answer is a JSON line:
+    {"path": ..., "source": optional unsaved source} -> {"errors": [...]},
+    {"command": "stats"} and {"command": "shutdown"}.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, state: WorkspaceState, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        if os.path.exists(socket_path):
+            # a socket left by a daemon which was killed is stale, nobody listens on it
+            if is_socket_alive(socket_path):
+                raise DaemonRunningError(f'vedro-allure-daemon is already listening on {socket_path}')
+            os.unlink(socket_path)
+        super().__init__(socket_path, LintRequestHandler)
+        self.socket_path = socket_path
+        self.state = state
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        command = request.get('command', 'lint')
+        if command == 'lint':
+            source = request.get('source')
+            with self._lock:
+                errors = self.state.lint(request['path'], source.encode(ENCODING) if source is not None else None)
+            return {'errors': [error._asdict() for error in errors]}
+        if command == 'stats':
+            with self._lock:
+                return {'files': len(self.state.files), 'allure_ids': len(self.state.allure_ids)}
+        if command == 'shutdown':
+            threading.Thread(target=self.shutdown).start()
+            return {'ok': True}
+        raise ValueError(f'unknown command {command}')
+
+    def poll(self) -> None:
+        while not self._stopped.wait(self.poll_interval):
+            with self._lock:
+                self.state.refresh()
+
+    def serve(self) -> None:
+        with self._lock:
+            self.state.refresh()
+        poller = threading.Thread(target=self.poll, daemon=True)
+        poller.start()
+        try:
+            self.serve_forever()
+        finally:
+            self._stopped.set()
+            self.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def create_daemon_parser() -> argparse.ArgumentParser:
+    parser = create_parser()
+    parser.prog = 'vedro-allure-daemon'
+    parser.description = 'Keep facts of scenarios in memory and answer lint requests over a unix socket'
+    parser.add_argument('--socket', default=get_socket_path())
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help='Seconds between checks of file modification times')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    options = parse_args(argv, create_daemon_parser())
+    state = WorkspaceState(options.paths, config_from_options(options), split_list(options.exclude))
+    try:
+        server = LintServer(options.socket, state, options.poll_interval)
+    except DaemonRunningError as e:
+        sys.stderr.write(f'{e}\n')
+        return 2
+    sys.stderr.write(f'vedro-allure-daemon is listening on {options.socket}\n')
+    server.serve()
+    return 0
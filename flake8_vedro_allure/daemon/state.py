@@ -0,0 +1,120 @@
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.errors import DuplicateAllureIdError
+from flake8_vedro_allure.facts import FileFacts
+from flake8_vedro_allure.runner.batch import (
+    FileReport,
+    LintError,
+    lint_file,
+    lint_source
+)
+from flake8_vedro_allure.runner.walker import iter_python_files
+
+
+class FileEntry(NamedTuple):
+    stamp: Tuple[int, int]
+    report: FileReport
+
+
+class WorkspaceState:
+    """
+    Facts of every file under roots and the table of their allure ids.
+
+    Files are reparsed only when their mtime or size changes, so a lint
+    request costs one file plus lookups in the allure id table.
+    """
+
+    def __init__(self, roots: Sequence[str], config: Config, exclude: Sequence[str]):
+        self.roots = roots
+        self.config = config
+        self.exclude = exclude
+        self.files: Dict[str, FileEntry] = {}
+        # (path, line) of every occurrence of an allure id
+        self.allure_ids: Dict[str, Set[Tuple[str, int]]] = {}
+
+    def refresh(self) -> int:
+        """Poll files under roots, return number of reparsed files."""
+        seen = set()
+        reparsed = 0
+        for filename in iter_python_files(self.roots, self.exclude):
+            path = os.path.abspath(filename)
+            seen.add(path)
+            entry = self.files.get(path)
+            self.refresh_file(path)
+            reparsed += self.files.get(path) is not entry
+        for path in set(self.files) - seen:
+            self._remove(path)
+        return reparsed
+
+    def refresh_file(self, path: str) -> Optional[FileReport]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._remove(path)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self.files.get(path)
+        if entry is not None and entry.stamp == stamp:
+            return entry.report
+
+        report = lint_file(path, self.config)
+        self._remove(path)
+        self.files[path] = FileEntry(stamp, report)
+        for scenario in report.file_facts.scenarios:
+            for allure_id, lineno, *_ in scenario.iter_allure_ids():
+                self.allure_ids.setdefault(allure_id, set()).add((path, lineno))
+        return report
+
+    def _remove(self, path: str) -> None:
+        entry = self.files.pop(path, None)
+        if entry is None:
+            return
+        for scenario in entry.report.file_facts.scenarios:
+            for allure_id, lineno, *_ in scenario.iter_allure_ids():
+                occurrences = self.allure_ids.get(allure_id)
+                if occurrences is not None:
+                    occurrences.discard((path, lineno))
+                    if not occurrences:
+                        del self.allure_ids[allure_id]
+
+    def lint(self, filename: str, source: Optional[bytes] = None) -> List[LintError]:
+        """Lint file from disk or its unsaved source, duplicates are searched in all known files."""
+        path = os.path.abspath(filename)
+        if source is None:
+            report = self.refresh_file(path)
+            if report is None:
+                raise FileNotFoundError(filename)
+        else:
+            report = lint_source(path, source, self.config)
+
+        errors = [error._replace(filename=filename) for error in report.errors]
+        errors.extend(self._find_duplicates(filename, path, report.file_facts))
+        return sorted(errors)
+
+    def _find_duplicates(self, filename: str, path: str, file_facts: FileFacts) -> List[LintError]:
+        if not self.config.is_allure_id_required or not self.config.is_code_enabled(DuplicateAllureIdError.code):
+            return []
+
+        # occurrences of the file are taken from its facts, the table may keep ones of the saved file
+        own_lines: Dict[str, List[int]] = {}
+        for scenario in file_facts.scenarios:
+            for allure_id, lineno, *_ in scenario.iter_allure_ids():
+                own_lines.setdefault(allure_id, []).append(lineno)
+
+        errors = []
+        for scenario in file_facts.scenarios:
+            for occurrence in scenario.iter_allure_ids():
+                allure_id, lineno = occurrence.allure_id, occurrence.lineno
+                # the occurrence with the lowest path and line owns the id, as in a full run
+                owner = min(
+                    [other for other in self.allure_ids.get(allure_id, ()) if other[0] != path]
+                    + [(path, own_lineno) for own_lineno in own_lines[allure_id]]
+                )
+                if owner[0] < path or (occurrence.is_case and owner != (path, lineno)):
+                    error = DuplicateAllureIdError(lineno, occurrence.col_offset, allure_id=allure_id,
+                                                   scenario_path=os.path.relpath(owner[0]))
+                    errors.append(LintError(filename, error.lineno, error.col_offset, error.code, error.message))
+        return errors
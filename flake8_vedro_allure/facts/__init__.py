@@ -0,0 +1,17 @@
+from .ast_extractor import AstFactsExtractor
+from .import_aliases import AllureImportAliases
+from .scenario_facts import (
+    CASE_ALLURE_ID,
+    SCENARIO_ALLURE_ID,
+    AllureIdOccurrence,
+    FileFacts,
+    ScenarioFacts
+)
+
+
+def __getattr__(name):
+    # the token extractor is used only by the standalone runner, flake8 gets ast anyway
+    if name == 'TokenFactsExtractor':
+        from .token_extractor import TokenFactsExtractor
+        return TokenFactsExtractor
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,102 @@
+import ast
+from typing import List, Optional, Union
+
+from flake8_vedro_allure.abstract_checkers import ScenarioHelper
+
+from .import_aliases import AllureImportAliases
+from .params import ALLURE_ID_ARGUMENT, is_params_decorator
+from .scenario_facts import CaseAllureId, ScenarioFacts
+
+
+def _dotted_name(node: ast.expr) -> List[str]:
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return []
+    parts.append(node.id)
+    return parts[::-1]
+
+
+class AstFactsExtractor(ScenarioHelper):
+
+    def extract_scenario_facts(
+        self,
+        scenario_node: ast.ClassDef,
+        import_from_nodes: Optional[List[ast.ImportFrom]] = None,
+        aliases: Optional[AllureImportAliases] = None
+    ) -> ScenarioFacts:
+        if aliases is None:
+            aliases = AllureImportAliases.from_import_from_nodes(import_from_nodes or [])
+        facts = ScenarioFacts(
+            name=scenario_node.name,
+            lineno=scenario_node.lineno,
+            col_offset=scenario_node.col_offset,
+        )
+
+        id_decorator = None
+        imported_id_decorator = None
+        for decorator in scenario_node.decorator_list:
+            if not isinstance(decorator, ast.Call):
+                continue
+            func = decorator.func
+            if isinstance(func, ast.Name):
+                if func.id == 'allure_labels' and facts.labels_position is None:
+                    facts.labels_position = (decorator.lineno, decorator.col_offset)
+                    facts.tag_counts.update(self.get_allure_tag_names(decorator))
+                    facts.labels = self.get_allure_label_values(decorator)
+                elif imported_id_decorator is None and aliases.is_imported_id(func):
+                    imported_id_decorator = decorator
+            elif id_decorator is None and aliases.is_module_id(func):
+                id_decorator = decorator
+
+        if id_decorator is None:
+            id_decorator = imported_id_decorator
+
+        if id_decorator is not None:
+            facts.allure_id_position = (id_decorator.lineno, id_decorator.col_offset)
+            facts.allure_id = self.get_allure_id_value(id_decorator)
+
+        for node in scenario_node.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                for stmt in node.body:
+                    if self.is_allure_id_call(stmt, aliases):
+                        facts.allure_id_calls.append((stmt.lineno, stmt.col_offset))
+                if node.name == '__init__' and node.decorator_list:
+                    facts.params_allure_ids.extend(self.extract_params_allure_ids(node))
+
+        return facts
+
+    def extract_params_allure_ids(
+        self,
+        init_node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> List[CaseAllureId]:
+        """Allure ids of @params cases, passed as `allure_id=` or positionally as the `allure_id` argument."""
+        arguments = [argument.arg for argument in init_node.args.posonlyargs + init_node.args.args][1:]
+        index = arguments.index(ALLURE_ID_ARGUMENT) if ALLURE_ID_ARGUMENT in arguments else None
+        allure_ids = []
+        for decorator in init_node.decorator_list:
+            if not isinstance(decorator, ast.Call) or not is_params_decorator(_dotted_name(decorator.func)):
+                continue
+            value = next((keyword.value for keyword in decorator.keywords if keyword.arg == ALLURE_ID_ARGUMENT),
+                         None)
+            if (value is None and index is not None and index < len(decorator.args)
+                    and not any(isinstance(arg, ast.Starred) for arg in decorator.args[:index + 1])):
+                value = decorator.args[index]
+            if isinstance(value, ast.Constant) and value.value is not None:
+                allure_ids.append((str(value.value), decorator.lineno, decorator.col_offset))
+        return allure_ids
+
+    def is_allure_id_call(self, node: ast.stmt, aliases: AllureImportAliases) -> bool:
+        if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+            return False
+        func = node.value.func
+        return aliases.is_module_id(func) or aliases.is_dynamic_id(func)
+
+    def extract_allure_imports(self, import_from_nodes: List[ast.ImportFrom]) -> List[tuple]:
+        return [
+            (alias.name, alias.asname or alias.name)
+            for import_from in import_from_nodes if import_from.module == 'allure'
+            for alias in import_from.names
+        ]
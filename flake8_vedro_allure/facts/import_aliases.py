@@ -0,0 +1,70 @@
+import ast
+from typing import List, Optional, Set
+
+ALLURE_MODULE = 'allure'
+
+
+class AllureImportAliases:
+    """
+    Local names bound to allure, allure.id and allure.dynamic in one module.
+
+    The table is filled from imports once per file, so decorators and calls
+    are matched with set lookups. `allure` itself is always known, scenarios
+    are often checked without their imports.
+    """
+
+    __slots__ = ('modules', 'id_names', 'dynamic_names')
+
+    def __init__(self):
+        self.modules: Set[str] = {ALLURE_MODULE}
+        self.id_names: Set[str] = set()
+        self.dynamic_names: Set[str] = set()
+
+    @classmethod
+    def from_import_from_nodes(cls, import_from_nodes: List[ast.ImportFrom]) -> 'AllureImportAliases':
+        aliases = cls()
+        for node in import_from_nodes:
+            aliases.add_import_from(node)
+        return aliases
+
+    def add_import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.add_module(alias.name, alias.asname)
+
+    def add_import_from(self, node: ast.ImportFrom) -> None:
+        if node.module != ALLURE_MODULE:
+            return
+        for alias in node.names:
+            self.add_allure_name(alias.name, alias.asname)
+
+    def add_module(self, name: str, asname: Optional[str] = None) -> None:
+        """`import name as asname`."""
+        if name == ALLURE_MODULE:
+            self.modules.add(asname or name)
+
+    def add_allure_name(self, name: str, asname: Optional[str] = None) -> None:
+        """`from allure import name as asname`."""
+        if name == 'id':
+            self.id_names.add(asname or name)
+        elif name == 'dynamic':
+            self.dynamic_names.add(asname or name)
+
+    def is_module(self, node: ast.expr) -> bool:
+        return isinstance(node, ast.Name) and node.id in self.modules
+
+    def is_imported_id(self, func: ast.expr) -> bool:
+        """`id(...)` imported from allure, possibly renamed."""
+        return isinstance(func, ast.Name) and func.id in self.id_names
+
+    def is_module_id(self, func: ast.expr) -> bool:
+        """`allure.id(...)` with allure module possibly renamed."""
+        return isinstance(func, ast.Attribute) and func.attr == 'id' and self.is_module(func.value)
+
+    def is_dynamic_id(self, func: ast.expr) -> bool:
+        """`allure.dynamic.id(...)` or `dynamic.id(...)` with dynamic imported from allure."""
+        if not isinstance(func, ast.Attribute) or func.attr != 'id':
+            return False
+        value = func.value
+        if isinstance(value, ast.Name):
+            return value.id in self.dynamic_names
+        return isinstance(value, ast.Attribute) and value.attr == 'dynamic' and self.is_module(value.value)
@@ -0,0 +1,12 @@
+from typing import Sequence
+
+# argument of __init__ and keyword of @params holding the allure id of a case
+ALLURE_ID_ARGUMENT = 'allure_id'
+PARAMS_MODIFIERS = ('skip', 'only')
+
+
+def is_params_decorator(parts: Sequence[str]) -> bool:
+    """`params`, `vedro.params` and their `.skip` / `.only` forms by dotted name of the called decorator."""
+    if parts and parts[-1] in PARAMS_MODIFIERS:
+        parts = parts[:-1]
+    return bool(parts) and parts[-1] == 'params'
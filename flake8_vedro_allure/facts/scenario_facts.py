@@ -0,0 +1,134 @@
+from collections import Counter
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+Position = Tuple[int, int]
+# (allure_id, lineno, col_offset) of a params case
+CaseAllureId = Tuple[str, int, int]
+
+SCENARIO_ALLURE_ID = 'scenario'
+CASE_ALLURE_ID = 'case'
+
+
+class AllureIdOccurrence(NamedTuple):
+    allure_id: str
+    lineno: int
+    col_offset: int
+    # SCENARIO_ALLURE_ID for the id of the class, CASE_ALLURE_ID for ids of params cases
+    kind: str
+
+    @property
+    def is_case(self) -> bool:
+        return self.kind == CASE_ALLURE_ID
+
+
+class ScenarioFacts:
+    """
+    Everything scenario checkers need to know about one Scenario class.
+
+    Facts are plain data, so they can be cached between runs and checked
+    without the AST they were extracted from.
+    """
+
+    __slots__ = ('name', 'lineno', 'col_offset', 'labels_position', 'tag_counts', 'labels',
+                 'allure_id_position', 'allure_id', 'allure_id_calls', 'params_allure_ids')
+
+    def __init__(
+            self,
+            name: str,
+            lineno: int,
+            col_offset: int,
+            labels_position: Optional[Position] = None,
+            tag_names: Optional[List[str]] = None,
+            labels: Optional[List[str]] = None,
+            allure_id_position: Optional[Position] = None,
+            allure_id: Optional[str] = None,
+            allure_id_calls: Optional[List[Position]] = None,
+            params_allure_ids: Optional[List[CaseAllureId]] = None
+    ):
+        self.name = name
+        self.lineno = lineno
+        self.col_offset = col_offset
+        self.labels_position = labels_position
+        self.tag_counts = Counter(tag_names) if tag_names else Counter()
+        # arguments of allure_labels() as written, e.g. Feature.Login
+        self.labels = labels if labels else []
+        self.allure_id_position = allure_id_position
+        self.allure_id = allure_id
+        # positions of allure.id() and allure.dynamic.id() calls in scenario methods
+        self.allure_id_calls = allure_id_calls if allure_id_calls else []
+        # allure ids of cases from @params(..., allure_id=...) decorators of __init__ at their lines
+        self.params_allure_ids = params_allure_ids if params_allure_ids else []
+
+    @property
+    def has_allure_labels(self) -> bool:
+        return self.labels_position is not None
+
+    @property
+    def has_allure_id(self) -> bool:
+        return self.allure_id_position is not None or len(self.allure_id_calls) > 0
+
+    @property
+    def tag_names(self) -> List[str]:
+        return list(self.tag_counts.elements())
+
+    def iter_allure_ids(self) -> Iterator[AllureIdOccurrence]:
+        """Allure ids checked for duplicates: the id of the class at its line, then ids of params cases."""
+        if self.allure_id:
+            yield AllureIdOccurrence(self.allure_id, self.lineno, self.col_offset, SCENARIO_ALLURE_ID)
+        for allure_id, lineno, col_offset in self.params_allure_ids:
+            yield AllureIdOccurrence(allure_id, lineno, col_offset, CASE_ALLURE_ID)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'lineno': self.lineno,
+            'col_offset': self.col_offset,
+            'labels_position': self.labels_position,
+            'tag_names': self.tag_names,
+            'labels': self.labels,
+            'allure_id_position': self.allure_id_position,
+            'allure_id': self.allure_id,
+            'allure_id_calls': self.allure_id_calls,
+            'params_allure_ids': self.params_allure_ids,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScenarioFacts':
+        labels_position = data['labels_position']
+        allure_id_position = data['allure_id_position']
+        return cls(
+            name=data['name'],
+            lineno=data['lineno'],
+            col_offset=data['col_offset'],
+            labels_position=tuple(labels_position) if labels_position else None,
+            tag_names=data['tag_names'],
+            labels=data['labels'],
+            allure_id_position=tuple(allure_id_position) if allure_id_position else None,
+            allure_id=data['allure_id'],
+            allure_id_calls=[tuple(position) for position in data['allure_id_calls']],
+            params_allure_ids=[tuple(occurrence) for occurrence in data['params_allure_ids']],
+        )
+
+
+class FileFacts:
+
+    __slots__ = ('scenarios', 'allure_imports')
+
+    def __init__(self, scenarios: Optional[List[ScenarioFacts]] = None,
+                 allure_imports: Optional[List[Tuple[str, str]]] = None):
+        self.scenarios = scenarios if scenarios else []
+        # (name, asname) pairs imported with `from allure import ...`
+        self.allure_imports = allure_imports if allure_imports else []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'scenarios': [scenario.to_dict() for scenario in self.scenarios],
+            'allure_imports': self.allure_imports,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FileFacts':
+        return cls(
+            scenarios=[ScenarioFacts.from_dict(scenario) for scenario in data['scenarios']],
+            allure_imports=[tuple(alias) for alias in data['allure_imports']],
+        )
@@ -0,0 +1,631 @@
+import re
+from ast import literal_eval
+from functools import partial
+from importlib.util import decode_source
+from typing import Any, Iterator, List, Match, NamedTuple, Optional, Tuple
+
+from .import_aliases import AllureImportAliases
+from .params import ALLURE_ID_ARGUMENT, is_params_decorator
+from .scenario_facts import CaseAllureId, FileFacts, Position, ScenarioFacts
+
+STRING_BODY = r'''(?:\'\'\'(?:\\[\s\S]|[^\\])*?\'\'\'|"""(?:\\[\s\S]|[^\\])*?"""
+                            |\'(?:\\[\s\S]|[^\\\'\n])*\'|"(?:\\[\s\S]|[^\\"\n])*")'''
+STRING = rf'[rRbBuUfF]{{0,2}}{STRING_BODY}'
+
+TOKEN_RE = re.compile(rf'''
+    (?P<newline>\n)
+  | (?P<space>[ ]+)
+  | (?P<continuation>\\\n)
+  | (?P<comment>\#[^\n]*)
+  | (?P<string>{STRING})
+  | (?P<number>0[xX][\da-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+
+               |(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?[jJ]?)
+  | (?P<name>[^\W\d]\w*)
+  | (?P<op>[^\s\w\'"\\])
+''', re.VERBOSE)
+# string prefixes are left in blanked source, they are names there
+STRING_OR_COMMENT_RE = re.compile(rf'\#[^\n]*|{STRING_BODY}', re.VERBOSE)
+FIRST_NAME_RE = re.compile(r'[^\W\d]\w*')
+FUNCTION_RE = re.compile(r'(?:async[ \\\n]+)?def\b')
+INIT_RE = re.compile(r'(?:async[ \\\n]+)?def[ \\\n]+__init__\b')
+BRACKETS = str.maketrans('[{]}', '(())')
+
+# shapes of most statements, they are read from blanked heads without tokens
+NAME = r'[^\W\d]\w*'
+DOTTED_NAME = rf'{NAME}(?:\.{NAME})*'
+IMPORTED_MODULE = rf'{DOTTED_NAME}(?: +as +{NAME})?'
+IMPORTED_NAME = rf'{NAME}(?: +as +{NAME})?'
+IMPORT_RE = re.compile(rf'import +({IMPORTED_MODULE}(?: *, *{IMPORTED_MODULE})*)')
+IMPORT_FROM_RE = re.compile(rf'from +({DOTTED_NAME}) +import +({IMPORTED_NAME}(?: *, *{IMPORTED_NAME})*)')
+CLASS_RE = re.compile(rf'class +({NAME})')
+DECORATOR_RE = re.compile(rf'@ *({DOTTED_NAME})(?: *\(([^()\[\]{{}}=*:\\]*)\))?')
+SIMPLE_ARGUMENT_RE = re.compile(rf'{DOTTED_NAME}|[1-9]\d*|0')
+CALL_RE = re.compile(rf'({DOTTED_NAME}) *\([^()\[\]{{}}]*\)')
+
+OPENING_BRACKETS = frozenset('([{')
+CLOSING_BRACKETS = frozenset(')]}')
+# statements after `;` on the line of these are in their nested block
+COMPOUND_KEYWORDS = frozenset(('if', 'elif', 'else', 'for', 'while', 'with', 'try', 'except', 'finally',
+                               'def', 'class', 'async', 'match', 'case'))
+
+
+class AmbiguousSource(Exception):
+    """Source which the scanner can't read exactly like ast, facts are extracted from ast then."""
+
+
+class Token(NamedTuple):
+    kind: str
+    value: str
+    lineno: int
+    pos: int
+
+
+def tokenize_span(text: str, pos: int, end: int, lineno: int) -> List[Token]:
+    """Tokens of text[pos:end], which starts a line, comments and whitespace are dropped."""
+    match_token = TOKEN_RE.match
+    tokens = []
+    while pos < end:
+        match = match_token(text, pos, end)
+        if match is None:
+            raise AmbiguousSource(f'unknown token at line {lineno}')
+        kind = match.lastgroup
+        if kind == 'newline' or kind == 'continuation':
+            lineno += 1
+        elif kind != 'space' and kind != 'comment':
+            value = match.group()
+            tokens.append(Token(kind, value, lineno, pos))
+            if kind == 'string':
+                lineno += value.count('\n')
+        pos = match.end()
+    return tokens
+
+
+class Decorator(NamedTuple):
+    parts: List[str]
+    position: Position
+    # names and ints of a decorator read without tokens, argument tokens otherwise
+    simple_arguments: Optional[List[str]]
+    arguments: Optional[List[Token]]
+
+
+class Statement:
+    """
+    Simple statement or header of a compound one.
+
+    `head` is the statement with strings and comments blanked, it starts
+    at `head_pos` of the source. It is enough to tell most statements
+    apart, tokens are read only when needed.
+    """
+
+    __slots__ = ('indent', 'head', 'head_pos', 'lineno', 'start', 'end', 'is_nested', '_tokens')
+
+    def __init__(self, indent: int, head: str, head_pos: int, lineno: int, start: int, end: int,
+                 tokens: Optional[List[Token]] = None, is_nested: bool = False):
+        self.indent = indent
+        self.head = head
+        self.head_pos = head_pos
+        self.lineno = lineno
+        self.start = start
+        self.end = end
+        self.is_nested = is_nested
+        self._tokens = tokens
+
+    def get_tokens(self, text: str) -> List[Token]:
+        if self._tokens is None:
+            self._tokens = tokenize_span(text, self.start, self.end, self.lineno)
+        return self._tokens
+
+
+def _blank(match: Match) -> str:
+    # positions and line breaks are kept, a string becomes `0`
+    value = match.group()
+    if '\n' not in value:
+        return ('0' if value[0] != '#' else ' ') + ' ' * (len(value) - 1)
+    return '0' + '\n'.join(' ' * len(line) for line in value.split('\n'))[1:]
+
+
+def _split_statements(text: str, blanked: str, indent: int, lineno: int, start: int,
+                      end: int) -> Iterator[Statement]:
+    tokens = tokenize_span(text, start, end, lineno)
+    first = 0
+    depth = 0
+    is_nested = False
+    for index, token in enumerate(tokens):
+        if token.kind != 'op':
+            continue
+        if token.value in OPENING_BRACKETS:
+            depth += 1
+        elif token.value in CLOSING_BRACKETS:
+            depth -= 1
+        elif token.value == ';' and depth == 0:
+            if index > first:
+                part = tokens[first:index]
+                yield Statement(indent, blanked[part[0].pos:token.pos].strip(), part[0].pos, part[0].lineno,
+                                part[0].pos, token.pos, part, is_nested)
+                is_nested = is_nested or tokens[first].value in COMPOUND_KEYWORDS
+            first = index + 1
+    if first < len(tokens):
+        part = tokens[first:]
+        yield Statement(indent, blanked[part[0].pos:end].strip(), part[0].pos, part[0].lineno, part[0].pos, end,
+                        part, is_nested)
+
+
+def iter_statements(text: str) -> Iterator[Statement]:
+    """Statements of the source with indentation of their first line, blank and comment lines are skipped."""
+    if '\0' in text or '\t' in text or '\f' in text:
+        raise AmbiguousSource('tabs, form feeds and null bytes')
+    blanked = STRING_OR_COMMENT_RE.sub(_blank, text)
+    if "'" in blanked or '"' in blanked or blanked.count('\\') != blanked.count('\\\n'):
+        raise AmbiguousSource('unterminated string')
+
+    depth = 0
+    start = offset = 0
+    start_lineno = indent = 0
+    # every bracket is `(` or `)` in counted lines
+    for lineno, line in enumerate(blanked.translate(BRACKETS).split('\n'), 1):
+        line_end = offset + len(line)
+        if depth == 0 and start_lineno == 0:
+            stripped = line.lstrip(' ')
+            if not stripped or stripped.isspace():
+                offset = line_end + 1
+                continue
+            start_lineno, indent, start = lineno, len(line) - len(stripped), offset
+        if '(' in line or ')' in line:
+            depth += line.count('(') - line.count(')')
+            if depth < 0:
+                raise AmbiguousSource(f'unbalanced brackets at line {lineno}')
+        if depth == 0 and not line.endswith('\\'):
+            head = blanked[start + indent:line_end].strip()
+            if ';' in head:
+                yield from _split_statements(text, blanked, indent, start_lineno, start, line_end)
+            else:
+                yield Statement(indent, head, start + indent, start_lineno, start, line_end)
+            start_lineno = 0
+        offset = line_end + 1
+    if depth != 0 or start_lineno != 0:
+        raise AmbiguousSource('unbalanced brackets')
+
+
+def _is_op(token: Token, value: str) -> bool:
+    return token.kind == 'op' and token.value == value
+
+
+def _has_name(tokens: List[Token], value: str) -> bool:
+    return any(token.kind == 'name' and token.value == value for token in tokens)
+
+
+def _read_dotted_name(tokens: List[Token], start: int = 0) -> Tuple[List[str], int]:
+    parts = []
+    index = start
+    while index < len(tokens) and tokens[index].kind == 'name':
+        parts.append(tokens[index].value)
+        index += 1
+        if index + 1 < len(tokens) and _is_op(tokens[index], '.') and tokens[index + 1].kind == 'name':
+            index += 1
+        else:
+            break
+    return parts, index
+
+
+def _find_closing_bracket(tokens: List[Token], start: int) -> int:
+    depth = 0
+    for index in range(start, len(tokens)):
+        token = tokens[index]
+        if token.kind == 'op':
+            if token.value in OPENING_BRACKETS:
+                depth += 1
+            elif token.value in CLOSING_BRACKETS:
+                depth -= 1
+                if depth == 0:
+                    return index
+    raise AmbiguousSource('unbalanced brackets')
+
+
+def _read_call(tokens: List[Token]) -> Optional[Tuple[List[str], List[Token]]]:
+    """Dotted name and argument tokens if tokens are exactly `name.name(...)`."""
+    parts, index = _read_dotted_name(tokens)
+    if not parts or index >= len(tokens) or not _is_op(tokens[index], '('):
+        return None
+    end = _find_closing_bracket(tokens, index)
+    if end != len(tokens) - 1:
+        return None
+    return parts, tokens[index + 1:end]
+
+
+def _split_arguments(tokens: List[Token]) -> List[List[Token]]:
+    arguments: List[List[Token]] = [[]]
+    depth = 0
+    for token in tokens:
+        if token.kind == 'op':
+            if token.value in OPENING_BRACKETS:
+                depth += 1
+            elif token.value in CLOSING_BRACKETS:
+                depth -= 1
+            elif token.value == ',' and depth == 0:
+                arguments.append([])
+                continue
+        arguments[-1].append(token)
+    if not arguments[-1]:
+        arguments.pop()
+    for argument in arguments:
+        if not argument or _is_op(argument[0], '*'):
+            raise AmbiguousSource('starred arguments')
+    return arguments
+
+
+def _is_keyword(argument: List[Token]) -> bool:
+    return (len(argument) > 2 and argument[0].kind == 'name' and _is_op(argument[1], '=')
+            and not _is_op(argument[2], '='))
+
+
+def _constant(argument: List[Token]) -> Tuple[bool, Any]:
+    """(True, value) for literal constants, (False, None) for other expressions."""
+    first = argument[0]
+    if len(argument) == 1:
+        if first.kind == 'number':
+            return True, literal_eval(first.value)
+        if first.kind == 'string':
+            prefix = first.value[:first.value.find(first.value[-1])]
+            if 'f' in prefix.lower():
+                return False, None
+            return True, literal_eval(first.value)
+        if first.kind == 'name':
+            if first.value in ('True', 'False', 'None'):
+                return True, literal_eval(first.value)
+            return False, None
+    if first.kind == 'op' and first.value in '(.' or all(token.kind == 'string' for token in argument):
+        raise AmbiguousSource('parenthesized or concatenated constant')
+    return False, None
+
+
+def _byte_col(text: str, pos: int) -> int:
+    # ast positions are in utf-8 bytes
+    prefix = text[text.rfind('\n', 0, pos) + 1:pos]
+    return len(prefix) if prefix.isascii() else len(prefix.encode())
+
+
+class TokenFactsExtractor:
+    """
+    Scenario facts read from tokens of the source without building its AST.
+
+    Only the shapes scenarios are written in are read: imports, decorators
+    and `class Scenario` at module level, and `allure.id()` statements in
+    its methods. Anything else which could change facts, e.g. a nested
+    `class Scenario` or allure imported in a function, raises
+    AmbiguousSource and facts are extracted from ast.
+    """
+
+    def extract_file_facts(self, source: bytes) -> Optional[FileFacts]:
+        """Facts of the source, None if they have to be extracted from ast."""
+        try:
+            return self._extract(decode_source(source))
+        except (AmbiguousSource, SyntaxError, ValueError, UnicodeDecodeError, MemoryError):
+            return None
+
+    def _extract(self, text: str) -> FileFacts:
+        aliases = AllureImportAliases()
+        file_facts = FileFacts()
+        decorators: List[List[Token]] = []
+        # decorators of the next method of the scenario
+        method_decorators: List[Statement] = []
+        # facts of Scenario class whose body is read, indents are known from the first statements
+        scenario: Optional[ScenarioFacts] = None
+        class_indent: Optional[int] = None
+        function_indent: Optional[int] = None
+        is_function = False
+
+        for statement in iter_statements(text):
+            head = statement.head
+            is_module_statement = statement.indent == 0 and not statement.is_nested
+            first_name = FIRST_NAME_RE.match(head)
+            first_name = first_name.group() if first_name else None
+            if 'import' in head and 'allure' in head and not (
+                    is_module_statement and (first_name == 'import' or first_name == 'from')):
+                tokens = statement.get_tokens(text)
+                if _has_name(tokens, 'import') and _has_name(tokens, 'allure'):
+                    raise AmbiguousSource(f'allure is imported in a nested block at line {statement.lineno}')
+            if 'class' in head and 'Scenario' in head and not (is_module_statement and first_name == 'class'):
+                if self._has_scenario_class(statement.get_tokens(text)):
+                    raise AmbiguousSource(f'nested Scenario class at line {statement.lineno}')
+
+            if statement.indent == 0:
+                scenario = None
+                if statement.is_nested:
+                    continue
+                if head.startswith('@'):
+                    decorators.append(statement)
+                    continue
+                if first_name == 'import' or first_name == 'from':
+                    self._read_import(text, statement, aliases, file_facts)
+                elif first_name == 'class' and self._is_scenario_class(text, statement):
+                    facts = self._read_scenario(text, statement, decorators, aliases)
+                    file_facts.scenarios.append(facts)
+                    if head.endswith(':') or not self._has_inline_body(statement.get_tokens(text)):
+                        scenario, class_indent, function_indent, is_function = facts, None, None, False
+                        method_decorators = []
+                decorators = []
+                continue
+
+            if scenario is None or statement.is_nested:
+                continue
+            if class_indent is None:
+                class_indent = statement.indent
+            if statement.indent == class_indent:
+                if head.startswith('@'):
+                    method_decorators.append(statement)
+                    continue
+                is_function = FUNCTION_RE.match(head) is not None
+                if is_function and not head.endswith(':') and self._has_inline_body(statement.get_tokens(text)):
+                    raise AmbiguousSource(f'one line method at line {statement.lineno}')
+                if is_function and method_decorators and INIT_RE.match(head):
+                    scenario.params_allure_ids.extend(
+                        self._read_params_allure_ids(text, statement, method_decorators))
+                method_decorators = []
+                function_indent = None
+            elif statement.indent > class_indent:
+                if function_indent is None:
+                    function_indent = statement.indent
+                if statement.indent < function_indent:
+                    raise AmbiguousSource(f'unexpected indent at line {statement.lineno}')
+                if (is_function and statement.indent == function_indent
+                        and self._may_be_allure_id_call(head, aliases)
+                        and self._is_allure_id_call(text, statement, aliases)):
+                    scenario.allure_id_calls.append((statement.lineno, _byte_col(text, statement.head_pos)))
+            else:
+                raise AmbiguousSource(f'unexpected indent at line {statement.lineno}')
+
+        return file_facts
+
+    def _is_scenario_class(self, text: str, statement: Statement) -> bool:
+        match = CLASS_RE.match(statement.head)
+        if match is None:
+            return self._has_scenario_class(statement.get_tokens(text))
+        return match.group(1) == 'Scenario'
+
+    @staticmethod
+    def _has_scenario_class(tokens: List[Token]) -> bool:
+        return any(
+            token.kind == 'name' and token.value == 'class'
+            and index + 1 < len(tokens) and tokens[index + 1].value == 'Scenario'
+            for index, token in enumerate(tokens)
+        )
+
+    @staticmethod
+    def _has_inline_body(tokens: List[Token]) -> bool:
+        depth = 0
+        for index, token in enumerate(tokens):
+            if token.kind != 'op':
+                continue
+            if token.value in OPENING_BRACKETS:
+                depth += 1
+            elif token.value in CLOSING_BRACKETS:
+                depth -= 1
+            elif token.value == ':' and depth == 0:
+                return index < len(tokens) - 1
+        raise AmbiguousSource(f'no colon in header at line {tokens[0].lineno}')
+
+    @staticmethod
+    def _read_import(text: str, statement: Statement, aliases: AllureImportAliases,
+                     file_facts: FileFacts) -> None:
+        names: List[Tuple[str, Optional[str]]]
+        match = IMPORT_RE.fullmatch(statement.head)
+        if match is not None:
+            for name in match.group(1).split(','):
+                parts = name.split()
+                aliases.add_module(parts[0], parts[2] if len(parts) == 3 else None)
+            return
+        match = IMPORT_FROM_RE.fullmatch(statement.head)
+        if match is not None:
+            if match.group(1) != 'allure':
+                return
+            names = []
+            for name in match.group(2).split(','):
+                parts = name.split()
+                names.append((parts[0], parts[2] if len(parts) == 3 else None))
+        else:
+            tokens = statement.get_tokens(text)
+            if tokens[0].value == 'import':
+                for name_tokens in _split_arguments(tokens[1:]):
+                    parts, index = _read_dotted_name(name_tokens)
+                    asname = (name_tokens[index + 1].value
+                              if index + 1 < len(name_tokens) and name_tokens[index].value == 'as' else None)
+                    aliases.add_module('.'.join(parts), asname)
+                return
+
+            index = 1
+            while index < len(tokens) and _is_op(tokens[index], '.'):
+                index += 1
+            parts, index = _read_dotted_name(tokens, index)
+            if '.'.join(parts) != 'allure':
+                return
+            name_tokens = [token for token in tokens[index + 1:] if not _is_op(token, '(') and not _is_op(token, ')')]
+            names = [(name[0].value, name[2].value if len(name) == 3 and name[1].value == 'as' else None)
+                     for name in _split_arguments(name_tokens)]
+
+        for name, asname in names:
+            aliases.add_allure_name(name, asname)
+            file_facts.allure_imports.append((name, asname or name))
+
+    @staticmethod
+    def _read_decorator(text: str, decorator: Statement) -> Optional[Decorator]:
+        """Called name, position and arguments of the decorator, None if it is not a call."""
+        match = DECORATOR_RE.fullmatch(decorator.head)
+        if match is not None and match.group(2) is None:
+            return None
+        if match is not None:
+            arguments = match.group(2).split(',')
+            if len(arguments) > 1 and not arguments[-1].strip():
+                arguments.pop()
+            simple_arguments = []
+            offset = decorator.head_pos + match.start(2)
+            for argument in arguments:
+                value = argument.strip()
+                # names are checked against the source, blanked strings and their prefixes look alike
+                if value:
+                    value_pos = offset + argument.index(value)
+                    if SIMPLE_ARGUMENT_RE.fullmatch(value) is None or text[value_pos:value_pos + len(value)] != value:
+                        break
+                    simple_arguments.append(value)
+                elif len(arguments) > 1:
+                    break
+                offset += len(argument) + 1
+            else:
+                name_pos = decorator.head_pos + match.start(1)
+                return Decorator(match.group(1).split('.'), (decorator.lineno, _byte_col(text, name_pos)),
+                                 simple_arguments, None)
+
+        tokens = decorator.get_tokens(text)
+        call = _read_call(tokens[1:])
+        if call is None:
+            if len(_read_dotted_name(tokens, 1)[0]) * 2 != len(tokens):
+                raise AmbiguousSource(f'decorator expression at line {decorator.lineno}')
+            return None
+        parts, arguments = call
+        return Decorator(parts, (tokens[1].lineno, _byte_col(text, tokens[1].pos)), None, arguments)
+
+    def _read_scenario(self, text: str, statement: Statement, decorators: List[Statement],
+                       aliases: AllureImportAliases) -> ScenarioFacts:
+        facts = ScenarioFacts(name='Scenario', lineno=statement.lineno, col_offset=0)
+        id_decorator = None
+        imported_id_decorator = None
+        for decorator in map(partial(self._read_decorator, text), decorators):
+            if decorator is None:
+                continue
+            parts = decorator.parts
+            if len(parts) == 1:
+                if parts[0] == 'allure_labels' and facts.labels_position is None:
+                    facts.labels_position = decorator.position
+                    self._read_labels(facts, decorator)
+                elif imported_id_decorator is None and parts[0] in aliases.id_names:
+                    imported_id_decorator = decorator
+            elif id_decorator is None and len(parts) == 2 and parts[1] == 'id' and parts[0] in aliases.modules:
+                id_decorator = decorator
+
+        if id_decorator is None:
+            id_decorator = imported_id_decorator
+        if id_decorator is not None:
+            facts.allure_id_position = id_decorator.position
+            facts.allure_id = self._read_allure_id(id_decorator)
+        return facts
+
+    @staticmethod
+    def _read_labels(facts: ScenarioFacts, decorator: Decorator) -> None:
+        if decorator.simple_arguments is not None:
+            for argument in decorator.simple_arguments:
+                if not argument[0].isdigit():
+                    facts.labels.append(argument)
+                    if '.' in argument:
+                        facts.tag_counts[argument[:argument.index('.')]] += 1
+            return
+
+        for argument in _split_arguments(decorator.arguments):
+            parts, index = _read_dotted_name(argument)
+            if parts and index == len(argument):
+                facts.labels.append('.'.join(parts))
+                if len(parts) > 1:
+                    facts.tag_counts[parts[0]] += 1
+            elif any(_is_op(token, '.') for token in argument):
+                raise AmbiguousSource(f'allure label expression at line {argument[0].lineno}')
+
+    @staticmethod
+    def _read_allure_id(decorator: Decorator) -> Optional[str]:
+        if decorator.simple_arguments is not None:
+            if not decorator.simple_arguments:
+                return None
+            value = decorator.simple_arguments[0]
+            return value if value[0].isdigit() or value in ('True', 'False') else None
+
+        positional = []
+        keywords = {}
+        for argument in _split_arguments(decorator.arguments):
+            if _is_keyword(argument):
+                keywords[argument[0].value] = argument[2:]
+            else:
+                positional.append(argument)
+
+        for argument in (positional[:1] + ([keywords['id']] if 'id' in keywords else [])):
+            is_constant, value = _constant(argument)
+            if is_constant and value is not None:
+                return str(value)
+        return None
+
+    def _read_params_allure_ids(self, text: str, function: Statement,
+                                decorators: List[Statement]) -> List[CaseAllureId]:
+        allure_ids: List[CaseAllureId] = []
+        index: Optional[int] = None
+        for statement in decorators:
+            if 'params' not in statement.head:
+                continue
+            decorator = self._read_decorator(text, statement)
+            if decorator is None or not is_params_decorator(decorator.parts):
+                continue
+            if index is None:
+                index = self._read_argument_index(function.get_tokens(text), ALLURE_ID_ARGUMENT)
+            allure_id = self._read_params_allure_id(decorator, index)
+            if allure_id is not None:
+                allure_ids.append((allure_id, *decorator.position))
+        return allure_ids
+
+    @staticmethod
+    def _read_argument_index(tokens: List[Token], name: str) -> int:
+        """Index of the argument among arguments after self, -1 if there is no such argument."""
+        start = next(index for index, token in enumerate(tokens) if _is_op(token, '('))
+        end = _find_closing_bracket(tokens, start)
+        names = []
+        for argument in _split_arguments(tokens[start + 1:end]):
+            if argument[0].kind != 'name':
+                raise AmbiguousSource(f'positional only arguments at line {argument[0].lineno}')
+            names.append(argument[0].value)
+        return names.index(name) - 1 if name in names[1:] else -1
+
+    @staticmethod
+    def _read_params_allure_id(decorator: Decorator, index: int) -> Optional[str]:
+        if decorator.simple_arguments is not None:
+            if 0 <= index < len(decorator.simple_arguments):
+                value = decorator.simple_arguments[index]
+                if value[0].isdigit() or value in ('True', 'False'):
+                    return value
+            return None
+
+        positional = []
+        for argument in _split_arguments(decorator.arguments):
+            if _is_keyword(argument):
+                if argument[0].value == ALLURE_ID_ARGUMENT:
+                    is_constant, value = _constant(argument[2:])
+                    return str(value) if is_constant and value is not None else None
+            else:
+                positional.append(argument)
+        if 0 <= index < len(positional):
+            is_constant, value = _constant(positional[index])
+            if is_constant and value is not None:
+                return str(value)
+        return None
+
+    @staticmethod
+    def _may_be_allure_id_call(head: str, aliases: AllureImportAliases) -> bool:
+        if head.startswith('('):
+            return True
+        first_name = FIRST_NAME_RE.match(head)
+        return first_name is not None and (
+            first_name.group() in aliases.modules or first_name.group() in aliases.dynamic_names)
+
+    @staticmethod
+    def _is_allure_id_call(text: str, statement: Statement, aliases: AllureImportAliases) -> bool:
+        match = CALL_RE.fullmatch(statement.head)
+        if match is not None:
+            parts = match.group(1).split('.')
+        else:
+            tokens = statement.get_tokens(text)
+            if _is_op(tokens[0], '('):
+                if any(token.kind == 'name'
+                       and (token.value in aliases.modules or token.value in aliases.dynamic_names)
+                       for token in tokens):
+                    raise AmbiguousSource(f'parenthesized call at line {tokens[0].lineno}')
+                return False
+            call = _read_call(tokens)
+            if call is None:
+                return False
+            parts, _ = call
+        if len(parts) == 2:
+            return parts[1] == 'id' and (parts[0] in aliases.modules or parts[0] in aliases.dynamic_names)
+        return len(parts) == 3 and parts[1:] == ['dynamic', 'id'] and parts[0] in aliases.modules
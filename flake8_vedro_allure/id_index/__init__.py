@@ -0,0 +1,4 @@
+from .base import AllureIdIndex, AllureIdInScenario
+from .memory import InMemoryAllureIdIndex
+from .sqlite import SqliteAllureIdIndex, get_run_index_path
+from .shards import CrossShardDuplicate, ShardEntry, merge_shards, write_shard
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+# (allure_id, scenario_path, lineno)
+Occurrence = Tuple[str, str, int]
+
+
+class AllureIdInScenario(NamedTuple):
+    scenario_path: str
+    lineno: int
+
+
+class AllureIdIndex(ABC):
+    """
+    Owners of allure ids.
+
+    The occurrence with the lowest (path, line) owns an id, so owners don't
+    depend on the order in which files are checked. Duplicates are found in
+    two phases: occurrences of all files are added first, then every other
+    occurrence is reported against its owner.
+    """
+
+    @abstractmethod
+    def add(self, allure_id: str, scenario_path: str, lineno: int) -> None:
+        pass
+
+    def add_many(self, occurrences: Iterable[Occurrence]) -> None:
+        for allure_id, scenario_path, lineno in occurrences:
+            self.add(allure_id, scenario_path, lineno)
+
+    @abstractmethod
+    def owner(self, allure_id: str) -> Optional[AllureIdInScenario]:
+        pass
+
+    def claim(self, allure_id: str, scenario_path: str, lineno: int) -> AllureIdInScenario:
+        """Add the occurrence and return the owner of the id."""
+        self.add(allure_id, scenario_path, lineno)
+        return self.owner(allure_id)
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
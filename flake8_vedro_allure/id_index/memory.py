@@ -0,0 +1,112 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .base import AllureIdIndex, AllureIdInScenario
+
+AllureIdKey = Union[int, str]
+
+MAX_NUMERIC_ID = 2 ** 64 - 1
+MIN_PENDING_SIZE = 4096
+
+
+def to_key(allure_id: str) -> AllureIdKey:
+    # numeric ids are kept as ints unless int() would change them, e.g. '007'
+    if allure_id.isascii() and allure_id.isdigit() and (allure_id == '0' or allure_id[0] != '0'):
+        key = int(allure_id)
+        if key <= MAX_NUMERIC_ID:
+            return key
+    return allure_id
+
+
+class InMemoryAllureIdIndex(AllureIdIndex):
+    """
+    Allure id index which stays small at hundreds of thousands of scenarios.
+
+    Owners are kept by slot in two uint32 arrays, number of the path in
+    the path table and line. Numeric ids are ints in a sorted uint64 array
+    with slots in a parallel array, recently added ones wait in a small dict
+    until it is merged into the arrays. Other ids are kept in a dict.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._paths: List[str] = []
+        self._path_numbers: Dict[str, int] = {}
+        self._owner_paths = array('I')
+        self._owner_lines = array('I')
+        self._numeric_ids = array('Q')
+        self._numeric_slots = array('I')
+        self._pending_ids: Dict[int, int] = {}
+        self._named_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._owner_paths)
+
+    def _path_number(self, path: str) -> int:
+        number = self._path_numbers.get(path)
+        if number is None:
+            number = self._path_numbers[path] = len(self._paths)
+            self._paths.append(path)
+        return number
+
+    def _find_slot(self, key: AllureIdKey) -> Optional[int]:
+        if isinstance(key, str):
+            return self._named_ids.get(key)
+        slot = self._pending_ids.get(key)
+        if slot is None:
+            position = bisect_left(self._numeric_ids, key)
+            if position < len(self._numeric_ids) and self._numeric_ids[position] == key:
+                slot = self._numeric_slots[position]
+        return slot
+
+    def _flush_pending(self) -> None:
+        numeric_ids, numeric_slots = array('Q'), array('I')
+        merged = heapq.merge(zip(self._numeric_ids, self._numeric_slots), sorted(self._pending_ids.items()))
+        for key, slot in merged:
+            numeric_ids.append(key)
+            numeric_slots.append(slot)
+        self._numeric_ids, self._numeric_slots = numeric_ids, numeric_slots
+        self._pending_ids = {}
+
+    def add(self, allure_id: str, scenario_path: str, lineno: int) -> None:
+        key = to_key(allure_id)
+        slot = self._find_slot(key)
+        if slot is not None:
+            if (scenario_path, lineno) < (self._paths[self._owner_paths[slot]], self._owner_lines[slot]):
+                self._owner_paths[slot] = self._path_number(scenario_path)
+                self._owner_lines[slot] = lineno
+            return
+
+        slot = len(self._owner_paths)
+        self._owner_paths.append(self._path_number(scenario_path))
+        self._owner_lines.append(lineno)
+        if isinstance(key, str):
+            self._named_ids[key] = slot
+            return
+        self._pending_ids[key] = slot
+        if len(self._pending_ids) >= max(MIN_PENDING_SIZE, len(self._numeric_ids) // 4):
+            self._flush_pending()
+
+    def _get_owner(self, slot: int) -> AllureIdInScenario:
+        return AllureIdInScenario(self._paths[self._owner_paths[slot]], self._owner_lines[slot])
+
+    def owner(self, allure_id: str) -> Optional[AllureIdInScenario]:
+        slot = self._find_slot(to_key(allure_id))
+        return None if slot is None else self._get_owner(slot)
+
+    def numeric_ids(self) -> array:
+        """Sorted numeric ids, the array is owned by the index."""
+        self._flush_pending()
+        return self._numeric_ids
+
+    def items(self) -> Iterator[Tuple[str, AllureIdInScenario]]:
+        """(allure id, owner) pairs, numeric ids are ordered by value."""
+        self._flush_pending()
+        for key, slot in zip(self._numeric_ids, self._numeric_slots):
+            yield str(key), self._get_owner(slot)
+        for name, slot in self._named_ids.items():
+            yield name, self._get_owner(slot)
@@ -0,0 +1,74 @@
+import heapq
+import json
+import os
+from itertools import groupby
+from typing import IO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class ShardEntry(NamedTuple):
+    allure_id: str
+    path: str
+    lineno: int
+    col_offset: int
+
+
+class CrossShardDuplicate(NamedTuple):
+    entry: ShardEntry
+    owner: ShardEntry
+
+
+def write_shard(entries: Iterable[ShardEntry], path: str) -> None:
+    """
+    Write allure ids of one shard sorted by id, path and line.
+
+    Every line is a JSON array, so shards are merged line by line
+    without loading them.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        for entry in sorted(entries):
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+    os.replace(tmp_path, path)
+
+
+def iter_shard(stream: IO[str], name: str = 'shard') -> Iterator[ShardEntry]:
+    previous: Optional[ShardEntry] = None
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        entry = ShardEntry(*json.loads(line))
+        if previous is not None and entry < previous:
+            raise ValueError(f'{name}:{number}: allure id index shard is not sorted')
+        previous = entry
+        yield entry
+
+
+def _tag(entries: Iterator[ShardEntry], shard: int) -> Iterator[Tuple[ShardEntry, int]]:
+    for entry in entries:
+        yield entry, shard
+
+
+def merge_shards(streams: Sequence[IO[str]], names: Optional[Sequence[str]] = None,
+                 output: Optional[IO[str]] = None) -> Iterator[CrossShardDuplicate]:
+    """
+    K-way merge of sorted shards, yields scenarios whose id is owned by a scenario of another shard.
+
+    The lowest path owns an id, as in a single run. Duplicates inside a shard
+    were reported against the lowest path of the shard when it was linted,
+    so only the file owning an id in its shard is yielded. Only entries of
+    one id are kept in memory. Merged entries are written to output, which
+    is a shard itself.
+    """
+    names = names or [f'shard{number}' for number in range(len(streams))]
+    merged = heapq.merge(*(_tag(iter_shard(stream, name), shard)
+                           for shard, (stream, name) in enumerate(zip(streams, names))))
+    for _, group in groupby(merged, key=lambda tagged: tagged[0].allure_id):
+        tagged: List[Tuple[ShardEntry, int]] = list(group)
+        owner, owner_shard = tagged[0]
+        shard_owner_paths: Dict[int, str] = {}
+        for entry, shard in tagged:
+            if output is not None:
+                output.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            shard_owner_path = shard_owner_paths.setdefault(shard, entry.path)
+            if shard != owner_shard and entry.path == shard_owner_path and entry.path != owner.path:
+                yield CrossShardDuplicate(entry, owner)
@@ -0,0 +1,88 @@
+import os
+import tempfile
+from typing import Iterable, Optional, Tuple
+
+from flake8_vedro_allure.run_scope import get_run_scoped_path
+from flake8_vedro_allure.sqlite_connection import ProcessLocalConnection
+
+from .base import AllureIdIndex, AllureIdInScenario, Occurrence
+
+RUN_INDEX_ENV = 'FLAKE8_VEDRO_ALLURE_ID_INDEX'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS allure_ids (
+    allure_id TEXT PRIMARY KEY,
+    scenario_path TEXT NOT NULL,
+    lineno INTEGER NOT NULL
+);
+'''
+
+ADD_OCCURRENCE = '''
+INSERT INTO allure_ids (allure_id, scenario_path, lineno) VALUES (?, ?, ?)
+ON CONFLICT (allure_id) DO UPDATE SET scenario_path = excluded.scenario_path, lineno = excluded.lineno
+WHERE (excluded.scenario_path, excluded.lineno) < (allure_ids.scenario_path, allure_ids.lineno)
+'''
+
+
+class SqliteAllureIdIndex(AllureIdIndex):
+    """
+    Allure id index shared between processes through a local SQLite file.
+
+    Every id has one row with its lowest occurrence, which is updated
+    atomically, so processes may add occurrences concurrently.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = ProcessLocalConnection(path, SCHEMA)
+
+    def add(self, allure_id: str, scenario_path: str, lineno: int) -> None:
+        self._connection.get().execute(ADD_OCCURRENCE, (allure_id, scenario_path, lineno))
+
+    def add_many(self, occurrences: Iterable[Occurrence]) -> None:
+        connection = self._connection.get()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany(ADD_OCCURRENCE, occurrences)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def owner(self, allure_id: str) -> Optional[AllureIdInScenario]:
+        row = self._connection.get().execute(
+            'SELECT scenario_path, lineno FROM allure_ids WHERE allure_id = ?', (allure_id,)
+        ).fetchone()
+        return AllureIdInScenario(*row) if row else None
+
+    def reset(self) -> None:
+        self._connection.get().execute('DELETE FROM allure_ids')
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _create_run_index() -> str:
+    fd, path = tempfile.mkstemp(prefix='flake8-vedro-allure-', suffix='.sqlite')
+    os.close(fd)
+    return path
+
+
+def _remove_run_index(path: str) -> None:
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(path + suffix)
+        except OSError:
+            pass
+
+
+def get_run_index_path() -> Tuple[str, bool]:
+    """Path of the index shared by processes of the run, and if the current process created it."""
+    path, is_owner = get_run_scoped_path(RUN_INDEX_ENV, _create_run_index, _remove_run_index)
+    if is_owner:
+        # A new run starts from an empty index. Schema and WAL mode are set up
+        # before workers start, so they never race on it
+        index = SqliteAllureIdIndex(path)
+        index.reset()
+        index.close()
+    return path, is_owner
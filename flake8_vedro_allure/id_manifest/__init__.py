@@ -0,0 +1,8 @@
+from .collector import (
+    ID_MANIFEST_ENV,
+    get_process_id_manifest,
+    start_id_manifest_collection
+)
+from .reader import read_id_manifest
+from .records import AllureIdRecord, iter_id_records
+from .writers import ID_MANIFEST_FORMATS, write_id_manifest
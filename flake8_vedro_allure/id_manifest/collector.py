@@ -0,0 +1,115 @@
+import atexit
+import json
+import os
+import shutil
+import tempfile
+from multiprocessing.util import Finalize
+from typing import IO, Iterator, List, Optional, Set, Tuple
+
+from flake8_vedro_allure.facts import FileFacts
+from flake8_vedro_allure.run_scope import get_run_scoped_path
+
+from .records import AllureIdRecord, iter_id_records
+from .writers import write_id_manifest
+
+ID_MANIFEST_ENV = 'FLAKE8_VEDRO_ALLURE_ID_MANIFEST'
+RUN_ID_MANIFEST_ENV = 'FLAKE8_VEDRO_ALLURE_RUN_ID_MANIFEST'
+
+_process_manifest: Optional['IdManifestPart'] = None
+_process_pid: Optional[int] = None
+_reports: Set[Tuple[str, str, str]] = set()
+
+
+class IdManifestPart:
+    """
+    Records of files checked by one process, streamed to disk as they come.
+
+    Every line holds all records of one file, so parts can be merged
+    by path without loading the records into memory.
+    """
+
+    def __init__(self, parts_dir: str):
+        self.path = os.path.join(parts_dir, f'{os.getpid()}.ndjson')
+        self._file: Optional[IO[str]] = None
+
+    def add_file(self, filename: str, file_facts: FileFacts) -> None:
+        records = [record.to_dict() for record in iter_id_records(filename, file_facts)]
+        if not records:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(records) + '\n')
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _create_parts_dir() -> str:
+    return tempfile.mkdtemp(prefix='flake8-vedro-allure-id-manifest-')
+
+
+def _remove_parts_dir(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def iter_merged_records(parts_dir: str) -> Iterator[AllureIdRecord]:
+    """Records of all parts ordered by path, memory grows with number of files only."""
+    blocks: List[Tuple[str, str, int]] = []
+    for name in sorted(os.listdir(parts_dir)):
+        part_path = os.path.join(parts_dir, name)
+        with open(part_path, 'rb') as f:
+            offset = 0
+            for line in f:
+                # path of the first record is enough, one line holds one file
+                blocks.append((json.loads(line)[0]['path'], part_path, offset))
+                offset += len(line)
+    blocks.sort()
+
+    files = {}
+    try:
+        for _, part_path, offset in blocks:
+            if part_path not in files:
+                files[part_path] = open(part_path, 'rb')
+            f = files[part_path]
+            f.seek(offset)
+            for data in json.loads(f.readline()):
+                yield AllureIdRecord.from_dict(data)
+    finally:
+        for f in files.values():
+            f.close()
+
+
+def _write_run_id_manifest(parts_dir: str, output_path: str, manifest_format: str) -> None:
+    if _process_manifest is not None and _process_pid == os.getpid():
+        _process_manifest.close()
+    write_id_manifest(iter_merged_records(parts_dir), output_path, manifest_format)
+
+
+def start_id_manifest_collection(output_path: str, manifest_format: str) -> str:
+    """
+    Prepare allure id manifest export for the run and return directory for parts.
+
+    Every process appends records of checked files to its own part, the
+    process which started the run merges parts by path at exit.
+    """
+    parts_dir, is_owner = get_run_scoped_path(RUN_ID_MANIFEST_ENV, _create_parts_dir, _remove_parts_dir)
+    report = (parts_dir, output_path, manifest_format)
+    if is_owner and report not in _reports:
+        _reports.add(report)
+        atexit.register(_write_run_id_manifest, *report)
+    return parts_dir
+
+
+def get_process_id_manifest(parts_dir: str) -> IdManifestPart:
+    global _process_manifest, _process_pid
+
+    if _process_manifest is None or _process_pid != os.getpid():
+        _process_manifest = IdManifestPart(parts_dir)
+        _process_pid = os.getpid()
+        owner_pid, _ = os.environ[RUN_ID_MANIFEST_ENV].split(':', 1)
+        if int(owner_pid) != os.getpid():
+            # multiprocessing runs finalizers when a pool worker exits, atexit is skipped there
+            Finalize(None, _process_manifest.close, exitpriority=10)
+    return _process_manifest
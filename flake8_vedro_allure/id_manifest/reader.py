@@ -0,0 +1,12 @@
+import json
+from typing import Iterator
+
+from .records import AllureIdRecord
+
+
+def read_id_manifest(path: str) -> Iterator[AllureIdRecord]:
+    """Records of NDJSON manifest, e.g. a baseline written by a previous run."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield AllureIdRecord.from_dict(json.loads(line))
@@ -0,0 +1,36 @@
+import os
+from typing import Any, Dict, Iterator, NamedTuple, Tuple
+
+from flake8_vedro_allure.facts import FileFacts
+
+
+class AllureIdRecord(NamedTuple):
+    allure_id: str
+    path: str
+    lineno: int
+    scenario: str
+    labels: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'allure_id': self.allure_id,
+            'path': self.path,
+            'lineno': self.lineno,
+            'scenario': self.scenario,
+            'labels': list(self.labels),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AllureIdRecord':
+        return cls(data['allure_id'], data['path'], data['lineno'], data['scenario'], tuple(data['labels']))
+
+
+def iter_id_records(filename: str, file_facts: FileFacts) -> Iterator[AllureIdRecord]:
+    """Scenarios of the file with an allure.id() value and their @params cases with ids, ordered by line."""
+    path = os.path.normpath(filename)
+    for scenario in sorted(file_facts.scenarios, key=lambda scenario: scenario.lineno):
+        if scenario.allure_id is not None:
+            lineno = scenario.allure_id_position[0] if scenario.allure_id_position else scenario.lineno
+            yield AllureIdRecord(scenario.allure_id, path, lineno, scenario.name, tuple(scenario.labels))
+        for allure_id, lineno, _ in scenario.params_allure_ids:
+            yield AllureIdRecord(allure_id, path, lineno, scenario.name, tuple(scenario.labels))
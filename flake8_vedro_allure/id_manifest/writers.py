@@ -0,0 +1,32 @@
+import csv
+import json
+from typing import IO, Callable, Dict, Iterable
+
+from .records import AllureIdRecord
+
+CSV_COLUMNS = ('allure_id', 'path', 'lineno', 'scenario', 'labels')
+CSV_LABELS_SEPARATOR = ';'
+
+
+def write_ndjson(records: Iterable[AllureIdRecord], stream: IO[str]) -> None:
+    for record in records:
+        stream.write(json.dumps(record.to_dict()) + '\n')
+
+
+def write_csv(records: Iterable[AllureIdRecord], stream: IO[str]) -> None:
+    writer = csv.writer(stream, lineterminator='\n')
+    writer.writerow(CSV_COLUMNS)
+    for record in records:
+        writer.writerow((record.allure_id, record.path, record.lineno, record.scenario,
+                         CSV_LABELS_SEPARATOR.join(record.labels)))
+
+
+ID_MANIFEST_FORMATS: Dict[str, Callable[[Iterable[AllureIdRecord], IO[str]], None]] = {
+    'ndjson': write_ndjson,
+    'csv': write_csv,
+}
+
+
+def write_id_manifest(records: Iterable[AllureIdRecord], path: str, manifest_format: str) -> None:
+    with open(path, 'w', newline='') as f:
+        ID_MANIFEST_FORMATS[manifest_format](records, f)
@@ -0,0 +1,6 @@
+from .collector import (
+    METRICS_ENV,
+    get_process_metrics,
+    start_metrics_collection
+)
+from .metrics import METRICS_FORMATS, Metrics, Stats, write_metrics
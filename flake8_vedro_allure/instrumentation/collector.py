@@ -0,0 +1,69 @@
+import atexit
+import json
+import os
+import shutil
+import tempfile
+from multiprocessing.util import Finalize
+from typing import Optional, Set, Tuple
+
+from flake8_vedro_allure.run_scope import get_run_scoped_path
+
+from .metrics import Metrics, write_metrics
+
+METRICS_ENV = 'FLAKE8_VEDRO_ALLURE_METRICS'
+RUN_METRICS_ENV = 'FLAKE8_VEDRO_ALLURE_RUN_METRICS'
+
+_process_metrics: Optional[Metrics] = None
+_process_pid: Optional[int] = None
+_reports: Set[Tuple[str, str, str]] = set()
+
+
+def _create_metrics_dir() -> str:
+    return tempfile.mkdtemp(prefix='flake8-vedro-allure-metrics-')
+
+
+def _remove_metrics_dir(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _dump_worker_metrics(metrics_dir: str, metrics: Metrics) -> None:
+    with open(os.path.join(metrics_dir, f'{os.getpid()}.json'), 'w') as f:
+        json.dump(metrics.to_dict(), f)
+
+
+def _write_run_metrics(metrics_dir: str, output_path: str, metrics_format: str) -> None:
+    metrics = Metrics()
+    if _process_metrics is not None and _process_pid == os.getpid():
+        metrics.merge(_process_metrics)
+    for name in sorted(os.listdir(metrics_dir)):
+        with open(os.path.join(metrics_dir, name)) as f:
+            metrics.merge(Metrics.from_dict(json.load(f)))
+    write_metrics(metrics, output_path, metrics_format)
+
+
+def start_metrics_collection(output_path: str, metrics_format: str) -> str:
+    """
+    Prepare metrics collection for the run and return directory for worker metrics.
+
+    Workers dump their metrics when they exit, the process which started the
+    run merges them with its own ones and writes the report at exit.
+    """
+    metrics_dir, is_owner = get_run_scoped_path(RUN_METRICS_ENV, _create_metrics_dir, _remove_metrics_dir)
+    report = (metrics_dir, output_path, metrics_format)
+    if is_owner and report not in _reports:
+        _reports.add(report)
+        atexit.register(_write_run_metrics, *report)
+    return metrics_dir
+
+
+def get_process_metrics(metrics_dir: str) -> Metrics:
+    global _process_metrics, _process_pid
+
+    if _process_metrics is None or _process_pid != os.getpid():
+        _process_metrics = Metrics()
+        _process_pid = os.getpid()
+        owner_pid, _ = os.environ[RUN_METRICS_ENV].split(':', 1)
+        if int(owner_pid) != os.getpid():
+            # multiprocessing runs finalizers when a pool worker exits, atexit is skipped there
+            Finalize(None, _dump_worker_metrics, args=(metrics_dir, _process_metrics), exitpriority=10)
+    return _process_metrics
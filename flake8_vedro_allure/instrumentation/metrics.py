@@ -0,0 +1,104 @@
+import json
+from typing import Any, Dict, List
+
+
+class Stats:
+    __slots__ = ('calls', 'seconds', 'errors', 'exceptions')
+
+    def __init__(self, calls: int = 0, seconds: float = 0.0, errors: int = 0, exceptions: int = 0):
+        self.calls = calls
+        self.seconds = seconds
+        self.errors = errors
+        self.exceptions = exceptions
+
+    def add(self, seconds: float, errors: int, failed: bool) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.errors += errors
+        self.exceptions += failed
+
+    def merge(self, other: 'Stats') -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.errors += other.errors
+        self.exceptions += other.exceptions
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Metrics:
+    """Wall time, calls, emitted errors and exceptions per checker class and per file, and run counters."""
+
+    def __init__(self):
+        self.checkers: Dict[str, Stats] = {}
+        self.files: Dict[str, Stats] = {}
+        self.counters: Dict[str, int] = {}
+
+    def record(self, checker_name: str, filename: str, seconds: float, errors: int, failed: bool) -> None:
+        for stats, key in ((self.checkers, checker_name), (self.files, filename)):
+            if key not in stats:
+                stats[key] = Stats()
+            stats[key].add(seconds, errors, failed)
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, other: 'Metrics') -> None:
+        for stats, other_stats in ((self.checkers, other.checkers), (self.files, other.files)):
+            for key, value in other_stats.items():
+                if key not in stats:
+                    stats[key] = Stats()
+                stats[key].merge(value)
+        for name, value in other.counters.items():
+            self.count(name, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'checkers': {name: stats.to_dict() for name, stats in sorted(self.checkers.items())},
+            'files': {name: stats.to_dict() for name, stats in sorted(self.files.items())},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Metrics':
+        metrics = cls()
+        metrics.checkers = {name: Stats(**stats) for name, stats in data['checkers'].items()}
+        metrics.files = {name: Stats(**stats) for name, stats in data['files'].items()}
+        metrics.counters = dict(data.get('counters', {}))
+        return metrics
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        for scope, label, stats in (('checker', 'checker', self.checkers), ('file', 'file', self.files)):
+            for field, help_text in (('seconds', 'Wall time spent'), ('calls', 'Number of checker calls'),
+                                     ('errors', 'Number of emitted errors'),
+                                     ('exceptions', 'Number of checker exceptions')):
+                name = f'vedro_allure_{scope}_{field}_total'
+                lines.append(f'# HELP {name} {help_text} per {scope}.')
+                lines.append(f'# TYPE {name} counter')
+                for key, value in sorted(stats.items()):
+                    lines.append(f'{name}{{{label}="{_escape_label(key)}"}} {getattr(value, field)}')
+        for counter, value in sorted(self.counters.items()):
+            name = f'vedro_allure_{counter}_total'
+            lines.append(f'# TYPE {name} counter')
+            lines.append(f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+METRICS_FORMATS = {
+    'json': Metrics.to_json,
+    'prometheus': Metrics.to_prometheus,
+}
+
+
+def write_metrics(metrics: Metrics, path: str, metrics_format: str = 'json') -> None:
+    with open(path, 'w') as f:
+        f.write(METRICS_FORMATS[metrics_format](metrics))
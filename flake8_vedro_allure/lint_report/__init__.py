@@ -0,0 +1,2 @@
+from .records import LintRecord, iter_lint_records, make_fingerprint, make_record
+from .writers import REPORT_WRITERS, NdjsonWriter, SarifWriter
@@ -0,0 +1,82 @@
+import ast
+import sys
+from typing import Dict, Optional
+
+from flake8.formatting.base import BaseFormatter
+from flake8.violation import Violation
+
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.facts import FileFacts
+from flake8_vedro_allure.visitors import ScenarioVisitor
+
+from .records import make_record
+from .writers import REPORT_WRITERS
+
+
+class _StreamingFormatter(BaseFormatter):
+    """
+    flake8 formatter writing every error as soon as flake8 reports it.
+
+    Allure ids for fingerprints are read from facts of the file, which is
+    parsed once when its first ALR error is reported. Facts are extracted
+    with the config of the plugin, so scenarios found by their bases get
+    the same fingerprints as in the standalone runner.
+    """
+
+    format_name = ''
+
+    def after_init(self) -> None:
+        self._writer = None
+        self._config: Optional[Config] = None
+        self._file_facts: Dict[str, Optional[FileFacts]] = {}
+
+    def start(self) -> None:
+        from flake8_vedro_allure.plugins import VedroAllurePlugin
+        super().start()
+        # flake8 parses options of plugins before the formatter starts
+        self._config = getattr(VedroAllurePlugin, 'config', None)
+        self._writer = REPORT_WRITERS[self.format_name](self.output_fd or sys.stdout, VedroAllurePlugin.version)
+
+    def beginning(self, filename: str) -> None:
+        self._file_facts = {}
+
+    def _get_file_facts(self, filename: str) -> Optional[FileFacts]:
+        if filename not in self._file_facts:
+            try:
+                with open(filename, 'rb') as f:
+                    tree = ast.parse(f.read(), filename)
+            except (OSError, SyntaxError, ValueError):
+                self._file_facts[filename] = None
+            else:
+                visitor = ScenarioVisitor(config=self._config, filename=filename, checkers=[])
+                visitor.visit(tree)
+                self._file_facts[filename] = visitor.file_facts
+        return self._file_facts[filename]
+
+    def handle(self, error: Violation) -> None:
+        file_facts = self._get_file_facts(error.filename) if error.code.startswith('ALR') else None
+        self._writer.write(make_record(error.filename, error.line_number, error.column_number - 1,
+                                       error.code, error.text, file_facts))
+
+    def format(self, error: Violation) -> Optional[str]:
+        return None
+
+    def show_statistics(self, statistics) -> None:
+        # anything else written to the output would break the log
+        pass
+
+    def show_benchmarks(self, benchmarks) -> None:
+        pass
+
+    def stop(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        super().stop()
+
+
+class SarifFormatter(_StreamingFormatter):
+    format_name = 'sarif'
+
+
+class NdjsonFormatter(_StreamingFormatter):
+    format_name = 'ndjson'
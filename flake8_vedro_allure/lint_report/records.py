@@ -0,0 +1,86 @@
+import hashlib
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional
+
+from flake8_vedro_allure.facts import FileFacts, ScenarioFacts
+
+if TYPE_CHECKING:
+    from flake8_vedro_allure.runner import LintError
+
+FINGERPRINT_VERSION = 'vedroAllure/v1'
+
+
+class LintRecord(NamedTuple):
+    path: str
+    lineno: int
+    column: int
+    code: str
+    message: str
+    allure_id: Optional[str]
+    fingerprint: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'line': self.lineno,
+            'column': self.column,
+            'code': self.code,
+            'message': self.message,
+            'allure_id': self.allure_id,
+            'fingerprint': self.fingerprint,
+        }
+
+
+def find_scenario(file_facts: Optional[FileFacts], lineno: int) -> Optional[ScenarioFacts]:
+    """Scenario an error on the line is reported for, errors are reported at class or decorator lines."""
+    if file_facts is None:
+        return None
+    for scenario in file_facts.scenarios:
+        positions = [scenario.labels_position, scenario.allure_id_position, *scenario.allure_id_calls,
+                     *(case[1:] for case in scenario.params_allure_ids)]
+        if scenario.lineno == lineno or any(position[0] == lineno for position in positions if position):
+            return scenario
+    return None
+
+
+def get_allure_id(scenario: Optional[ScenarioFacts], lineno: int) -> Optional[str]:
+    """Allure id of the @params case on the line, the id of the scenario otherwise."""
+    if scenario is None:
+        return None
+    for allure_id, case_lineno, _ in scenario.params_allure_ids:
+        if case_lineno == lineno:
+            return allure_id
+    return scenario.allure_id
+
+
+def make_fingerprint(code: str, path: str, scenario: Optional[ScenarioFacts], lineno: int) -> str:
+    """
+    Fingerprint of an error which doesn't change when lines of the file move.
+
+    It is made from the rule, the path and the allure id of the scenario
+    (or of its @params case on the line), or its class name if it has no id.
+    Errors outside scenarios only have their line.
+    """
+    allure_id = get_allure_id(scenario, lineno)
+    if scenario is None:
+        subject = f'line:{lineno}'
+    elif allure_id is not None:
+        subject = f'id:{allure_id}'
+    else:
+        subject = f'class:{scenario.name}'
+    return hashlib.sha256(f'{code}\0{path}\0{subject}'.encode()).hexdigest()
+
+
+def make_record(filename: str, lineno: int, col_offset: int, code: str, message: str,
+                file_facts: Optional[FileFacts] = None) -> LintRecord:
+    path = os.path.normpath(filename).replace(os.sep, '/')
+    scenario = find_scenario(file_facts, lineno)
+    return LintRecord(path, lineno, col_offset + 1, code, message, get_allure_id(scenario, lineno),
+                      make_fingerprint(code, path, scenario, lineno))
+
+
+def iter_lint_records(errors: Iterable['LintError'], file_facts: Mapping[str, FileFacts]) -> Iterator[LintRecord]:
+    """Records of runner errors, facts of their files give allure ids."""
+    for error in errors:
+        yield make_record(error.filename, error.lineno, error.col_offset, error.code, error.message,
+                          file_facts.get(error.filename))
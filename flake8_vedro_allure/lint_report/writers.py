@@ -0,0 +1,79 @@
+import json
+from typing import Any, Dict, List, TextIO
+
+from .records import FINGERPRINT_VERSION, LintRecord
+
+TOOL_NAME = 'flake8-vedro-allure'
+TOOL_URI = 'https://github.com/mytestopia/flake8-vedro-allure'
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+RULES = {
+    'ALR001': 'missing @allure_labels for scenario',
+    'ALR002': 'missing required allure tag',
+    'ALR003': 'duplication of unique allure tag',
+    'ALR004': 'missing allure.id() for scenario',
+    'ALR005': 'duplicate allure id detected in another scenario',
+}
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+class NdjsonWriter:
+    """Writes every record as a JSON line as soon as it is given."""
+
+    def __init__(self, output: TextIO, tool_version: str):
+        self.output = output
+
+    def write(self, record: LintRecord) -> None:
+        self.output.write(_dumps(record.to_dict()) + '\n')
+
+    def close(self) -> None:
+        self.output.flush()
+
+
+class SarifWriter:
+    """
+    Writes a SARIF 2.1.0 log with one run.
+
+    The log is written around the results array, so every result is written
+    as soon as it is given and results are never kept in memory.
+    """
+
+    def __init__(self, output: TextIO, tool_version: str):
+        self.output = output
+        self._count = 0
+        rules: List[Dict[str, Any]] = [
+            {'id': code, 'shortDescription': {'text': description}} for code, description in RULES.items()
+        ]
+        driver = {'name': TOOL_NAME, 'version': tool_version, 'informationUri': TOOL_URI, 'rules': rules}
+        head = _dumps({'$schema': SARIF_SCHEMA, 'version': '2.1.0', 'runs': [{'tool': {'driver': driver}}]})
+        # the log is closed with `]}]}` after the last result
+        self.output.write(head[:-3] + ',"results":[\n')
+
+    def write(self, record: LintRecord) -> None:
+        result = {
+            'ruleId': record.code,
+            'message': {'text': record.message},
+            'locations': [{
+                'physicalLocation': {
+                    'artifactLocation': {'uri': record.path},
+                    'region': {'startLine': record.lineno, 'startColumn': record.column},
+                },
+            }],
+            'partialFingerprints': {FINGERPRINT_VERSION: record.fingerprint},
+        }
+        if record.allure_id is not None:
+            result['properties'] = {'allureId': record.allure_id}
+        self.output.write((',\n' if self._count else '') + _dumps(result))
+        self._count += 1
+
+    def close(self) -> None:
+        self.output.write('\n]}]}\n')
+        self.output.flush()
+
+
+REPORT_WRITERS = {
+    'ndjson': NdjsonWriter,
+    'sarif': SarifWriter,
+}
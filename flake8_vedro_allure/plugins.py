@@ -1,17 +1,53 @@
 import argparse
 import ast
-from typing import Callable, List, Optional
+import logging
+import os
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
 
 from flake8.options.manager import OptionManager
-from flake8_plugin_utils import Plugin, Visitor
+from flake8_plugin_utils import Error, Plugin, Visitor
 
-from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors import Context, ScenarioVisitor
 
-from .config import Config
+from .codes import get_enabled_codes
+from .config import Config, str_to_bool
+from .errors import DuplicateAllureIdError
+from .facts import FileFacts
+from .id_manifest import (
+    ID_MANIFEST_ENV,
+    ID_MANIFEST_FORMATS,
+    get_process_id_manifest,
+    start_id_manifest_collection
+)
+from .instrumentation import (
+    METRICS_ENV,
+    METRICS_FORMATS,
+    get_process_metrics,
+    start_metrics_collection
+)
+from .prefilter import should_check_file
 
+if TYPE_CHECKING:
+    from .cache import ResultCache
 
-def str_to_bool(string):
-    return string.lower() in ('true', 'yes', 't', '1')
+LOG = logging.getLogger(__name__)
+
+
+def get_jobs(options: argparse.Namespace) -> int:
+    jobs = getattr(options, 'jobs', None)
+    if jobs is None:
+        return 1
+    return (os.cpu_count() or 1) if jobs.is_auto else jobs.n_jobs
+
+
+def get_checked_filenames(options: argparse.Namespace) -> List[str]:
+    from flake8.discover_files import expand_paths
+    return list(expand_paths(
+        paths=getattr(options, 'filenames', None) or ['.'],
+        stdin_display_name=getattr(options, 'stdin_display_name', 'stdin'),
+        filename_patterns=getattr(options, 'filename', ['*.py']),
+        exclude=(*getattr(options, 'exclude', ()), *getattr(options, 'extend_exclude', ())),
+    ))
 
 
 class PluginWithFilename(Plugin):
@@ -40,8 +76,115 @@ class VedroAllurePlugin(PluginWithFilename):
         ScenarioVisitor,
     ]
 
-    def __init__(self, tree: ast.AST, filename: str,  *args, **kwargs):
+    @classmethod
+    def _create_visitor(cls, visitor_cls: Callable, filename: Optional[str] = None) -> Visitor:
+        visitor = super()._create_visitor(visitor_cls, filename)
+        config = getattr(cls, 'config', None)
+        if config is not None and config.metrics_dir is not None:
+            visitor.metrics = get_process_metrics(config.metrics_dir)
+        return visitor
+
+    def __init__(self, tree: ast.AST, filename: str, lines: Optional[List[str]] = None, *args, **kwargs):
         super().__init__(tree, filename)
+        self.lines = lines
+
+    def _get_source(self) -> bytes:
+        if self.lines is not None:
+            return ''.join(self.lines).encode()
+        with open(self.filename, 'rb') as f:
+            return f.read()
+
+    def run(self):
+        config = getattr(self, 'config', None)
+        if config is None:
+            yield from super().run()
+            return
+
+        source = self._get_source()
+        if not should_check_file(self.filename, source, config):
+            LOG.debug('%s has no scenarios to check, skipped by prefilter', self.filename)
+            self._count(config, 'prefilter_skipped')
+            return
+
+        if config.cache_dir is None:
+            yield from self._check(config, source)
+            return
+
+        from .cache import get_result_cache
+        result_cache = get_result_cache(config.cache_dir)
+        key = result_cache.make_key(source, config, self.version, self._get_scenario_classes(config, source))
+        result = result_cache.get(key)
+        self._count_cache_access(config, result is not None)
+        if result is None:
+            yield from self._check(config, source, result_cache, key)
+            return
+
+        LOG.debug('%s errors are replayed from result cache', self.filename)
+        if config.id_manifest_dir is not None:
+            get_process_id_manifest(config.id_manifest_dir).add_file(self.filename, result.file_facts)
+        for lineno, col_offset, message in result.errors:
+            yield lineno, col_offset, message, self
+        for error in self._check_duplicates(config, result.file_facts):
+            yield self._error(error)
+
+    def _check(self, config: Config, source: bytes, result_cache: Optional['ResultCache'] = None,
+               result_key: Optional[str] = None):
+        visitor = self._create_visitor(ScenarioVisitor, filename=self.filename)
+        if config.cache_dir is None:
+            visitor.visit(self._tree)
+        else:
+            from .cache import get_facts_cache
+            facts_cache = get_facts_cache(config.cache_dir)
+            key = facts_cache.make_key(source, config, visitor.scenario_classes)
+            file_facts = facts_cache.get(key)
+            if file_facts is None:
+                visitor.visit(self._tree)
+                facts_cache.put(key, visitor.file_facts)
+            else:
+                visitor.check_file_facts(file_facts)
+
+        if config.id_manifest_dir is not None:
+            get_process_id_manifest(config.id_manifest_dir).add_file(self.filename, visitor.file_facts)
+
+        if result_cache is not None:
+            # duplicates depend on other files, they are checked again on every run
+            errors = [
+                (error.lineno, error.col_offset, f'{error.code} {error.message}')
+                for error in visitor.errors if error.code != DuplicateAllureIdError.code
+            ]
+            result_cache.put(result_key, errors, visitor.file_facts)
+
+        for error in visitor.errors:
+            yield self._error(error)
+
+    def _check_duplicates(self, config: Config, file_facts: FileFacts) -> List[Error]:
+        if not config.is_code_enabled(DuplicateAllureIdError.code):
+            return []
+        checkers = [
+            checker for checker in ScenarioVisitor.get_checker_plan(config.enabled_codes)
+            if DuplicateAllureIdError.code in checker.error_codes
+        ]
+        return [
+            error
+            for facts in file_facts.scenarios
+            for checker in checkers
+            for error in checker.check_scenario(Context(facts=facts, filename=self.filename), config)
+        ]
+
+    def _get_scenario_classes(self, config: Config, source: bytes) -> Sequence[str]:
+        if not config.scenario_base_paths:
+            return ()
+        from .class_index import get_scenario_classes
+        return get_scenario_classes(config, self.filename, source)
+
+    @staticmethod
+    def _count(config: Config, name: str) -> None:
+        if config.metrics_dir is not None:
+            get_process_metrics(config.metrics_dir).count(name)
+
+    @classmethod
+    def _count_cache_access(cls, config: Config, is_hit: bool) -> None:
+        cls._count(config, 'result_cache_hits' if is_hit else 'result_cache_misses')
 
     @classmethod
     def add_options(cls, option_manager: OptionManager):
@@ -71,15 +214,114 @@ class VedroAllurePlugin(PluginWithFilename):
             parse_from_config=True,
             help='If allure.id() decorator is required for every test',
         )
-
+        option_manager.add_option(
+            '--vedro-allure-cache-dir',
+            parse_from_config=True,
+            help='Directory for cache of scenario facts and errors, unchanged files are not checked again',
+        )
+        option_manager.add_option(
+            '--scenarios-folder-only',
+            type=str,
+            default='false',
+            parse_from_config=True,
+            help='If only files inside "scenarios" folder should be checked',
+        )
+        option_manager.add_option(
+            '--scenario-base-paths',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Directories with base classes of scenarios, classes of any checked file inheriting '
+                 'vedro.Scenario through them are checked as scenarios whatever their names are',
+        )
+        option_manager.add_option(
+            '--vedro-allure-metrics',
+            parse_from_config=True,
+            help=f'File for per checker and per file timings and counters, ${METRICS_ENV} by default',
+        )
+        option_manager.add_option(
+            '--vedro-allure-metrics-format',
+            default='json',
+            choices=sorted(METRICS_FORMATS),
+            parse_from_config=True,
+            help='Format of metrics file',
+        )
+        option_manager.add_option(
+            '--vedro-allure-id-manifest',
+            parse_from_config=True,
+            help=f'File for manifest of allure ids with their scenarios, ${ID_MANIFEST_ENV} by default',
+        )
+        option_manager.add_option(
+            '--vedro-allure-id-manifest-format',
+            default='ndjson',
+            choices=sorted(ID_MANIFEST_FORMATS),
+            parse_from_config=True,
+            help='Format of allure id manifest',
+        )
 
     @classmethod
     def parse_options_to_config(
         cls, option_manager: OptionManager, options: argparse.Namespace, args: List[str]
     ) -> Config:
-        return Config(
-            is_allure_labels_optional=str_to_bool(options.is_allure_labels_optional),
+        is_allure_id_required = str_to_bool(options.is_allure_id_required)
+        enabled_codes = get_enabled_codes(ScenarioVisitor.get_error_codes(), options)
+
+        allure_id_index_path = None
+        should_prescan = is_allure_id_required and DuplicateAllureIdError.code in enabled_codes
+        # a single process keeps ids in the in-memory index of the checker, workers share a SQLite index
+        if should_prescan and get_jobs(options) > 1:
+            from .id_index import get_run_index_path
+            allure_id_index_path, should_prescan = get_run_index_path()
+
+        cache_dir = options.vedro_allure_cache_dir
+        if cache_dir is not None:
+            from .cache import get_facts_cache, get_result_cache
+            get_facts_cache(cache_dir)
+            get_result_cache(cache_dir)
+
+        metrics_path = options.vedro_allure_metrics or os.environ.get(METRICS_ENV)
+        metrics_dir = None
+        if metrics_path:
+            metrics_dir = start_metrics_collection(metrics_path, options.vedro_allure_metrics_format)
+
+        id_manifest_path = options.vedro_allure_id_manifest or os.environ.get(ID_MANIFEST_ENV)
+        id_manifest_dir = None
+        if id_manifest_path:
+            id_manifest_dir = start_id_manifest_collection(id_manifest_path,
+                                                           options.vedro_allure_id_manifest_format)
+
+        config = Config(
+            is_allure_labels_optional=options.is_allure_labels_optional,
             required_allure_labels=options.required_allure_labels,
             unique_allure_labels=options.unique_allure_labels,
-            is_allure_id_required=str_to_bool(options.is_allure_id_required)
+            is_allure_id_required=is_allure_id_required,
+            allure_id_index_path=allure_id_index_path,
+            cache_dir=cache_dir,
+            is_scenarios_folder_only=options.scenarios_folder_only,
+            metrics_dir=metrics_dir,
+            enabled_codes=enabled_codes,
+            id_manifest_dir=id_manifest_dir,
+            scenario_base_paths=options.scenario_base_paths
         )
+        if config.scenario_base_paths:
+            # workers inherit the index, so base modules are read once per run
+            from .class_index import get_class_index
+            get_class_index(config)
+        if should_prescan:
+            # files are checked after options are parsed, ids of all files are known before any is checked
+            cls._prescan_allure_ids(config, options)
+        return config
+
+    @staticmethod
+    def _prescan_allure_ids(config: Config, options: argparse.Namespace) -> None:
+        from .prescan import prescan_allure_ids
+        filenames = get_checked_filenames(options)
+        if config.allure_id_index_path is not None:
+            from .id_index import SqliteAllureIdIndex
+            index = SqliteAllureIdIndex(config.allure_id_index_path)
+            prescan_allure_ids(filenames, config, index, get_jobs(options))
+            index.close()
+            return
+        for checker in ScenarioVisitor.get_checker_plan(config.enabled_codes):
+            if DuplicateAllureIdError.code in checker.error_codes:
+                checker.reset_checker()
+                prescan_allure_ids(filenames, config, checker.get_allure_id_index(config))
@@ -0,0 +1,39 @@
+import os
+import re
+
+from flake8_vedro_allure.abstract_checkers.scenario_helper import (
+    SCENARIOS_FOLDER
+)
+from flake8_vedro_allure.config import Config
+
+SCENARIO_CLASS_RE = re.compile(rb'\bclass\s+Scenario\b')
+
+
+def is_in_scenarios_folder(filename: str) -> bool:
+    return SCENARIOS_FOLDER in os.path.normpath(filename).split(os.sep)[:-1]
+
+
+def might_have_errors(source: bytes, config: Config, has_scenario_subclasses: bool = False) -> bool:
+    """
+    Cheap byte search telling if the file can produce any ALR error.
+
+    False negatives are impossible: files without scenarios are never checked,
+    and files without allure mentions can only fail ALR001 and ALR004.
+    """
+    if not has_scenario_subclasses and (b'Scenario' not in source or not SCENARIO_CLASS_RE.search(source)):
+        return False
+    if b'allure' not in source:
+        return not config.is_allure_labels_optional or config.is_allure_id_required
+    return True
+
+
+def should_check_file(filename: str, source: bytes, config: Config) -> bool:
+    if config.is_scenarios_folder_only and not is_in_scenarios_folder(filename):
+        return False
+    if not config.scenario_base_paths:
+        return might_have_errors(source, config)
+    if not might_have_errors(source, config, has_scenario_subclasses=True):
+        return False
+    # only the class index knows scenarios which are not named Scenario
+    from flake8_vedro_allure.class_index import get_scenario_classes
+    return bool(SCENARIO_CLASS_RE.search(source) or get_scenario_classes(config, filename, source))
@@ -0,0 +1,73 @@
+import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Sequence
+
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.facts import FileFacts
+from flake8_vedro_allure.id_index import AllureIdIndex
+from flake8_vedro_allure.id_index.base import Occurrence
+from flake8_vedro_allure.prefilter import should_check_file
+from flake8_vedro_allure.visitors import ScenarioVisitor
+
+PRESCAN_BATCH_SIZE = 256
+
+
+def extract_file_facts(filename: str, source: bytes, config: Config) -> Optional[FileFacts]:
+    """Facts of the file from the facts cache or a visit without checkers, None for invalid syntax."""
+    visitor = ScenarioVisitor(config=config, filename=filename, checkers=[])
+    facts_cache = None
+    if config.cache_dir is not None:
+        from flake8_vedro_allure.cache import get_facts_cache
+        facts_cache = get_facts_cache(config.cache_dir)
+        key = facts_cache.make_key(source, config, visitor.scenario_classes)
+        file_facts = facts_cache.get(key)
+        if file_facts is not None:
+            return file_facts
+
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError):
+        return None
+    visitor.visit(tree)
+    if facts_cache is not None:
+        facts_cache.put(key, visitor.file_facts)
+    return visitor.file_facts
+
+
+def collect_occurrences(filenames: Sequence[str], config: Config) -> List[Occurrence]:
+    occurrences = []
+    for filename in filenames:
+        try:
+            with open(filename, 'rb') as f:
+                source = f.read()
+        except OSError:
+            continue
+        if not should_check_file(filename, source, config):
+            continue
+        file_facts = extract_file_facts(filename, source, config)
+        if file_facts is None:
+            continue
+        occurrences.extend(
+            (allure_id, filename, lineno)
+            for scenario in file_facts.scenarios for allure_id, lineno, *_ in scenario.iter_allure_ids()
+        )
+    return occurrences
+
+
+def prescan_allure_ids(filenames: Sequence[str], config: Config, index: AllureIdIndex, jobs: int = 1) -> None:
+    """
+    First phase of duplicate detection: add allure ids of all files to the index.
+
+    It runs before any file is checked, so owners of ids are final when
+    checkers look them up, whatever order workers check files in.
+    """
+    if jobs <= 1 or len(filenames) <= PRESCAN_BATCH_SIZE:
+        index.add_many(collect_occurrences(filenames, config))
+        return
+
+    batches = [filenames[i:i + PRESCAN_BATCH_SIZE] for i in range(0, len(filenames), PRESCAN_BATCH_SIZE)]
+    with ProcessPoolExecutor(min(jobs, os.cpu_count() or 1)) as executor:
+        for occurrences in executor.map(collect_occurrences, batches, repeat(config)):
+            index.add_many(occurrences)
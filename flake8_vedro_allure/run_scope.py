@@ -0,0 +1,28 @@
+import atexit
+import os
+from typing import Callable, Tuple
+
+
+def _cleanup_if_owner(cleanup: Callable[[str], None], path: str, owner_pid: int) -> None:
+    if os.getpid() == owner_pid:
+        cleanup(path)
+
+
+def get_run_scoped_path(env_name: str, create: Callable[[], str],
+                        cleanup: Callable[[str], None]) -> Tuple[str, bool]:
+    """
+    Return a temporary path shared by all processes of the current run.
+
+    flake8 workers are either forked or spawned from the process which parsed
+    options first, the path reaches spawned ones through the environment.
+    The second value tells if the current process owns the path.
+    """
+    value = os.environ.get(env_name)
+    if value is not None:
+        owner_pid, path = value.split(':', 1)
+        return path, int(owner_pid) == os.getpid()
+
+    path = create()
+    os.environ[env_name] = f'{os.getpid()}:{path}'
+    atexit.register(_cleanup_if_owner, cleanup, path, os.getpid())
+    return path, True
@@ -0,0 +1,2 @@
+from .batch import FileReport, LintError, lint_file, lint_files, lint_source
+from .walker import iter_python_files
@@ -0,0 +1,221 @@
+import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar
+)
+
+from flake8_vedro_allure.abstract_checkers import ScenarioChecker
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.errors import DuplicateAllureIdError
+from flake8_vedro_allure.facts import FileFacts, TokenFactsExtractor
+from flake8_vedro_allure.instrumentation import Metrics
+from flake8_vedro_allure.prefilter import should_check_file
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    DuplicateAllureIdChecker
+)
+
+if TYPE_CHECKING:
+    from flake8_vedro_allure.id_manifest import AllureIdRecord
+
+DEFAULT_BATCH_SIZE = 64
+
+T = TypeVar('T')
+
+
+class LintError(NamedTuple):
+    filename: str
+    lineno: int
+    col_offset: int
+    code: str
+    message: str
+
+
+class FileReport(NamedTuple):
+    filename: str
+    errors: List[LintError]
+    file_facts: FileFacts
+    skipped: bool = False
+    metrics: Optional[Metrics] = None
+    # file with the same content the report was copied from
+    duplicate_of: Optional[str] = None
+
+
+def _local_checkers(config: Config) -> List[ScenarioChecker]:
+    # Duplicates can only be found once facts of all files are collected
+    return [
+        checker for checker in ScenarioVisitor.get_checker_plan(config.enabled_codes)
+        if not isinstance(checker, DuplicateAllureIdChecker)
+    ]
+
+
+def lint_file(filename: str, config: Config, collect_metrics: bool = False,
+              checkers: Optional[List[ScenarioChecker]] = None) -> FileReport:
+    try:
+        with open(filename, 'rb') as f:
+            source = f.read()
+    except OSError as e:
+        # reported like flake8 reports files it can't read
+        error = LintError(filename, 1, 0, 'E902', f'{type(e).__name__}: {e}')
+        return FileReport(filename, [error], FileFacts())
+    return lint_source(filename, source, config, collect_metrics, checkers)
+
+
+def lint_source(filename: str, source: bytes, config: Config, collect_metrics: bool = False,
+                checkers: Optional[List[ScenarioChecker]] = None) -> FileReport:
+    """
+    Lint source of the file with every checker except ALR005, which needs all files.
+
+    With `tokens` facts extractor the source is parsed only if the scanner
+    can't read it, so syntax errors (E999) are reported only then. The
+    scanner knows only classes named Scenario, so scenarios found by their
+    bases are always read from ast.
+    """
+    if not should_check_file(filename, source, config):
+        return FileReport(filename, [], FileFacts(), skipped=True)
+
+    if checkers is None:
+        checkers = _local_checkers(config)
+    visitor = ScenarioVisitor(config=config, filename=filename, checkers=checkers,
+                              metrics=Metrics() if collect_metrics else None)
+    file_facts = None
+    if config.facts_extractor == 'tokens' and not config.scenario_base_paths:
+        file_facts = TokenFactsExtractor().extract_file_facts(source)
+    if file_facts is not None:
+        visitor.check_file_facts(file_facts)
+        return _report(filename, visitor, file_facts)
+
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError) as e:
+        # ValueError is raised for sources with null bytes
+        if isinstance(e, SyntaxError):
+            error = LintError(filename, e.lineno or 1, max((e.offset or 1) - 1, 0),
+                              'E999', f'SyntaxError: {e.msg}')
+        else:
+            error = LintError(filename, 1, 0, 'E999', f'{type(e).__name__}: {e}')
+        return FileReport(filename, [error], FileFacts())
+
+    visitor.visit(tree)
+    return _report(filename, visitor, visitor.file_facts)
+
+
+def _report(filename: str, visitor: ScenarioVisitor, file_facts: FileFacts) -> FileReport:
+    errors = [
+        LintError(filename, error.lineno, error.col_offset, error.code, error.message)
+        for error in visitor.errors
+    ]
+    return FileReport(filename, errors, file_facts, metrics=visitor.metrics)
+
+
+def lint_batch(filenames: Sequence[str], config: Config, collect_metrics: bool = False) -> List[FileReport]:
+    return [lint_file(filename, config, collect_metrics) for filename in filenames]
+
+
+def check_duplicates(reports: Sequence[FileReport], config: Config, metrics: Optional[Metrics] = None,
+                     baseline: Sequence['AllureIdRecord'] = (),
+                     checker: Optional[DuplicateAllureIdChecker] = None) -> List[LintError]:
+    """
+    Find duplicate allure ids of reported files in two phases.
+
+    Ids of all reports and of baseline files which were not linted in this run
+    are added to the index first, then every scenario is checked against the
+    final owner of its id.
+    """
+    if not config.is_code_enabled(DuplicateAllureIdError.code):
+        return []
+
+    checker = checker or DuplicateAllureIdChecker()
+    checker.reset_checker()
+    allure_ids = checker.get_allure_id_index(config)
+    allure_ids.add_many((record.allure_id, record.path, record.lineno) for record in baseline)
+    allure_ids.add_many(
+        (allure_id, report.filename, lineno)
+        for report in reports for scenario in report.file_facts.scenarios
+        for allure_id, lineno, *_ in scenario.iter_allure_ids()
+    )
+
+    errors = []
+    for report in reports:
+        visitor = ScenarioVisitor(config=config, filename=report.filename, checkers=[checker],
+                                  metrics=metrics)
+        visitor.check_file_facts(report.file_facts)
+        errors.extend(
+            LintError(report.filename, error.lineno, error.col_offset, error.code, error.message)
+            for error in visitor.errors
+        )
+    return errors
+
+
+def collect_reports(filenames: Sequence[str], config: Config, jobs: Optional[int] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE, collect_metrics: bool = False,
+                    dedup: bool = True) -> List[FileReport]:
+    """
+    Lint files in worker processes, byte-identical files are linted once.
+
+    Files are hashed by the same workers before linting. Reports of identical
+    files share facts of the linted one, so their allure ids are still found
+    as duplicates of each other (ALR005).
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(filenames) <= batch_size:
+        return _collect_reports(filenames, config, None, batch_size, collect_metrics, dedup)
+    with ProcessPoolExecutor(jobs) as executor:
+        return _collect_reports(filenames, config, executor, batch_size, collect_metrics, dedup)
+
+
+def _collect_reports(filenames: Sequence[str], config: Config, executor: Optional[ProcessPoolExecutor],
+                     batch_size: int, collect_metrics: bool, dedup: bool) -> List[FileReport]:
+    if not dedup:
+        return _map_batches(executor, lint_batch, filenames, batch_size, config, collect_metrics)
+
+    from .dedup import content_keys, fan_out_reports, group_identical_files
+    groups = group_identical_files(filenames, _map_batches(executor, content_keys, filenames, batch_size, config))
+    reports = _map_batches(executor, lint_batch, [group[0] for group in groups], batch_size, config, collect_metrics)
+    by_filename = {report.filename: report for report in fan_out_reports(reports, groups)}
+    return [by_filename[filename] for filename in filenames]
+
+
+def _map_batches(executor: Optional[ProcessPoolExecutor], function: Callable[..., List[T]],
+                 filenames: Sequence[str], batch_size: int, *args: Any) -> List[T]:
+    if executor is None or len(filenames) <= batch_size:
+        return function(filenames, *args)
+
+    batches = [filenames[i:i + batch_size] for i in range(0, len(filenames), batch_size)]
+    results: List[T] = []
+    for batch_results in executor.map(function, batches, *map(repeat, args)):
+        results.extend(batch_results)
+    return results
+
+
+def merge_metrics(reports: Sequence[FileReport]) -> Metrics:
+    metrics = Metrics()
+    for report in reports:
+        if report.metrics is not None:
+            metrics.merge(report.metrics)
+        if report.duplicate_of is not None:
+            metrics.count('identical_files')
+        elif report.skipped:
+            metrics.count('prefilter_skipped')
+    return metrics
+
+
+def merge_errors(reports: Sequence[FileReport], config: Config, metrics: Optional[Metrics] = None,
+                 baseline: Sequence['AllureIdRecord'] = ()) -> List[LintError]:
+    errors = [error for report in reports for error in report.errors]
+    errors.extend(check_duplicates(reports, config, metrics, baseline))
+    return sorted(errors)
+
+
+def lint_files(filenames: Sequence[str], config: Config, jobs: Optional[int] = None,
+               batch_size: int = DEFAULT_BATCH_SIZE, dedup: bool = True) -> List[LintError]:
+    return merge_errors(collect_reports(filenames, config, jobs, batch_size, dedup=dedup), config)
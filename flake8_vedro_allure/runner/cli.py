@@ -0,0 +1,260 @@
+import argparse
+import configparser
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from flake8_vedro_allure.autofix.allocator import (
+    IdRange,
+    parse_directory_ranges,
+    parse_id_range
+)
+from flake8_vedro_allure.class_index import get_class_index
+from flake8_vedro_allure.codes import (
+    get_enabled_codes,
+    make_selection_options
+)
+from flake8_vedro_allure.config import FACTS_EXTRACTORS, Config
+from flake8_vedro_allure.id_index import write_shard
+from flake8_vedro_allure.id_manifest import (
+    ID_MANIFEST_ENV,
+    ID_MANIFEST_FORMATS,
+    AllureIdRecord,
+    iter_id_records,
+    write_id_manifest
+)
+from flake8_vedro_allure.instrumentation import (
+    METRICS_ENV,
+    METRICS_FORMATS,
+    write_metrics
+)
+from flake8_vedro_allure.visitors import ScenarioVisitor
+
+from . import merge_index
+from .batch import (
+    DEFAULT_BATCH_SIZE,
+    FileReport,
+    collect_reports,
+    merge_errors,
+    merge_metrics
+)
+from .incremental import (
+    git_changed_files,
+    load_baseline,
+    read_changed_list,
+    unchanged_records,
+    update_baseline,
+    walk_files
+)
+from .reporters import REPORTERS
+from .walker import DEFAULT_EXCLUDE
+
+CONFIG_FILES = ('setup.cfg', 'tox.ini', '.flake8')
+CONFIG_OPTIONS = ('is_allure_labels_optional', 'required_allure_labels', 'unique_allure_labels',
+                  'is_allure_id_required', 'scenarios_folder_only', 'exclude',
+                  'select', 'ignore', 'extend_select', 'extend_ignore', 'facts_extractor',
+                  'scenario_base_paths', 'fix_id_range', 'fix_id_ranges')
+
+
+def split_list(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [item.strip() for item in value.replace('\n', ',').split(',') if item.strip()]
+
+
+def load_flake8_config(path: Optional[str] = None) -> Dict[str, str]:
+    for candidate in ([path] if path else CONFIG_FILES):
+        parser = configparser.RawConfigParser()
+        parser.read(candidate)
+        if parser.has_section('flake8'):
+            return {key.replace('-', '_'): value for key, value in parser.items('flake8')}
+    return {}
+
+
+def _parse_id_range(value: str) -> IdRange:
+    try:
+        return parse_id_range(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _parse_directory_ranges(value: str) -> List[Tuple[str, IdRange]]:
+    try:
+        return parse_directory_ranges(split_list(value))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='vedro-allure-lint',
+        description='Check vedro scenarios with ALR rules without flake8 startup',
+    )
+    parser.add_argument('paths', nargs='*', default=['.'])
+    parser.add_argument('--config', help='Config file with [flake8] section, '
+                                         'setup.cfg, tox.ini or .flake8 by default')
+    parser.add_argument('--is-allure-labels-optional', default='true')
+    parser.add_argument('--required-allure-labels')
+    parser.add_argument('--unique-allure-labels')
+    parser.add_argument('--is-allure-id-required', default='false')
+    parser.add_argument('--scenarios-folder-only', default='false')
+    parser.add_argument('--select')
+    parser.add_argument('--ignore')
+    parser.add_argument('--extend-select')
+    parser.add_argument('--extend-ignore')
+    parser.add_argument('--scenario-base-paths',
+                        help='Directories with base classes of scenarios, classes of any checked file inheriting '
+                             'vedro.Scenario through them are checked as scenarios whatever their names are')
+    parser.add_argument('--exclude', default=','.join(DEFAULT_EXCLUDE))
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes, CPU count by default')
+    parser.add_argument('--facts-extractor', choices=FACTS_EXTRACTORS, default='ast',
+                        help='"tokens" reads scenarios without building ast, ambiguous files are parsed anyway')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Number of files sent to a worker at once')
+    parser.add_argument('--no-dedup', dest='dedup', action='store_false',
+                        help='Lint byte-identical files separately instead of once per content')
+    parser.add_argument('--format', choices=sorted(REPORTERS), default='text')
+    parser.add_argument('--metrics', default=os.environ.get(METRICS_ENV),
+                        help=f'File for per checker and per file timings and counters, ${METRICS_ENV} by default')
+    parser.add_argument('--metrics-format', choices=sorted(METRICS_FORMATS), default='json')
+    parser.add_argument('--id-manifest', default=os.environ.get(ID_MANIFEST_ENV),
+                        help=f'File for manifest of allure ids with their scenarios, ${ID_MANIFEST_ENV} by default')
+    parser.add_argument('--id-manifest-format', choices=sorted(ID_MANIFEST_FORMATS), default='ndjson')
+    parser.add_argument('--baseline',
+                        help='NDJSON allure id manifest of the whole repo, ids of files which are not linted '
+                             'in this run are taken from it for ALR005')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Write ids of linted files to baseline and drop ids of deleted and renamed files')
+    changed = parser.add_mutually_exclusive_group()
+    changed.add_argument('--changed', metavar='FILE',
+                         help='Lint only files listed in FILE one per line, "-" reads stdin')
+    changed.add_argument('--diff-ref', metavar='REF',
+                         help='Lint only files changed against git REF')
+    parser.add_argument('--id-index-shard', metavar='FILE',
+                        help='File for allure ids of linted files, shards of several runs are checked for '
+                             'duplicates with "vedro-allure-lint merge-index"')
+    parser.add_argument('--fix', action='store_true',
+                        help='Add @allure.id() with a free id to scenarios reported with ALR004')
+    parser.add_argument('--fix-id-range', metavar='START-END', type=_parse_id_range,
+                        help='Ids for --fix, above the highest used id by default')
+    parser.add_argument('--fix-id-ranges', metavar='DIR=START-END', type=_parse_directory_ranges, default=[],
+                        help='Ids for --fix of scenarios in directories, comma separated')
+    parser.add_argument('--statistics', action='store_true',
+                        help='Print number of checked and skipped files to stderr')
+    return parser
+
+
+def parse_args(argv: Optional[Sequence[str]] = None,
+               parser: Optional[argparse.ArgumentParser] = None) -> argparse.Namespace:
+    parser = parser or create_parser()
+    options, _ = parser.parse_known_args(argv)
+    flake8_config = load_flake8_config(options.config)
+    parser.set_defaults(**{
+        key: value for key, value in flake8_config.items() if key in CONFIG_OPTIONS
+    })
+    return parser.parse_args(argv)
+
+
+def config_from_options(options: argparse.Namespace) -> Config:
+    selection_options = make_selection_options(
+        select=split_list(options.select) if options.select is not None else None,
+        ignore=split_list(options.ignore) if options.ignore is not None else None,
+        extend_select=split_list(options.extend_select),
+        extend_ignore=split_list(options.extend_ignore),
+    )
+    return Config(
+        is_allure_labels_optional=options.is_allure_labels_optional,
+        required_allure_labels=split_list(options.required_allure_labels),
+        unique_allure_labels=split_list(options.unique_allure_labels),
+        is_allure_id_required=options.is_allure_id_required,
+        is_scenarios_folder_only=options.scenarios_folder_only,
+        enabled_codes=get_enabled_codes(ScenarioVisitor.get_error_codes(), selection_options),
+        facts_extractor=options.facts_extractor,
+        scenario_base_paths=split_list(options.scenario_base_paths),
+    )
+
+
+def fix_missing_ids(reports: List[FileReport], baseline: Sequence[AllureIdRecord], options: argparse.Namespace,
+                    config: Config) -> List[FileReport]:
+    """Add free allure ids to scenarios without them, fixed files are linted again."""
+    from flake8_vedro_allure.autofix import apply_fixes, plan_fixes
+
+    try:
+        fixes, unassigned = plan_fixes(reports, options.fix_id_range, options.fix_id_ranges, baseline)
+    except ValueError as e:
+        sys.stderr.write(f'not fixed: {e}\n')
+        return reports
+    results = apply_fixes(fixes, jobs=options.jobs)
+    fixed = {result.filename for result in results if result.error is None}
+    for result in results:
+        if result.error is not None:
+            sys.stderr.write(f'{result.filename}: not fixed: {result.error}\n')
+    sys.stderr.write(f'fixed scenarios: {sum(result.fixed for result in results)}, files: {len(fixed)}\n')
+    if unassigned:
+        sys.stderr.write(f'no free allure ids left for {unassigned} scenarios\n')
+    if not fixed:
+        return reports
+
+    relinted = collect_reports([report.filename for report in reports if report.filename in fixed], config,
+                               jobs=options.jobs, batch_size=options.batch_size,
+                               collect_metrics=options.metrics is not None, dedup=options.dedup)
+    reports_by_filename = {report.filename: report for report in relinted}
+    return [reports_by_filename.get(report.filename, report) for report in reports]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ['merge-index']:
+        return merge_index.main(argv[1:])
+
+    options = parse_args(argv)
+    config = config_from_options(options)
+    if config.scenario_base_paths:
+        # forked workers inherit the index
+        get_class_index(config)
+
+    exclude = split_list(options.exclude)
+    baseline = load_baseline(options.baseline) if options.baseline is not None else []
+    if options.changed is not None:
+        changed_files = read_changed_list(options.changed, options.paths, exclude)
+    elif options.diff_ref is not None:
+        changed_files = git_changed_files(options.diff_ref, options.paths, exclude)
+    else:
+        changed_files = walk_files(options.paths, exclude, baseline)
+    filenames = changed_files.changed
+    if options.baseline is not None:
+        # baseline paths are normalized, linted ones have to be comparable with them
+        filenames = [os.path.normpath(filename) for filename in filenames]
+
+    collect_metrics = options.metrics is not None
+    reports = collect_reports(filenames, config, jobs=options.jobs, batch_size=options.batch_size,
+                              collect_metrics=collect_metrics, dedup=options.dedup)
+    if options.baseline is not None:
+        baseline = unchanged_records(baseline, changed_files.removed, reports)
+    if options.fix:
+        reports = fix_missing_ids(reports, baseline, options, config)
+    metrics = merge_metrics(reports) if collect_metrics else None
+    errors = merge_errors(reports, config, metrics, baseline)
+
+    REPORTERS[options.format](errors, sys.stdout, {report.filename: report.file_facts for report in reports})
+    if metrics is not None:
+        write_metrics(metrics, options.metrics, options.metrics_format)
+    if options.id_manifest is not None:
+        records = (
+            record
+            for report in sorted(reports, key=lambda report: os.path.normpath(report.filename))
+            for record in iter_id_records(report.filename, report.file_facts)
+        )
+        write_id_manifest(records, options.id_manifest, options.id_manifest_format)
+    if options.id_index_shard is not None:
+        write_shard(merge_index.iter_shard_entries(reports), options.id_index_shard)
+    if options.baseline is not None and options.update_baseline:
+        update_baseline(options.baseline, baseline, reports)
+    if options.statistics:
+        skipped = sum(report.skipped for report in reports)
+        identical = sum(report.duplicate_of is not None for report in reports)
+        statistics = f'files: {len(reports)}, checked: {len(reports) - skipped}, skipped by prefilter: {skipped}'
+        if identical:
+            statistics += f', identical to other files: {identical}'
+        sys.stderr.write(statistics + '\n')
+    return 1 if errors else 0
@@ -0,0 +1,58 @@
+import hashlib
+from typing import TYPE_CHECKING, Dict, Hashable, List, Sequence, Tuple
+
+from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.prefilter import is_in_scenarios_folder
+
+if TYPE_CHECKING:
+    from .batch import FileReport
+
+
+def _content_key(filename: str, source: bytes, config: Config) -> Tuple[Hashable, ...]:
+    # the same source is linted differently only if its path changes the prefilter or scenario classes
+    key: Tuple[Hashable, ...] = (hashlib.sha256(source).digest(),)
+    if config.is_scenarios_folder_only:
+        key += (is_in_scenarios_folder(filename),)
+    if config.scenario_base_paths:
+        from flake8_vedro_allure.class_index import get_scenario_classes
+        key += (tuple(get_scenario_classes(config, filename, source)),)
+    return key
+
+
+def content_keys(filenames: Sequence[str], config: Config) -> List[Hashable]:
+    """
+    Keys of files by content, computed in workers along with linting.
+
+    Unreadable files are keyed by their names, so their errors are raised when they are linted.
+    """
+    keys: List[Hashable] = []
+    for filename in filenames:
+        try:
+            with open(filename, 'rb') as f:
+                keys.append(_content_key(filename, f.read(), config))
+        except OSError:
+            keys.append(filename)
+    return keys
+
+
+def group_identical_files(filenames: Sequence[str], keys: Sequence[Hashable]) -> List[List[str]]:
+    """Group files by content keys, the first file of every group is linted for all of them."""
+    groups: Dict[Hashable, List[str]] = {}
+    for filename, key in zip(filenames, keys):
+        groups.setdefault(key, []).append(filename)
+    return list(groups.values())
+
+
+def copy_report(report: 'FileReport', filename: str) -> 'FileReport':
+    """Report of a file identical to the reported one, facts are shared and checkers are not run again."""
+    errors = [error._replace(filename=filename) for error in report.errors]
+    return report._replace(filename=filename, errors=errors, metrics=None, duplicate_of=report.filename)
+
+
+def fan_out_reports(reports: Sequence['FileReport'], groups: Sequence[Sequence[str]]) -> List['FileReport']:
+    """Reports of all grouped files in the order of groups, reports are the ones of first files."""
+    return [
+        report if index == 0 else copy_report(report, filename)
+        for report, group in zip(reports, groups)
+        for index, filename in enumerate(group)
+    ]
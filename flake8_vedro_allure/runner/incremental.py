@@ -0,0 +1,106 @@
+import os
+import subprocess
+import sys
+from typing import Iterable, List, NamedTuple, Sequence, Set
+
+from flake8_vedro_allure.id_manifest import (
+    AllureIdRecord,
+    iter_id_records,
+    read_id_manifest,
+    write_id_manifest
+)
+
+from .batch import FileReport
+from .walker import is_excluded, iter_python_files
+
+
+class ChangedFiles(NamedTuple):
+    # existing files which have to be linted
+    changed: List[str]
+    # paths whose allure ids have to be dropped from the baseline
+    removed: Set[str]
+
+
+def is_under(path: str, roots: Sequence[str]) -> bool:
+    path = os.path.normpath(path)
+    for root in roots:
+        root = os.path.normpath(root)
+        if root == os.curdir or path == root or path.startswith(root + os.sep):
+            return True
+    return False
+
+
+def _select(paths: Iterable[str], removed: Set[str], roots: Sequence[str],
+            exclude: Sequence[str]) -> ChangedFiles:
+    changed = []
+    for path in paths:
+        path = os.path.normpath(path)
+        if not path.endswith('.py') or not is_under(path, roots) or is_excluded(path, exclude):
+            continue
+        if os.path.isfile(path):
+            changed.append(path)
+        else:
+            removed.add(path)
+    return ChangedFiles(sorted(set(changed)), removed)
+
+
+def walk_files(roots: Sequence[str], exclude: Sequence[str], baseline: Iterable[AllureIdRecord]) -> ChangedFiles:
+    """All files under roots, baseline paths under them which were not found are deleted ones."""
+    changed = list(iter_python_files(roots, exclude))
+    found = {os.path.normpath(path) for path in changed}
+    removed = {
+        record.path for record in baseline
+        if record.path not in found and is_under(record.path, roots) and not is_excluded(record.path, exclude)
+    }
+    return ChangedFiles(changed, removed)
+
+
+def read_changed_list(list_path: str, roots: Sequence[str], exclude: Sequence[str]) -> ChangedFiles:
+    """Paths listed one per line, `-` reads stdin. Listed paths which don't exist are deleted ones."""
+    if list_path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(list_path) as f:
+            lines = f.read().splitlines()
+    return _select((line.strip() for line in lines if line.strip()), set(), roots, exclude)
+
+
+def git_changed_files(ref: str, roots: Sequence[str], exclude: Sequence[str]) -> ChangedFiles:
+    """Files changed in the working tree against ref, including renames, deletions and untracked files."""
+    diff = subprocess.run(['git', 'diff', '--name-status', '--relative', '-M', ref],
+                          capture_output=True, text=True, check=True).stdout
+    untracked = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard'],
+                               capture_output=True, text=True, check=True).stdout
+
+    paths = untracked.splitlines()
+    removed = set()
+    for line in diff.splitlines():
+        status, *names = line.split('\t')
+        if status.startswith('R'):
+            removed.add(os.path.normpath(names[0]))
+        paths.append(names[-1])
+    return _select(paths, removed, roots, exclude)
+
+
+def load_baseline(path: str) -> List[AllureIdRecord]:
+    if not os.path.exists(path):
+        return []
+    return list(read_id_manifest(path))
+
+
+def unchanged_records(baseline: Iterable[AllureIdRecord], removed: Set[str],
+                      reports: Sequence[FileReport]) -> List[AllureIdRecord]:
+    """Baseline records of files which were neither removed nor linted in this run."""
+    dropped = removed | {os.path.normpath(report.filename) for report in reports}
+    return [record for record in baseline if record.path not in dropped]
+
+
+def update_baseline(path: str, unchanged: Sequence[AllureIdRecord], reports: Sequence[FileReport]) -> None:
+    records = list(unchanged)
+    for report in reports:
+        records.extend(iter_id_records(report.filename, report.file_facts))
+    records.sort(key=lambda record: (record.path, record.lineno))
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    write_id_manifest(records, tmp_path, 'ndjson')
+    os.replace(tmp_path, path)
@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+from typing import Iterator, List, Optional, Sequence
+
+from flake8_vedro_allure.errors import DuplicateAllureIdError
+from flake8_vedro_allure.id_index import ShardEntry, merge_shards
+
+from .batch import FileReport, LintError
+from .reporters import REPORTERS
+
+
+def iter_shard_entries(reports: Sequence[FileReport]) -> Iterator[ShardEntry]:
+    for report in reports:
+        path = os.path.normpath(report.filename)
+        for scenario in report.file_facts.scenarios:
+            for allure_id, lineno, col_offset, _ in scenario.iter_allure_ids():
+                yield ShardEntry(allure_id, path, lineno, col_offset)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='vedro-allure-lint merge-index',
+        description='Merge allure id index shards written with --id-index-shard and report '
+                    'duplicate allure ids (ALR005) between shards',
+    )
+    parser.add_argument('shards', nargs='+')
+    parser.add_argument('--output', help='File for the merged index, it can be merged again')
+    parser.add_argument('--format', choices=sorted(REPORTERS), default='text')
+    return parser
+
+
+def merge_index_errors(shard_paths: Sequence[str], output_path: Optional[str] = None) -> List[LintError]:
+    errors = []
+    tmp_path = f'{output_path}.{os.getpid()}.tmp'
+    with ExitStack() as stack:
+        streams = [stack.enter_context(open(path)) for path in shard_paths]
+        output = stack.enter_context(open(tmp_path, 'w')) if output_path is not None else None
+        for entry, owner in merge_shards(streams, shard_paths, output):
+            error = DuplicateAllureIdError(entry.lineno, entry.col_offset,
+                                           allure_id=entry.allure_id, scenario_path=owner.path)
+            errors.append(LintError(entry.path, error.lineno, error.col_offset, error.code, error.message))
+    if output_path is not None:
+        os.replace(tmp_path, output_path)
+    return sorted(errors)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    options = create_parser().parse_args(argv)
+    errors = merge_index_errors(options.shards, options.output)
+    REPORTERS[options.format](errors, sys.stdout)
+    return 1 if errors else 0
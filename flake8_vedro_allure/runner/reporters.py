@@ -0,0 +1,48 @@
+import json
+from typing import Iterable, Mapping, Optional, TextIO
+
+from flake8_vedro_allure.facts import FileFacts
+from flake8_vedro_allure.lint_report import REPORT_WRITERS, iter_lint_records
+
+from .batch import LintError
+
+
+def write_text(errors: Iterable[LintError], output: TextIO,
+               file_facts: Optional[Mapping[str, FileFacts]] = None) -> None:
+    for error in errors:
+        output.write(f'{error.filename}:{error.lineno}:{error.col_offset + 1}: '
+                     f'{error.code} {error.message}\n')
+
+
+def write_json(errors: Iterable[LintError], output: TextIO,
+               file_facts: Optional[Mapping[str, FileFacts]] = None) -> None:
+    json.dump([
+        {
+            'filename': error.filename,
+            'line_number': error.lineno,
+            'column_number': error.col_offset + 1,
+            'code': error.code,
+            'text': error.message,
+        }
+        for error in errors
+    ], output, indent=2)
+    output.write('\n')
+
+
+def _streaming_reporter(format_name: str):
+    def write(errors: Iterable[LintError], output: TextIO,
+              file_facts: Optional[Mapping[str, FileFacts]] = None) -> None:
+        from flake8_vedro_allure.plugins import VedroAllurePlugin
+        writer = REPORT_WRITERS[format_name](output, VedroAllurePlugin.version)
+        for record in iter_lint_records(errors, file_facts or {}):
+            writer.write(record)
+        writer.close()
+    return write
+
+
+REPORTERS = {
+    'text': write_text,
+    'json': write_json,
+    'ndjson': _streaming_reporter('ndjson'),
+    'sarif': _streaming_reporter('sarif'),
+}
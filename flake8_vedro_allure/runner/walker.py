@@ -0,0 +1,29 @@
+import os
+from fnmatch import fnmatch
+from typing import Iterator, Sequence
+
+DEFAULT_EXCLUDE = ('.svn', 'CVS', '.bzr', '.hg', '.git', '__pycache__', '.tox', '.nox', '.eggs', '*.egg')
+
+
+def is_excluded(path: str, exclude: Sequence[str]) -> bool:
+    name = os.path.basename(path)
+    return any(fnmatch(name, pattern) or fnmatch(path, pattern) for pattern in exclude)
+
+
+def iter_python_files(paths: Sequence[str], exclude: Sequence[str] = DEFAULT_EXCLUDE) -> Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            yield from _scan_dir(path, exclude)
+        elif not is_excluded(path, exclude):
+            yield path
+
+
+def _scan_dir(path: str, exclude: Sequence[str]) -> Iterator[str]:
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if is_excluded(entry.path, exclude):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_dir(entry.path, exclude)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield entry.path
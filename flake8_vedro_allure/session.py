@@ -0,0 +1,90 @@
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
+
+from flake8_vedro_allure.abstract_checkers import ScenarioChecker
+from flake8_vedro_allure.config import Config, DefaultConfig
+from flake8_vedro_allure.id_manifest import AllureIdRecord, iter_id_records
+from flake8_vedro_allure.runner.batch import (
+    FileReport,
+    LintError,
+    check_duplicates,
+    lint_file,
+    lint_source
+)
+from flake8_vedro_allure.runner.walker import DEFAULT_EXCLUDE, iter_python_files
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.checkers_manifest import CHECKERS_MANIFEST
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    DuplicateAllureIdChecker
+)
+
+
+def get_checker_classes() -> List[Type[ScenarioChecker]]:
+    """Built-in checkers and checkers registered in ScenarioVisitor."""
+    classes = [spec.load_class() for spec in CHECKERS_MANIFEST]
+    for checker in ScenarioVisitor.scenarios_checkers:
+        if type(checker) not in classes:
+            classes.append(type(checker))
+    return classes
+
+
+class LintSession:
+    """
+    Linter for embedding, with its own checkers and allure ids.
+
+    Nothing is shared with flake8 runs or other sessions, so one process
+    can lint many batches. Errors are yielded as files are linted, ALR005
+    ones after all files of the call, and are checked against every file
+    linted in the session: the lowest path owns an id.
+    """
+
+    def __init__(self, config: Optional[Config] = None,
+                 checker_classes: Optional[Sequence[Type[ScenarioChecker]]] = None):
+        config = config or DefaultConfig()
+        # the session keeps ids itself, an index shared with other processes is not used
+        self.config = config.replace(allure_id_index_path=None) if config.allure_id_index_path else config
+
+        checkers = [
+            checker_cls() for checker_cls in (checker_classes or get_checker_classes())
+            if not checker_cls.error_codes or any(map(self.config.is_code_enabled, checker_cls.error_codes))
+        ]
+        self._checkers = [checker for checker in checkers if not isinstance(checker, DuplicateAllureIdChecker)]
+        self._duplicate_checker = next(
+            (checker for checker in checkers if isinstance(checker, DuplicateAllureIdChecker)), None
+        )
+        self._records: Dict[str, List[AllureIdRecord]] = {}
+
+    def lint_source(self, source: Union[str, bytes], filename: str = 'stdin.py') -> Iterator[LintError]:
+        if isinstance(source, str):
+            source = source.encode()
+        report = lint_source(os.path.normpath(filename), source, self.config, checkers=self._checkers)
+        yield from self._lint_reports([report])
+
+    def lint_file(self, filename: str) -> Iterator[LintError]:
+        report = lint_file(os.path.normpath(filename), self.config, checkers=self._checkers)
+        yield from self._lint_reports([report])
+
+    def lint_paths(self, paths: Sequence[str], exclude: Sequence[str] = DEFAULT_EXCLUDE) -> Iterator[LintError]:
+        yield from self._lint_reports(
+            lint_file(os.path.normpath(filename), self.config, checkers=self._checkers)
+            for filename in iter_python_files(paths, exclude)
+        )
+
+    def _lint_reports(self, reports: Iterable[FileReport]) -> Iterator[LintError]:
+        linted = []
+        for report in reports:
+            yield from report.errors
+            linted.append(report)
+            self._records[report.filename] = list(iter_id_records(report.filename, report.file_facts))
+
+        if self._duplicate_checker is None:
+            return
+        linted_paths = {report.filename for report in linted}
+        others = [
+            record for path, records in self._records.items() if path not in linted_paths for record in records
+        ]
+        yield from check_duplicates(linted, self.config, baseline=others, checker=self._duplicate_checker)
+
+    def reset(self) -> None:
+        """Forget allure ids of linted files."""
+        self._records = {}
@@ -0,0 +1,37 @@
+import os
+import sqlite3
+from typing import Optional
+
+BUSY_TIMEOUT_SECONDS = 30
+
+
+class ProcessLocalConnection:
+    """
+    SQLite connection which is reopened after fork.
+
+    flake8 checks files in worker processes, and SQLite connections must not
+    be shared between processes, so every process lazily opens its own one.
+    """
+
+    def __init__(self, path: str, schema: str):
+        self.path = path
+        self._schema = schema
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def get(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS,
+                                         isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            connection.executescript(self._schema)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
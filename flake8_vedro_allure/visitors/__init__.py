@@ -1,6 +1,9 @@
-from .scenario_allure_checkers import (
-    AllureLabelsChecker,
-    AllureRequiredTagsChecker,
-    AllureUniqueTagsChecker
-)
 from .scenario_visitor import Context, ScenarioVisitor
+
+
+def __getattr__(name):
+    # checkers are imported on demand to keep plugin loading fast
+    if name in ('AllureLabelsChecker', 'AllureRequiredTagsChecker', 'AllureUniqueTagsChecker'):
+        from . import scenario_allure_checkers
+        return getattr(scenario_allure_checkers, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,37 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from flake8_vedro_allure.abstract_checkers import ScenarioChecker
+
+CHECKERS_PACKAGE = 'flake8_vedro_allure.visitors.scenario_allure_checkers'
+
+
+class CheckerSpec:
+    """Checker known without importing its module, which is imported on first load."""
+
+    __slots__ = ('module', 'class_name', 'error_codes', '_checker')
+
+    def __init__(self, module: str, class_name: str, error_codes: Tuple[str, ...]):
+        self.module = module
+        self.class_name = class_name
+        self.error_codes = error_codes
+        self._checker: Optional['ScenarioChecker'] = None
+
+    def load_class(self) -> Type['ScenarioChecker']:
+        return getattr(import_module(self.module), self.class_name)
+
+    def load(self) -> 'ScenarioChecker':
+        """Checker shared by visitors of the process."""
+        if self._checker is None:
+            self._checker = self.load_class()()
+        return self._checker
+
+
+CHECKERS_MANIFEST = (
+    CheckerSpec(f'{CHECKERS_PACKAGE}.allure_labels_checker', 'AllureLabelsChecker', ('ALR001',)),
+    CheckerSpec(f'{CHECKERS_PACKAGE}.required_tags_checker', 'AllureRequiredTagsChecker', ('ALR002',)),
+    CheckerSpec(f'{CHECKERS_PACKAGE}.unique_tags_checker', 'AllureUniqueTagsChecker', ('ALR003',)),
+    CheckerSpec(f'{CHECKERS_PACKAGE}.allure_id_checker', 'AllureIdRequiredChecker', ('ALR004',)),
+    CheckerSpec(f'{CHECKERS_PACKAGE}.duplicate_allure_id_checker', 'DuplicateAllureIdChecker', ('ALR005',)),
+)
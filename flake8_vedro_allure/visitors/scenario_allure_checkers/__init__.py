@@ -1,5 +1,18 @@
-from .allure_id_checker import AllureIdRequiredChecker
-from .allure_labels_checker import AllureLabelsChecker
-from .required_tags_checker import AllureRequiredTagsChecker
-from .unique_tags_checker import AllureUniqueTagsChecker
-from .duplicate_allure_id_checker import DuplicateAllureIdChecker
+from importlib import import_module
+
+_CHECKERS = {
+    'AllureIdRequiredChecker': '.allure_id_checker',
+    'AllureLabelsChecker': '.allure_labels_checker',
+    'AllureRequiredTagsChecker': '.required_tags_checker',
+    'AllureUniqueTagsChecker': '.unique_tags_checker',
+    'DuplicateAllureIdChecker': '.duplicate_allure_id_checker',
+}
+
+__all__ = list(_CHECKERS)
+
+
+def __getattr__(name):
+    # every checker module is imported only when its checker is used
+    if name in _CHECKERS:
+        return getattr(import_module(_CHECKERS[name], __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
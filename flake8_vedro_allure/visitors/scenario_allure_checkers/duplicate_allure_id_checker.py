@@ -1,78 +1,63 @@
-import ast
-from typing import List, Dict, Optional, NamedTuple
+from typing import List, Optional
 
 from flake8_plugin_utils import Error
 
 from flake8_vedro_allure.abstract_checkers import ScenarioChecker
 from flake8_vedro_allure.config import Config
 from flake8_vedro_allure.errors import DuplicateAllureIdError
-from flake8_vedro_allure.visitors.scenario_visitor import (
-    Context,
-    ScenarioVisitor
+from flake8_vedro_allure.id_index import (
+    AllureIdIndex,
+    AllureIdInScenario,
+    InMemoryAllureIdIndex,
+    SqliteAllureIdIndex
 )
+from flake8_vedro_allure.visitors.scenario_visitor import Context
 
 
-class AllureIdInScenario(NamedTuple):
-    scenario_path: str
-    lineno: int
-
-
-@ScenarioVisitor.register_scenario_checker
 class DuplicateAllureIdChecker(ScenarioChecker):
+    error_codes = (DuplicateAllureIdError.code,)
 
     def __init__(self):
-        self._allure_ids: Dict[str, AllureIdInScenario] = {}
-
-    def extract_allure_id(self, scenario_node: ast.ClassDef,
-                          import_from_nodes: Optional[List[ast.ImportFrom]] = None) -> Optional[str]:
-        allure_id_decorator = self.get_allure_id_decorator(scenario_node, import_from_nodes)
-        if not allure_id_decorator:
-            return None
+        self._allure_ids = InMemoryAllureIdIndex()
+        self._shared_allure_ids: Optional[SqliteAllureIdIndex] = None
 
-        if allure_id_decorator.args:
-            arg = allure_id_decorator.args[0]
-            if isinstance(arg, ast.Constant) and arg.value is not None:
-                return str(arg.value)
-
-        for keyword in allure_id_decorator.keywords:
-            if keyword.arg == 'id':
-                if isinstance(keyword.value, ast.Constant) and keyword.value is not None:
-                    return str(keyword.value.value)
-
-        return None
+    def get_allure_id_index(self, config: Config) -> AllureIdIndex:
+        if config.allure_id_index_path is None:
+            return self._allure_ids
+        if self._shared_allure_ids is None or self._shared_allure_ids.path != config.allure_id_index_path:
+            self._shared_allure_ids = SqliteAllureIdIndex(config.allure_id_index_path)
+        return self._shared_allure_ids
 
     def check_scenario(self, context: Context, config: Config) -> List[Error]:
+        """
+        Report the id of the scenario and ids of its params cases owned by other occurrences.
+
+        Ids of scenarios are duplicates only of other files, ids of params
+        cases are duplicates of any other occurrence, the same file included.
+        The shared index is filled by the prescan before workers start, so
+        owners are only read from it. Claims of the in-memory index are
+        cheap and return final owners once ids of all files are added.
+        """
         if not config.is_allure_id_required:
             return []
 
-        allure_id = self.extract_allure_id(
-            context.scenario_node,
-            context.import_from_nodes
-        )
-
-        if not allure_id:
-            return []
-
         filename = context.filename or 'unknown_file.py'
-
-        if allure_id in self._allure_ids:
-            stored = self._allure_ids[allure_id]
-            if stored.scenario_path != filename:
-                return [
-                    DuplicateAllureIdError(
-                        context.scenario_node.lineno,
-                        context.scenario_node.col_offset,
-                        allure_id=allure_id,
-                        scenario_path=stored.scenario_path
-                    )
-                ]
-
-        self._allure_ids[allure_id] = AllureIdInScenario(
-            scenario_path=filename,
-            lineno=context.scenario_node.lineno
-        )
-
-        return []
+        allure_ids = self.get_allure_id_index(config)
+        is_shared = config.allure_id_index_path is not None
+        errors = []
+        for occurrence in context.facts.iter_allure_ids():
+            owner: Optional[AllureIdInScenario] = allure_ids.owner(occurrence.allure_id) if is_shared else None
+            if owner is None:
+                owner = allure_ids.claim(occurrence.allure_id, filename, occurrence.lineno)
+            if owner.scenario_path != filename or (occurrence.is_case and owner.lineno != occurrence.lineno):
+                errors.append(DuplicateAllureIdError(
+                    occurrence.lineno,
+                    occurrence.col_offset,
+                    allure_id=occurrence.allure_id,
+                    scenario_path=owner.scenario_path
+                ))
+
+        return errors
 
     def reset_checker(self):
-        self._allure_ids = {}
+        self._allure_ids.reset()
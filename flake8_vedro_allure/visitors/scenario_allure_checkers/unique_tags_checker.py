@@ -1,4 +1,3 @@
-import ast
 from typing import List
 
 from flake8_plugin_utils import Error
@@ -6,29 +5,22 @@ from flake8_plugin_utils import Error
 from flake8_vedro_allure.abstract_checkers import ScenarioChecker
 from flake8_vedro_allure.config import Config
 from flake8_vedro_allure.errors import AllureTagIsNotUnique
-from flake8_vedro_allure.visitors.scenario_visitor import (
-    Context,
-    ScenarioVisitor
-)
+from flake8_vedro_allure.visitors.scenario_visitor import Context
 
 
-@ScenarioVisitor.register_scenario_checker
 class AllureUniqueTagsChecker(ScenarioChecker):
+    error_codes = (AllureTagIsNotUnique.code,)
 
     def check_scenario(self, context: Context, config: Config) -> List[Error]:
-
-        allure_decorator = self.get_allure_decorator(context.scenario_node)
-
-        if not allure_decorator:
+        facts = context.facts
+        if not facts.has_allure_labels:
             return []
 
-        tags_names = self.get_allure_tag_names(allure_decorator)
-
         errors = []
         for tag in config.unique_allure_labels:
-            if tags_names.count(tag) > 1:
+            if facts.tag_counts[tag] > 1:
                 errors.append(
-                    AllureTagIsNotUnique(allure_decorator.lineno, allure_decorator.col_offset,
+                    AllureTagIsNotUnique(*facts.labels_position,
                                          allure_tag=tag)
                 )
 
@@ -1,54 +1,166 @@
 import ast
-from typing import List, Optional, Type
+import time
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
 
 from flake8_vedro_allure.abstract_checkers import ScenarioChecker
 from flake8_vedro_allure.config import Config
+from flake8_vedro_allure.facts import (
+    AllureImportAliases,
+    AstFactsExtractor,
+    FileFacts,
+    ScenarioFacts
+)
 from flake8_vedro_allure.visitors._visitor_with_filename import (
     VisitorWithFilename
 )
+from flake8_vedro_allure.visitors.checkers_manifest import (
+    CHECKERS_MANIFEST,
+    CheckerSpec
+)
+
+if TYPE_CHECKING:
+    from flake8_vedro_allure.instrumentation import Metrics
 
 
 class Context:
-    def __init__(self, scenario_node: ast.ClassDef,
-                 import_from_nodes: List[ast.ImportFrom],
-                 filename: str):
-        self.scenario_node = scenario_node
-        self.import_from_nodes = import_from_nodes
+    def __init__(self, facts: ScenarioFacts,
+                 filename: str,
+                 scenario_node: Optional[ast.ClassDef] = None,
+                 import_from_nodes: Optional[List[ast.ImportFrom]] = None):
+        self.facts = facts
         self.filename = filename
+        self.scenario_node = scenario_node
+        self.import_from_nodes = import_from_nodes if import_from_nodes else []
 
 
 class ScenarioVisitor(VisitorWithFilename):
+    # built-in checkers are imported from the manifest when the first scenario is checked
+    checkers_manifest: Tuple[CheckerSpec, ...] = CHECKERS_MANIFEST
     scenarios_checkers: List[ScenarioChecker] = []
+    _checker_plans: Dict[Optional[FrozenSet[str]], List[ScenarioChecker]] = {}
+    facts_extractor = AstFactsExtractor()
 
     def __init__(self, config: Optional[Config] = None,
-                 filename: Optional[str] = None) -> None:
+                 filename: Optional[str] = None,
+                 checkers: Optional[List[ScenarioChecker]] = None,
+                 metrics: Optional['Metrics'] = None) -> None:
         super().__init__(config, filename)
+        self._checkers = checkers
+        self.metrics = metrics
         self.import_from_nodes = []
+        self.allure_aliases = AllureImportAliases()
+        self.scenarios_facts: List[ScenarioFacts] = []
+        self._scenario_classes: Optional[Sequence[str]] = None
 
     @property
     def config(self):
         return self._config
 
+    @property
+    def checkers(self) -> List[ScenarioChecker]:
+        if self._checkers is None:
+            self._checkers = self.get_checker_plan(self.config.enabled_codes if self.config is not None else None)
+        return self._checkers
+
+    @property
+    def scenario_classes(self) -> Sequence[str]:
+        """Classes of the file inheriting vedro.Scenario through repo base classes."""
+        if self._scenario_classes is None:
+            self._scenario_classes = ()
+            if self.config is not None and self.config.scenario_base_paths:
+                from flake8_vedro_allure.class_index import get_scenario_classes
+                self._scenario_classes = get_scenario_classes(self.config, self.filename)
+        return self._scenario_classes
+
+    @property
+    def file_facts(self) -> FileFacts:
+        return FileFacts(
+            scenarios=self.scenarios_facts,
+            allure_imports=self.facts_extractor.extract_allure_imports(self.import_from_nodes)
+        )
+
     @classmethod
     def register_scenario_checker(cls, checker: Type[ScenarioChecker]):
         cls.scenarios_checkers.append(checker())
+        cls._checker_plans = {}
         return checker
 
     @classmethod
     def deregister_all(cls):
+        cls.checkers_manifest = ()
         cls.scenarios_checkers = []
+        cls._checker_plans = {}
+
+    @classmethod
+    def get_error_codes(cls) -> FrozenSet[str]:
+        return frozenset(
+            code
+            for checkers in (cls.checkers_manifest, cls.scenarios_checkers)
+            for checker in checkers for code in checker.error_codes
+        )
+
+    @staticmethod
+    def _is_enabled(error_codes: Tuple[str, ...], enabled_codes: Optional[FrozenSet[str]]) -> bool:
+        return enabled_codes is None or not error_codes or not enabled_codes.isdisjoint(error_codes)
+
+    @classmethod
+    def get_checker_plan(cls, enabled_codes: Optional[FrozenSet[str]] = None) -> List[ScenarioChecker]:
+        """
+        Checkers which can emit at least one of enabled codes.
+
+        Modules of built-in checkers are imported here, so checkers of
+        disabled codes are never imported.
+        """
+        if enabled_codes not in cls._checker_plans:
+            cls._checker_plans[enabled_codes] = [
+                spec.load() for spec in cls.checkers_manifest
+                if cls._is_enabled(spec.error_codes, enabled_codes)
+            ] + [
+                checker for checker in cls.scenarios_checkers
+                if cls._is_enabled(checker.error_codes, enabled_codes)
+            ]
+        return cls._checker_plans[enabled_codes]
+
+    def visit_Module(self, node: ast.Module):
+        if self._scenario_classes is None and self.config is not None and self.config.scenario_base_paths:
+            # the checked tree may differ from the file on disk, e.g. unsaved source linted by the daemon
+            from flake8_vedro_allure.class_index import get_scenario_classes
+            self._scenario_classes = get_scenario_classes(self.config, self.filename, tree=node)
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        self.allure_aliases.add_import(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
         self.import_from_nodes.append(node)
+        self.allure_aliases.add_import_from(node)
 
     def visit_ClassDef(self, node: ast.ClassDef):
-        if node.name == 'Scenario':
-            context = Context(scenario_node=node,
-                              import_from_nodes=self.import_from_nodes,
-                              filename=self.filename)
+        if node.name == 'Scenario' or node.name in self.scenario_classes:
+            facts = self.facts_extractor.extract_scenario_facts(node, aliases=self.allure_aliases)
+            self.scenarios_facts.append(facts)
+            self.check_scenario(Context(facts=facts,
+                                        filename=self.filename,
+                                        scenario_node=node,
+                                        import_from_nodes=self.import_from_nodes))
+
+    def check_file_facts(self, file_facts: FileFacts):
+        for facts in file_facts.scenarios:
+            self.scenarios_facts.append(facts)
+            self.check_scenario(Context(facts=facts, filename=self.filename))
+
+    def check_scenario(self, context: Context):
+        for checker in self.checkers:
+            started = time.perf_counter() if self.metrics is not None else 0.0
+            errors = []
+            failed = False
             try:
-                for checker in self.scenarios_checkers:
-                    self.errors.extend(checker.check_scenario(context, self.config))
+                errors = checker.check_scenario(context, self.config)
             except Exception as e:
+                failed = True
                 print(f'Linter failed: checking {context.filename} with {checker.__class__}.\n'
                       f'Exception: {e}')
+            self.errors.extend(errors)
+            if self.metrics is not None:
+                self.metrics.record(checker.__class__.__name__, context.filename or 'unknown_file.py',
+                                    time.perf_counter() - started, len(errors), failed)
@@ -24,7 +24,7 @@ setup(
     author="Anna",
     author_email="testopia13@gmail.com",
     license="Apache-2.0",
-    packages=find_packages(exclude=("tests",)),
+    packages=find_packages(exclude=("tests", "benchmarks", "benchmarks.*")),
     package_data={"flake8_vedro_allure": ["py.typed"]},
     install_requires=find_required(),
     tests_require=find_dev_required(),
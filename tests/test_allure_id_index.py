@@ -0,0 +1,149 @@
+import subprocess
+import sys
+from multiprocessing import get_context
+from textwrap import dedent
+
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.errors import DuplicateAllureIdError
+from flake8_vedro_allure.facts import ScenarioFacts
+from flake8_vedro_allure.id_index import (
+    AllureIdInScenario,
+    InMemoryAllureIdIndex,
+    SqliteAllureIdIndex
+)
+from flake8_vedro_allure.prescan import prescan_allure_ids
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    DuplicateAllureIdChecker
+)
+
+
+class MockContext:
+    def __init__(self, filename, allure_id='12345', lineno=1):
+        self.filename = filename
+        self.facts = ScenarioFacts('Scenario', lineno, 0, allure_id=allure_id)
+
+
+def _add(args):
+    path, allure_id, scenario_path = args
+    SqliteAllureIdIndex(path).add(allure_id, scenario_path, 1)
+
+
+def test_in_memory_lowest_path_owns_id():
+    index = InMemoryAllureIdIndex()
+    assert index.claim('1', 'b.py', 5) == AllureIdInScenario('b.py', 5)
+    assert index.claim('1', 'a.py', 9) == AllureIdInScenario('a.py', 9)
+    assert index.claim('1', 'c.py', 1) == AllureIdInScenario('a.py', 9)
+    assert index.owner('2') is None
+
+
+def test_in_memory_index_keeps_numeric_and_named_ids_apart():
+    index = InMemoryAllureIdIndex()
+    index.add_many((str(allure_id), f'file{allure_id % 7}.py', allure_id) for allure_id in range(10000))
+    index.add_many([('007', 'a.py', 1), ('7', 'b.py', 2), ('TEST-1', 'a.py', 3)])
+
+    assert len(index) == 10002
+    assert index.owner('007') == AllureIdInScenario('a.py', 1)
+    assert index.owner('7') == AllureIdInScenario('b.py', 2)
+    assert index.owner('9999') == AllureIdInScenario('file3.py', 9999)
+    assert index.owner('TEST-1') == AllureIdInScenario('a.py', 3)
+    assert index.owner('10000') is None
+
+
+def test_in_memory_index_items_are_owners():
+    index = InMemoryAllureIdIndex()
+    index.add_many([('2', 'b.py', 1), ('1', 'b.py', 9), ('TEST-1', 'a.py', 3), ('1', 'a.py', 5)])
+
+    assert list(index.items()) == [
+        ('1', AllureIdInScenario('a.py', 5)),
+        ('2', AllureIdInScenario('b.py', 1)),
+        ('TEST-1', AllureIdInScenario('a.py', 3)),
+    ]
+    assert index.claim('2', 'a.py', 1) == AllureIdInScenario('a.py', 1)
+
+
+def test_sqlite_index_is_shared_between_connections(tmp_path):
+    path = str(tmp_path / 'ids.sqlite')
+    first, second = SqliteAllureIdIndex(path), SqliteAllureIdIndex(path)
+
+    assert first.claim('1', 'b.py', 1) == AllureIdInScenario('b.py', 1)
+    second.add_many([('1', 'a.py', 5), ('2', 'b.py', 7)])
+    assert first.owner('1') == AllureIdInScenario('a.py', 5)
+    assert first.owner('2') == AllureIdInScenario('b.py', 7)
+
+
+def test_sqlite_index_owner_does_not_depend_on_order(tmp_path):
+    path = str(tmp_path / 'ids.sqlite')
+    SqliteAllureIdIndex(path).reset()
+    occurrences = [(path, '1', f'file{i:02}.py') for i in reversed(range(16))]
+
+    with get_context('fork').Pool(4) as pool:
+        pool.map(_add, occurrences, chunksize=1)
+
+    assert SqliteAllureIdIndex(path).owner('1') == AllureIdInScenario('file00.py', 1)
+
+
+def test_checker_uses_shared_index(tmp_path):
+    config = DefaultConfig(is_allure_id_required=True,
+                           allure_id_index_path=str(tmp_path / 'ids.sqlite'))
+
+    first_worker, second_worker = DuplicateAllureIdChecker(), DuplicateAllureIdChecker()
+
+    assert first_worker.check_scenario(MockContext('file1.py'), config) == []
+    errors = second_worker.check_scenario(MockContext('file2.py'), config)
+    assert len(errors) == 1
+    assert isinstance(errors[0], DuplicateAllureIdError)
+
+
+def test_flake8_parallel_run_detects_duplicate(tmp_path):
+    code = dedent('''
+    import allure
+
+    @allure.id(12345)
+    class Scenario: pass
+    ''')
+    for i in range(4):
+        (tmp_path / f'scenario_{i}.py').write_text(code)
+
+    for jobs in ('1', '4'):
+        result = subprocess.run(
+            [sys.executable, '-m', 'flake8', '--select', 'ALR', '--jobs', jobs,
+             '--is-allure-id-required', 'true', '.'],
+            cwd=tmp_path, capture_output=True, text=True
+        )
+
+        # the lowest path owns the id however files are scheduled
+        assert sorted(result.stdout.splitlines()) == [
+            f'./scenario_{i}.py:5:1: ALR005 duplicate allure id 12345 was found in ./scenario_0.py'
+            for i in range(1, 4)
+        ]
+
+
+def test_flake8_serial_run_does_not_depend_on_file_order(tmp_path):
+    code = 'import allure\n\n\n@allure.id(1)\nclass Scenario: pass\n'
+    (tmp_path / 'a.py').write_text(code)
+    (tmp_path / 'b.py').write_text(code)
+
+    for jobs in ('1', '2'):
+        result = subprocess.run(
+            [sys.executable, '-m', 'flake8', '--select', 'ALR', '--jobs', jobs,
+             '--is-allure-id-required', 'true', 'b.py', 'a.py'],
+            cwd=tmp_path, capture_output=True, text=True
+        )
+
+        assert result.stdout == 'b.py:5:1: ALR005 duplicate allure id 1 was found in a.py\n'
+
+
+def test_prescan_makes_checks_order_independent(tmp_path):
+    for name in ('a', 'b', 'c'):
+        (tmp_path / f'{name}.py').write_text('import allure\n\n@allure.id(1)\nclass Scenario: pass\n')
+    filenames = [str(tmp_path / f'{name}.py') for name in ('c', 'b', 'a')]
+    config = DefaultConfig(is_allure_id_required=True, allure_id_index_path=str(tmp_path / 'ids.sqlite'))
+
+    prescan_allure_ids(filenames, config, SqliteAllureIdIndex(config.allure_id_index_path))
+
+    checker = DuplicateAllureIdChecker()
+    reported = [
+        filename for filename in filenames
+        if checker.check_scenario(MockContext(filename, allure_id='1', lineno=4), config)
+    ]
+    assert reported == filenames[:2]
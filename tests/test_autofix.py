@@ -0,0 +1,109 @@
+import os
+from textwrap import dedent
+
+import pytest
+
+from flake8_vedro_allure.autofix import (
+    FreeIdAllocator,
+    IdRange,
+    ScenarioFix,
+    insert_allure_ids,
+    parse_directory_ranges,
+    parse_id_range
+)
+from flake8_vedro_allure.runner.cli import main
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    DuplicateAllureIdChecker
+)
+
+NO_ID_SCENARIO = dedent('''
+import vedro
+
+
+@allure_labels(Feature.Login)
+class Scenario(vedro.Scenario):
+    subject = "login"
+''')
+
+
+@pytest.fixture(autouse=True)
+def id_checkers():
+    ScenarioVisitor.deregister_all()
+    for checker in (AllureIdRequiredChecker, DuplicateAllureIdChecker):
+        ScenarioVisitor.register_scenario_checker(checker)
+
+
+def test_allocator_skips_used_ids():
+    allocator = FreeIdAllocator(IdRange(10, 30), [9, 10, 11, 13, *range(16, 29)])
+
+    assert [allocator.allocate() for _ in range(5)] == [12, 14, 15, 29, None]
+
+
+def test_allocator_of_wide_range_keeps_only_used_ids():
+    allocator = FreeIdAllocator(parse_id_range('1-99999999999'), [1, 2, 4, 99999999999])
+
+    assert [allocator.allocate() for _ in range(3)] == [3, 5, 6]
+
+
+def test_range_parsing():
+    assert parse_id_range('100-199') == IdRange(100, 200)
+    assert parse_directory_ranges(['api=1-9', 'web=10-19']) == [('api', IdRange(1, 10)), ('web', IdRange(10, 20))]
+    with pytest.raises(ValueError):
+        parse_id_range('200-100')
+    with pytest.raises(ValueError):
+        parse_directory_ranges(['api=1-10', 'web=10-19'])
+
+
+def test_insertion_keeps_other_lines():
+    source = b'# -*- coding: utf-8 -*-\r\n"""Doc."""\r\nfrom allure import id as aid\r\n\r\n' \
+             b'class Scenario:\r\n    class Scenario: pass\r\n'
+
+    fixed = insert_allure_ids(source, [ScenarioFix(5, 0, 7), ScenarioFix(6, 4, 8)])
+
+    assert fixed == b'# -*- coding: utf-8 -*-\r\n"""Doc."""\r\nfrom allure import id as aid\r\n\r\n' \
+                    b'@aid(7)\r\nclass Scenario:\r\n    @aid(8)\r\n    class Scenario: pass\r\n'
+
+
+def test_allure_import_is_added():
+    fixed = insert_allure_ids(b'"""Doc."""\n@labels(1)\nclass Scenario: pass', [ScenarioFix(3, 0, 1)])
+
+    assert fixed == b'"""Doc."""\nimport allure\n\n\n@labels(1)\n@allure.id(1)\nclass Scenario: pass'
+
+
+def _lint(path, *args):
+    return main(['--is-allure-id-required', 'true', '--jobs', '1', *args, str(path)])
+
+
+def test_fix_assigns_free_ids_per_directory(tmp_path, capsys):
+    for directory in ('api', 'web', 'other'):
+        (tmp_path / directory).mkdir()
+        for name in ('a', 'b'):
+            (tmp_path / directory / f'{name}.py').write_text(NO_ID_SCENARIO)
+    (tmp_path / 'api' / 'c.py').write_text('import allure\n\n@allure.id(100)\nclass Scenario: pass\n')
+    ranges = f'{tmp_path / "api"}=100-199,{tmp_path / "web"}=200-299'
+
+    assert _lint(tmp_path, '--fix', '--fix-id-ranges', ranges) == 0
+
+    assert (tmp_path / 'api' / 'a.py').read_text() == NO_ID_SCENARIO.replace(
+        'import vedro', 'import allure\nimport vedro').replace('class', '@allure.id(101)\nclass')
+    assert '@allure.id(102)' in (tmp_path / 'api' / 'b.py').read_text()
+    assert '@allure.id(200)' in (tmp_path / 'web' / 'a.py').read_text()
+    assert '@allure.id(301)' in (tmp_path / 'other' / 'b.py').read_text()
+    assert capsys.readouterr().err == 'fixed scenarios: 6, files: 6\n'
+
+
+def test_fix_is_idempotent(tmp_path, capsys):
+    for name in ('a', 'b', 'c'):
+        (tmp_path / f'{name}.py').write_text(NO_ID_SCENARIO)
+    (tmp_path / 'd.py').write_text('import allure\n\n@allure.id(5)\nclass Scenario: pass\n')
+
+    assert _lint(tmp_path, '--fix', '--fix-id-range', '5-6') == 1
+    first = {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)}
+    assert b'@allure.id(6)' in first['a.py']
+    assert capsys.readouterr().out.count('ALR004') == 2
+
+    _lint(tmp_path, '--fix', '--fix-id-range', '5-6')
+
+    assert {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)} == first
@@ -0,0 +1,167 @@
+import json
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.runner import iter_python_files, lint_files
+from flake8_vedro_allure.runner.batch import collect_reports
+from flake8_vedro_allure.runner.cli import main
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    AllureLabelsChecker,
+    AllureRequiredTagsChecker,
+    AllureUniqueTagsChecker,
+    DuplicateAllureIdChecker
+)
+
+SCENARIO = dedent('''
+import allure
+
+@allure_labels(Feature.House)
+@allure.id({allure_id})
+class Scenario: pass
+''')
+
+
+@pytest.fixture(autouse=True)
+def all_checkers():
+    ScenarioVisitor.deregister_all()
+    for checker in (AllureLabelsChecker, AllureRequiredTagsChecker, AllureUniqueTagsChecker,
+                    AllureIdRequiredChecker, DuplicateAllureIdChecker):
+        ScenarioVisitor.register_scenario_checker(checker)
+
+
+def _write_scenarios(path, count, allure_id=None):
+    for i in range(count):
+        (path / f'scenario_{i:03}.py').write_text(SCENARIO.format(allure_id=allure_id or i))
+
+
+def test_walker_skips_excluded_dirs(tmp_path):
+    (tmp_path / 'scenarios').mkdir()
+    (tmp_path / 'scenarios' / 'scenario.py').write_text('')
+    (tmp_path / 'scenarios' / 'notes.txt').write_text('')
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'hook.py').write_text('')
+
+    assert list(iter_python_files([str(tmp_path)])) == [str(tmp_path / 'scenarios' / 'scenario.py')]
+
+
+def test_parallel_duplicates_are_exact(tmp_path):
+    _write_scenarios(tmp_path, 40, allure_id=12345)
+    filenames = sorted(iter_python_files([str(tmp_path)]))
+
+    errors = lint_files(filenames, DefaultConfig(is_allure_id_required=True), jobs=4, batch_size=3)
+
+    assert [error.filename for error in errors] == filenames[1:]
+    assert {error.code for error in errors} == {'ALR005'}
+    assert all(error.message.endswith(filenames[0]) for error in errors)
+
+
+def test_parallel_and_serial_runs_are_equal(tmp_path):
+    _write_scenarios(tmp_path, 20)
+    (tmp_path / 'scenario_dup.py').write_text(SCENARIO.format(allure_id=3))
+    filenames = list(iter_python_files([str(tmp_path)]))
+    config = DefaultConfig(is_allure_id_required=True, required_allure_labels=['Story'])
+
+    assert lint_files(filenames, config, jobs=4, batch_size=2) == lint_files(filenames, config, jobs=1)
+
+
+def test_syntax_error_is_reported(tmp_path):
+    (tmp_path / 'broken.py').write_text('class Scenario(:\n')
+
+    errors = lint_files([str(tmp_path / 'broken.py')], DefaultConfig(is_allure_id_required=True))
+
+    assert [error.code for error in errors] == ['E999']
+
+
+def test_null_bytes_are_reported(tmp_path):
+    (tmp_path / 'binary.py').write_bytes(b'class Scenario:\x00\n')
+
+    errors = lint_files([str(tmp_path / 'binary.py')], DefaultConfig(is_allure_id_required=True))
+
+    assert [error.code for error in errors] == ['E999']
+
+
+def test_unreadable_file_is_reported(tmp_path):
+    filename = str(tmp_path / 'missing.py')
+
+    errors = lint_files([filename], DefaultConfig(is_allure_id_required=True))
+
+    assert [(error.lineno, error.code) for error in errors] == [(1, 'E902')]
+    assert errors[0].message.startswith('FileNotFoundError: ')
+
+
+def test_token_facts_extractor_reports_same_errors(tmp_path):
+    _write_scenarios(tmp_path, 5, allure_id=7)
+    (tmp_path / 'no_id.py').write_text('import allure\n\nclass Scenario:\n    pass\n')
+    (tmp_path / 'broken.py').write_text('class Scenario(:\n')
+    filenames = sorted(iter_python_files([str(tmp_path)]))
+    config = DefaultConfig(is_allure_id_required=True, required_allure_labels=['Feature', 'Story'])
+
+    errors = lint_files(filenames, config.replace(facts_extractor='tokens'), jobs=1)
+
+    assert errors == lint_files(filenames, config, jobs=1)
+    assert {error.code for error in errors} == {'ALR002', 'ALR004', 'ALR005', 'E999'}
+
+
+def test_identical_files_are_linted_once(tmp_path):
+    _write_scenarios(tmp_path, 3, allure_id=7)
+    (tmp_path / 'no_id.py').write_text('import allure\n\nclass Scenario:\n    pass\n')
+    (tmp_path / 'no_id_copy.py').write_text('import allure\n\nclass Scenario:\n    pass\n')
+    (tmp_path / 'broken.py').write_text('class Scenario(:\n')
+    (tmp_path / 'broken_copy.py').write_text('class Scenario(:\n')
+    filenames = sorted(iter_python_files([str(tmp_path)]))
+    config = DefaultConfig(is_allure_id_required=True, required_allure_labels=['Feature', 'Story'])
+
+    reports = collect_reports(filenames, config, jobs=1)
+
+    assert [report.filename for report in reports] == filenames
+    assert {report.duplicate_of for report in reports} == {
+        None, str(tmp_path / 'broken.py'), str(tmp_path / 'no_id.py'), str(tmp_path / 'scenario_000.py')
+    }
+    parallel_reports = collect_reports(filenames, config, jobs=2, batch_size=1)
+    assert [report.duplicate_of for report in parallel_reports] == [report.duplicate_of for report in reports]
+    errors = lint_files(filenames, config, jobs=2, batch_size=1)
+    assert errors == lint_files(filenames, config, jobs=1, dedup=False)
+    assert [error.filename for error in errors if error.code == 'ALR005'] == filenames[-2:]
+
+
+def test_identical_files_in_and_out_of_scenarios_folder(tmp_path):
+    (tmp_path / 'scenarios').mkdir()
+    (tmp_path / 'scenarios' / 'scenario.py').write_text('class Scenario: pass\n')
+    (tmp_path / 'helper.py').write_text('class Scenario: pass\n')
+    config = DefaultConfig(is_allure_id_required=True, is_scenarios_folder_only=True)
+
+    errors = lint_files(sorted(iter_python_files([str(tmp_path)])), config, jobs=1)
+
+    assert [error.filename for error in errors] == [str(tmp_path / 'scenarios' / 'scenario.py')]
+
+
+def test_cli_json_output_with_config_file(tmp_path, capsys):
+    _write_scenarios(tmp_path, 2, allure_id=1)
+    (tmp_path / 'setup.cfg').write_text('[flake8]\nis_allure_id_required = true\n')
+
+    exit_code = main(['--config', str(tmp_path / 'setup.cfg'), '--format', 'json', str(tmp_path)])
+
+    assert exit_code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [error['code'] for error in report] == ['ALR005']
+    assert report[0]['filename'] == str(tmp_path / 'scenario_001.py')
+
+
+def test_cli_text_output_matches_flake8(tmp_path):
+    _write_scenarios(tmp_path, 3)
+    (tmp_path / 'scenario_other.py').write_text('class Scenario: pass\n')
+    args = ['--is-allure-id-required', 'true', '--required-allure-labels', 'Feature,Story', '.']
+
+    lint = subprocess.run([sys.executable, '-m', 'flake8_vedro_allure.runner', *args],
+                          cwd=tmp_path, capture_output=True, text=True)
+    flake8 = subprocess.run([sys.executable, '-m', 'flake8', '--select', 'ALR', *args],
+                            cwd=tmp_path, capture_output=True, text=True)
+
+    assert lint.stdout == flake8.stdout
+    assert lint.returncode == flake8.returncode == 1
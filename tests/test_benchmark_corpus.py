@@ -0,0 +1,39 @@
+import re
+
+from benchmarks.corpus import CorpusMix, write_corpus
+
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.runner import lint_files
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    DuplicateAllureIdChecker
+)
+
+
+def _lint(filenames):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    ScenarioVisitor.register_scenario_checker(DuplicateAllureIdChecker)
+    return lint_files(filenames, DefaultConfig(is_allure_id_required=True), jobs=1)
+
+
+def test_corpus_without_duplicates(tmp_path):
+    mix = CorpusMix(allure_id_decorator=0.5, imported_id_decorator=0.3, dynamic_id_call=0.2,
+                    duplicate_id=0.0)
+    filenames = write_corpus(str(tmp_path), 50, mix)
+
+    assert len(filenames) == 50
+    assert _lint(filenames) == []
+
+
+def test_corpus_with_injected_duplicates(tmp_path):
+    mix = CorpusMix(allure_id_decorator=1.0, duplicate_id=1.0)
+    filenames = write_corpus(str(tmp_path), 10, mix)
+    allure_ids = set()
+    for filename in filenames:
+        with open(filename) as f:
+            allure_ids.update(re.findall(r'@allure.id\((\d+)\)', f.read()))
+
+    assert len(allure_ids) < len(filenames)
+    assert [error.code for error in _lint(filenames)] == ['ALR005'] * (len(filenames) - len(allure_ids))
@@ -0,0 +1,72 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from flake8_vedro_allure.codes import get_enabled_codes, make_selection_options
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.runner import lint_files
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    AllureLabelsChecker,
+    AllureRequiredTagsChecker,
+    AllureUniqueTagsChecker,
+    DuplicateAllureIdChecker
+)
+
+ALL_CHECKERS = (AllureLabelsChecker, AllureRequiredTagsChecker, AllureUniqueTagsChecker,
+                AllureIdRequiredChecker, DuplicateAllureIdChecker)
+
+
+@pytest.fixture(autouse=True)
+def all_checkers():
+    ScenarioVisitor.deregister_all()
+    for checker in ALL_CHECKERS:
+        ScenarioVisitor.register_scenario_checker(checker)
+
+
+def _plan(**selection):
+    codes = get_enabled_codes(ScenarioVisitor.get_error_codes(), make_selection_options(**selection))
+    return [checker.__class__ for checker in ScenarioVisitor.get_checker_plan(codes)]
+
+
+def test_all_checkers_run_by_default():
+    assert _plan() == list(ALL_CHECKERS)
+
+
+def test_ignored_checkers_are_pruned():
+    assert _plan(ignore=['ALR001', 'ALR004']) == [AllureRequiredTagsChecker, AllureUniqueTagsChecker,
+                                                  DuplicateAllureIdChecker]
+
+
+def test_only_selected_checkers_run():
+    assert _plan(select=['ALR002']) == [AllureRequiredTagsChecker]
+    assert _plan(select=['E', 'W'], extend_select=['ALR00']) == list(ALL_CHECKERS)
+
+
+def test_extend_ignore_prunes_duplicate_checker():
+    assert DuplicateAllureIdChecker not in _plan(extend_ignore=['ALR005'])
+
+
+def test_batch_runner_skips_disabled_duplicates(tmp_path):
+    for i in range(2):
+        (tmp_path / f'scenario_{i}.py').write_text('import allure\n\n\n@allure.id(1)\nclass Scenario: pass\n')
+    filenames = sorted(str(path) for path in tmp_path.iterdir())
+    config = DefaultConfig(is_allure_id_required=True, enabled_codes=frozenset({'ALR004'}))
+
+    assert lint_files(filenames, config, jobs=1) == []
+
+
+def test_flake8_runs_only_selected_checkers(tmp_path):
+    (tmp_path / 'scenario.py').write_text('@allure_labels(Feature.A)\nclass Scenario: pass\n')
+
+    subprocess.run(
+        [sys.executable, '-m', 'flake8', '--select', 'ALR002', '--required-allure-labels', 'Story',
+         '--is-allure-id-required', 'true', '--vedro-allure-metrics', 'metrics.json', '.'],
+        cwd=tmp_path, capture_output=True, text=True
+    )
+
+    metrics = json.loads((tmp_path / 'metrics.json').read_text())
+    assert list(metrics['checkers']) == ['AllureRequiredTagsChecker']
@@ -0,0 +1,163 @@
+import ast
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+from flake8_vedro_allure.cache import ClassCache
+from flake8_vedro_allure.class_index import (
+    ClassHierarchyIndex,
+    extract_module_classes,
+    get_module_name
+)
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.runner import iter_python_files, lint_files
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker
+)
+
+FILES = {
+    'helpers/__init__.py': 'from .base import BaseApiScenario as ApiScenario\n',
+    'helpers/base.py': dedent('''
+        import vedro
+
+        class BaseApiScenario(vedro.Scenario):
+            pass
+    '''),
+    'scenarios/login.py': dedent('''
+        import allure
+        from helpers import ApiScenario
+
+        class LoginScenario(ApiScenario):
+            pass
+
+        @allure.id(1)
+        class Scenario(ApiScenario):
+            pass
+
+        class Helper:
+            pass
+    '''),
+    'scenarios/logout.py': dedent('''
+        from vedro import Scenario as VedroScenario
+
+        class LogoutScenario(VedroScenario):
+            pass
+    '''),
+}
+
+
+@pytest.fixture()
+def repo(tmp_path, monkeypatch):
+    for path, code in FILES.items():
+        (tmp_path / path).parent.mkdir(exist_ok=True)
+        (tmp_path / path).write_text(code)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_module_classes_resolve_imports():
+    tree = ast.parse(dedent('''
+        import vedro as v
+        from ..base import Base
+        from . import mixins
+
+        class A(v.Scenario, Base, mixins.Mixin, Generic[T]):
+            pass
+
+        class B(A):
+            pass
+    '''))
+
+    module_classes = extract_module_classes(tree, 'scenarios.api.login')
+
+    assert module_classes.classes == {
+        'A': ('vedro.Scenario', 'scenarios.base.Base', 'scenarios.api.mixins.Mixin'),
+        'B': ('scenarios.api.login.A',),
+    }
+    assert module_classes.aliases['scenarios.api.login.Base'] == 'scenarios.base.Base'
+
+
+def test_module_name(tmp_path):
+    assert get_module_name(str(tmp_path / 'scenarios' / 'login.py'), str(tmp_path)) == 'scenarios.login'
+    assert get_module_name(str(tmp_path / 'helpers' / '__init__.py'), str(tmp_path)) == 'helpers'
+
+
+def test_subclasses_are_found_across_files(repo):
+    index = ClassHierarchyIndex(str(repo))
+    index.add_files(iter_python_files(['.']))
+
+    assert index.scenarios == {'scenarios.login.LoginScenario', 'scenarios.login.Scenario',
+                               'scenarios.logout.LogoutScenario'}
+    assert index.get_module_scenarios('scenarios.login') == ('LoginScenario', 'Scenario')
+    assert not index.is_scenario('helpers.base', 'BaseApiScenario')
+
+
+def test_changed_module_updates_scenarios(repo):
+    index = ClassHierarchyIndex(str(repo))
+    index.add_files(iter_python_files(['.']))
+
+    index.add_file('helpers/base.py', b'class BaseApiScenario:\n    pass\n')
+
+    assert index.scenarios == {'scenarios.logout.LogoutScenario'}
+
+
+def test_modules_are_cached_by_content(repo, tmp_path_factory):
+    cache = ClassCache(str(tmp_path_factory.mktemp('cache')))
+    ClassHierarchyIndex(str(repo)).add_files(iter_python_files(['.']), cache)
+
+    source = (repo / 'helpers' / 'base.py').read_bytes()
+    cached = cache.get(cache.make_key(source, 'helpers.base'))
+    assert cached.classes == {'BaseApiScenario': ('vedro.Scenario',)}
+    assert cache.get(cache.make_key(source + b'\n', 'helpers.base')) is None
+
+
+def test_subclasses_are_checked_as_scenarios(repo):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    config = DefaultConfig(is_allure_id_required=True)
+    filenames = sorted(iter_python_files(['scenarios']))
+
+    assert lint_files(filenames, config, jobs=1) == []
+
+    errors = lint_files(filenames, config.replace(scenario_base_paths=['helpers']), jobs=1)
+
+    assert [(error.filename, error.lineno, error.code) for error in errors] == [
+        ('scenarios/login.py', 5, 'ALR004'),
+        ('scenarios/logout.py', 4, 'ALR004'),
+    ]
+
+
+def test_files_outside_index_are_resolved_against_it(repo):
+    index = ClassHierarchyIndex(str(repo))
+    index.add_files(iter_python_files(['helpers']))
+
+    assert index.get_file_scenarios('scenarios/login.py') == ('LoginScenario', 'Scenario')
+    assert index.get_file_scenarios('scenarios/logout.py') == ('LogoutScenario',)
+    source = b'from helpers.base import BaseApiScenario\n\nclass Base(BaseApiScenario): pass\n\nclass A(Base): pass\n'
+    assert index.get_file_scenarios('scenarios/other.py', source) == ('A',)
+    assert not index.has_module('scenarios.other')
+    assert index.get_file_scenarios('helpers/base.py') == ()
+
+
+def test_only_base_paths_have_to_be_listed(repo):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    config = DefaultConfig(is_allure_id_required=True, scenario_base_paths=['helpers'])
+
+    errors = lint_files(sorted(iter_python_files(['helpers', 'scenarios'])), config, jobs=1)
+
+    assert [(error.filename, error.lineno, error.code) for error in errors] == [
+        ('scenarios/login.py', 5, 'ALR004'),
+        ('scenarios/logout.py', 4, 'ALR004'),
+    ]
+    result = subprocess.run(
+        [sys.executable, '-m', 'flake8', '--select', 'ALR', '--is-allure-id-required', 'true',
+         '--scenario-base-paths', 'helpers', 'helpers', 'scenarios'],
+        cwd=repo, capture_output=True, text=True
+    )
+    assert sorted(line.split(': ')[0] for line in result.stdout.splitlines()) == [
+        'scenarios/login.py:5:1', 'scenarios/logout.py:4:1'
+    ]
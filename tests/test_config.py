@@ -0,0 +1,44 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from flake8_vedro_allure.config import Config, DefaultConfig
+
+
+def test_config_is_compiled_and_immutable():
+    config = DefaultConfig(is_allure_labels_optional='false', required_allure_labels=['Story', 'Feature', 'Story'],
+                           enabled_codes=['ALR001'])
+
+    assert config.is_allure_labels_optional is False
+    assert config.required_allure_labels == ('Story', 'Feature')
+    assert config.required_label_set == frozenset({'Feature', 'Story'})
+    assert config.enabled_codes == frozenset({'ALR001'})
+    with pytest.raises(AttributeError):
+        config.is_allure_id_required = True
+
+
+def test_equal_configs_are_interchangeable():
+    config = DefaultConfig(required_allure_labels=['Feature'], cache_dir='cache')
+
+    assert config == pickle.loads(pickle.dumps(config))
+    assert len({config, DefaultConfig(required_allure_labels=('Feature',), cache_dir='cache')}) == 1
+    assert config.replace(cache_dir=None) != config
+
+
+def test_fingerprint_covers_rules_only():
+    config = DefaultConfig(required_allure_labels=['Feature', 'Story'])
+
+    assert config.fingerprint == DefaultConfig(required_allure_labels=['Story', 'Feature']).fingerprint
+    assert config.fingerprint == config.replace(cache_dir='cache', metrics_dir='metrics').fingerprint
+    assert config.fingerprint != config.replace(enabled_codes=['ALR001']).fingerprint
+    assert config.fingerprint != config.replace(is_allure_id_required=True).fingerprint
+
+
+def test_fingerprint_is_stable_across_processes():
+    code = ('from flake8_vedro_allure.config import DefaultConfig; '
+            'print(DefaultConfig(unique_allure_labels=["Priority"]).fingerprint)')
+    fingerprint = subprocess.check_output([sys.executable, '-c', code], text=True).strip()
+
+    assert fingerprint == Config(True, None, ['Priority']).fingerprint
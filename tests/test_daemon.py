@@ -0,0 +1,140 @@
+import os
+import socket
+import threading
+from textwrap import dedent
+
+import pytest
+
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.daemon.client import main as client_main
+from flake8_vedro_allure.daemon.client import send_requests
+from flake8_vedro_allure.daemon.server import DaemonRunningError, LintServer
+from flake8_vedro_allure.daemon.state import WorkspaceState
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker
+)
+
+SCENARIO = dedent('''
+import allure
+
+@allure.id({allure_id})
+class Scenario: pass
+''')
+
+
+@pytest.fixture(autouse=True)
+def id_checker():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+
+
+@pytest.fixture()
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir('scenarios')
+    for name, allure_id in (('a', 1), ('b', 2)):
+        (tmp_path / 'scenarios' / f'{name}.py').write_text(SCENARIO.format(allure_id=allure_id))
+    return WorkspaceState(['scenarios'], DefaultConfig(is_allure_id_required=True), [])
+
+
+def _touch(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_only_changed_files_are_reparsed(workspace):
+    assert workspace.refresh() == 2
+    assert workspace.refresh() == 0
+
+    _touch('scenarios/c.py', SCENARIO.format(allure_id=1))
+    os.remove('scenarios/b.py')
+
+    assert workspace.refresh() == 1
+    paths = {allure_id: {path for path, _ in occurrences} for allure_id, occurrences in workspace.allure_ids.items()}
+    assert paths == {'1': {os.path.abspath('scenarios/a.py'), os.path.abspath('scenarios/c.py')}}
+
+
+def test_duplicates_are_found_in_all_known_files(workspace):
+    workspace.refresh()
+    _touch('scenarios/c.py', SCENARIO.format(allure_id=2))
+
+    errors = workspace.lint('scenarios/c.py')
+
+    assert [(error.code, error.message) for error in errors] == [
+        ('ALR005', 'duplicate allure id 2 was found in scenarios/b.py')
+    ]
+    # the lowest path owns the id
+    assert workspace.lint('scenarios/b.py') == []
+
+
+def test_duplicate_params_cases_are_found(workspace):
+    workspace.refresh()
+    _touch('scenarios/c.py', dedent('''
+    class Scenario:
+        @params(allure_id=1)
+        @params(allure_id=3)
+        @params(allure_id=3)
+        def __init__(self, allure_id):
+            pass
+    '''))
+
+    errors = workspace.lint('scenarios/c.py')
+
+    assert [(error.lineno, error.message) for error in errors if error.code == 'ALR005'] == [
+        (3, 'duplicate allure id 1 was found in scenarios/a.py'),
+        (5, 'duplicate allure id 3 was found in scenarios/c.py'),
+    ]
+
+
+def test_unsaved_source_is_linted(workspace):
+    workspace.refresh()
+
+    errors = workspace.lint('scenarios/b.py', SCENARIO.format(allure_id=1).encode())
+
+    assert [error.code for error in errors] == ['ALR005']
+    assert workspace.lint('scenarios/b.py') == []
+
+
+def test_client_and_server(workspace, capsys):
+    socket_path = 'daemon.sock'
+    server = LintServer(socket_path, workspace, poll_interval=0.05)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    try:
+        _touch('scenarios/c.py', SCENARIO.format(allure_id=1).replace('@allure.id(1)', ''))
+        _touch('scenarios/d.py', SCENARIO.format(allure_id=1))
+
+        assert client_main(['--socket', socket_path, 'scenarios/c.py', 'scenarios/d.py']) == 1
+        assert capsys.readouterr().out == (
+            'scenarios/c.py:5:1: ALR004 scenario should have @allure.id() decorator or allure.id() call\n'
+            'scenarios/d.py:5:1: ALR005 duplicate allure id 1 was found in scenarios/a.py\n'
+        )
+        assert send_requests(socket_path, [{'command': 'stats'}]) == [{'files': 4, 'allure_ids': 2}]
+    finally:
+        assert client_main(['--socket', socket_path, '--stop']) == 0
+        thread.join(5)
+    assert not os.path.exists(socket_path)
+
+
+def test_live_socket_is_not_replaced(workspace):
+    socket_path = 'daemon.sock'
+    server = LintServer(socket_path, workspace)
+    try:
+        with pytest.raises(DaemonRunningError):
+            LintServer(socket_path, workspace)
+        assert os.path.exists(socket_path)
+    finally:
+        server.server_close()
+
+
+def test_stale_socket_is_replaced(workspace):
+    socket_path = 'daemon.sock'
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server = LintServer(socket_path, workspace)
+    server.server_close()
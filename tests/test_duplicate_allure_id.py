@@ -1,8 +1,9 @@
 from flake8_plugin_utils import assert_error, assert_not_error
-from unittest.mock import patch
 
 from flake8_vedro_allure.config import DefaultConfig
 from flake8_vedro_allure.errors import DuplicateAllureIdError
+from flake8_vedro_allure.facts import ScenarioFacts
+from flake8_vedro_allure.runner import lint_files
 from flake8_vedro_allure.visitors import ScenarioVisitor
 from flake8_vedro_allure.visitors.scenario_allure_checkers import (
     DuplicateAllureIdChecker
@@ -22,85 +23,51 @@ def test_no_duplicate_with_disabled_check():
                      config=DefaultConfig(is_allure_id_required=False))
 
 
+class MockContext:
+    def __init__(self, filename, lineno=1, col_offset=0, allure_id='12345'):
+        self.filename = filename
+        self.facts = ScenarioFacts('Scenario', lineno, col_offset, allure_id=allure_id)
+
+
 def test_duplicate_detection():
     checker = DuplicateAllureIdChecker()
     checker.reset_checker()
 
-    with patch.object(checker, 'extract_allure_id', return_value='12345'):
-        class MockNode:
-            def __init__(self, name, lineno=1, col_offset=0):
-                self.name = name
-                self.lineno = lineno
-                self.col_offset = col_offset
-
-        class MockContext:
-            def __init__(self, filename, lineno=1, col_offset=0):
-                self.filename = filename
-                self.scenario_node = MockNode('Scenario', lineno, col_offset)
-                self.import_from_nodes = []
+    context1 = MockContext('file1.py')
+    errors1 = checker.check_scenario(context1, DefaultConfig(is_allure_id_required=True))
+    assert len(errors1) == 0, "First scenario should not cause an error"
 
-        context1 = MockContext('file1.py')
-        errors1 = checker.check_scenario(context1, DefaultConfig(is_allure_id_required=True))
-        assert len(errors1) == 0, "First scenario should not cause an error"
+    context2 = MockContext('file2.py', 10, 5)
+    errors2 = checker.check_scenario(context2, DefaultConfig(is_allure_id_required=True))
 
-        context2 = MockContext('file2.py', 10, 5)
-        errors2 = checker.check_scenario(context2, DefaultConfig(is_allure_id_required=True))
-
-        assert len(errors2) == 1, "Second scenario should cause an error"
-        assert isinstance(errors2[0], DuplicateAllureIdError)
+    assert len(errors2) == 1, "Second scenario should cause an error"
+    assert isinstance(errors2[0], DuplicateAllureIdError)
 
 
 def test_same_file_no_error():
     checker = DuplicateAllureIdChecker()
     checker.reset_checker()
 
-    with patch.object(checker, 'extract_allure_id', return_value='12345'):
-        class MockNode:
-            def __init__(self, name, lineno=1, col_offset=0):
-                self.name = name
-                self.lineno = lineno
-                self.col_offset = col_offset
-
-        class MockContext:
-            def __init__(self, filename, lineno=1, col_offset=0):
-                self.filename = filename
-                self.scenario_node = MockNode('Scenario', lineno, col_offset)
-                self.import_from_nodes = []
-
-        context1 = MockContext('file1.py')
-        errors1 = checker.check_scenario(context1, DefaultConfig(is_allure_id_required=True))
-        assert len(errors1) == 0
+    context1 = MockContext('file1.py')
+    errors1 = checker.check_scenario(context1, DefaultConfig(is_allure_id_required=True))
+    assert len(errors1) == 0
 
-        context2 = MockContext('file1.py', 10, 5)
-        errors2 = checker.check_scenario(context2, DefaultConfig(is_allure_id_required=True))
-        assert len(errors2) == 0, "Same file should not cause a duplicate error"
+    context2 = MockContext('file1.py', 10, 5)
+    errors2 = checker.check_scenario(context2, DefaultConfig(is_allure_id_required=True))
+    assert len(errors2) == 0, "Same file should not cause a duplicate error"
 
 
 def test_different_ids_no_error():
     checker = DuplicateAllureIdChecker()
     checker.reset_checker()
 
-    class MockNode:
-        def __init__(self, name, lineno=1, col_offset=0):
-            self.name = name
-            self.lineno = lineno
-            self.col_offset = col_offset
+    context1 = MockContext('file1.py', allure_id='12345')
+    errors1 = checker.check_scenario(context1, DefaultConfig(is_allure_id_required=True))
+    assert len(errors1) == 0
 
-    class MockContext:
-        def __init__(self, filename, lineno=1, col_offset=0):
-            self.filename = filename
-            self.scenario_node = MockNode('Scenario', lineno, col_offset)
-            self.import_from_nodes = []
-
-    with patch.object(checker, 'extract_allure_id', return_value='12345'):
-        context1 = MockContext('file1.py')
-        errors1 = checker.check_scenario(context1, DefaultConfig(is_allure_id_required=True))
-        assert len(errors1) == 0
-
-    with patch.object(checker, 'extract_allure_id', return_value='67890'):
-        context2 = MockContext('file2.py', 10, 5)
-        errors2 = checker.check_scenario(context2, DefaultConfig(is_allure_id_required=True))
-        assert len(errors2) == 0, "Different IDs should not cause an error"
+    context2 = MockContext('file2.py', 10, 5, allure_id='67890')
+    errors2 = checker.check_scenario(context2, DefaultConfig(is_allure_id_required=True))
+    assert len(errors2) == 0, "Different IDs should not cause an error"
 
 
 def test_allure_id_keyword_arg():
@@ -114,3 +81,48 @@ def test_allure_id_keyword_arg():
 
     assert_not_error(ScenarioVisitor, code,
                      config=DefaultConfig(is_allure_id_required=True))
+
+
+PARAMS_SCENARIO = """
+import allure
+import vedro
+from vedro import params
+
+
+@allure.id({allure_id})
+class Scenario(vedro.Scenario):
+    @params("admin", allure_id={first_case})
+    @params("guest", allure_id={second_case})
+    def __init__(self, role, allure_id):
+        allure.dynamic.id(allure_id)
+"""
+
+
+def test_params_cases_are_checked_for_duplicates(tmp_path):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(DuplicateAllureIdChecker)
+    (tmp_path / 'a.py').write_text(PARAMS_SCENARIO.format(allure_id=1, first_case=10, second_case=11))
+    (tmp_path / 'b.py').write_text(PARAMS_SCENARIO.format(allure_id=2, first_case=11, second_case=11))
+    (tmp_path / 'c.py').write_text(PARAMS_SCENARIO.format(allure_id=3, first_case=2, second_case=30))
+    filenames = [str(tmp_path / name) for name in ('a.py', 'b.py', 'c.py')]
+
+    errors = lint_files(filenames, DefaultConfig(is_allure_id_required=True), jobs=1)
+
+    assert [(error.filename, error.lineno, error.col_offset) for error in errors] == [
+        (filenames[1], 9, 5),
+        (filenames[1], 10, 5),
+        (filenames[2], 9, 5),
+    ]
+    assert errors[0].message == f'duplicate allure id 11 was found in {filenames[0]}'
+    assert errors[2].message == f'duplicate allure id 2 was found in {filenames[1]}'
+
+
+def test_params_cases_of_one_scenario_are_duplicates():
+    checker = DuplicateAllureIdChecker()
+    checker.reset_checker()
+    context = MockContext('file1.py', lineno=3, allure_id=None)
+    context.facts.params_allure_ids = [('5', 1, 4), ('5', 2, 4)]
+
+    errors = checker.check_scenario(context, DefaultConfig(is_allure_id_required=True))
+
+    assert [(error.lineno, error.col_offset) for error in errors] == [(2, 4)]
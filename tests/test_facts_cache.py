@@ -0,0 +1,87 @@
+import ast
+from textwrap import dedent
+from unittest.mock import patch
+
+from flake8_vedro_allure.cache import FactsCache
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.facts import FileFacts, ScenarioFacts
+from flake8_vedro_allure.plugins import VedroAllurePlugin
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureRequiredTagsChecker,
+    DuplicateAllureIdChecker
+)
+
+CODE = dedent('''
+import allure
+
+@allure_labels(Feature.House)
+@allure.id(12345)
+class Scenario: pass
+''')
+
+
+def _run_plugin(code: str, filename: str, config: DefaultConfig):
+    with VedroAllurePlugin.test_config(config):
+        plugin = VedroAllurePlugin(ast.parse(code), filename, lines=code.splitlines(True))
+        return [text for _, _, text, _ in plugin.run()]
+
+
+def test_facts_roundtrip(tmp_path):
+    cache = FactsCache(str(tmp_path))
+    facts = FileFacts(
+        scenarios=[ScenarioFacts('Scenario', 5, 0, labels_position=(3, 0),
+                                 tag_names=['Feature'], allure_id_position=(4, 0),
+                                 allure_id='12345')],
+        allure_imports=[('id', 'id')]
+    )
+    key = cache.make_key(b'source', DefaultConfig())
+    cache.put(key, facts)
+
+    cached = cache.get(key)
+    assert cached.to_dict() == facts.to_dict()
+
+
+def test_key_depends_on_source_and_config(tmp_path):
+    cache = FactsCache(str(tmp_path))
+    key = cache.make_key(b'source', DefaultConfig())
+
+    assert key == cache.make_key(b'source', DefaultConfig())
+    assert key != cache.make_key(b'changed source', DefaultConfig())
+    assert key != cache.make_key(b'source', DefaultConfig(required_allure_labels=['Feature']))
+
+
+def test_eviction_keeps_recently_used_entries(tmp_path):
+    cache = FactsCache(str(tmp_path), max_entries=2)
+    for i in range(4):
+        cache.put(f'key{i}', FileFacts())
+    cache.evict()
+
+    assert cache.get('key0') is None
+    assert cache.get('key1') is None
+    assert cache.get('key2') is not None
+    assert cache.get('key3') is not None
+
+
+def test_plugin_skips_visitor_for_cached_file(tmp_path):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureRequiredTagsChecker)
+    config = DefaultConfig(required_allure_labels=['Story'], cache_dir=str(tmp_path))
+
+    first_run = _run_plugin(CODE, 'scenario.py', config)
+    with patch.object(ScenarioVisitor, 'visit') as visit:
+        second_run = _run_plugin(CODE, 'scenario.py', config)
+
+    visit.assert_not_called()
+    assert first_run == second_run == ['ALR002 scenario should has allure tags Story']
+
+
+def test_cached_file_ids_are_checked_for_duplicates(tmp_path):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(DuplicateAllureIdChecker)
+    config = DefaultConfig(is_allure_id_required=True, cache_dir=str(tmp_path))
+
+    assert _run_plugin(CODE, 'first.py', config) == []
+    assert _run_plugin(CODE, 'second.py', config) == [
+        'ALR005 duplicate allure id 12345 was found in first.py'
+    ]
@@ -57,3 +57,56 @@ class Scenario: pass
     """
     assert_error(ScenarioVisitor, code, NoAllureIdError,
                  config=DefaultConfig(is_allure_id_required=True))
+
+
+def test_with_module_alias():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    code = """
+import allure as a
+
+@a.id(123)
+class Scenario: pass
+    """
+    assert_not_error(ScenarioVisitor, code,
+                     config=DefaultConfig(is_allure_id_required=True))
+
+
+def test_with_id_alias_from_allure_import():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    code = """
+from allure import id as aid
+
+@aid(123)
+class Scenario: pass
+    """
+    assert_not_error(ScenarioVisitor, code,
+                     config=DefaultConfig(is_allure_id_required=True))
+
+
+def test_with_dynamic_from_allure_import():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    code = """
+from allure import dynamic
+
+class Scenario:
+    def __init__(self):
+        dynamic.id(123)
+    """
+    assert_not_error(ScenarioVisitor, code,
+                     config=DefaultConfig(is_allure_id_required=True))
+
+
+def test_with_alias_of_other_module():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    code = """
+import other as a
+
+@a.id(123)
+class Scenario: pass
+    """
+    assert_error(ScenarioVisitor, code, NoAllureIdError,
+                 config=DefaultConfig(is_allure_id_required=True))
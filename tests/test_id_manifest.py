@@ -0,0 +1,90 @@
+import csv
+import json
+import subprocess
+import sys
+from textwrap import dedent
+
+from flake8_vedro_allure.facts import FileFacts, ScenarioFacts
+from flake8_vedro_allure.id_manifest import AllureIdRecord, iter_id_records
+from flake8_vedro_allure.id_manifest.collector import (
+    IdManifestPart,
+    iter_merged_records
+)
+from flake8_vedro_allure.runner.cli import main
+
+SCENARIO = dedent('''
+    import allure
+    from vedro_allure_reporter import allure_labels
+
+
+    @allure.id({allure_id})
+    @allure_labels(Feature.Login, Priority.P1)
+    class Scenario:
+        subject = 'scenario {allure_id}'
+''')
+
+
+def _write_scenarios(path, count):
+    scenarios = path / 'scenarios'
+    scenarios.mkdir()
+    for i in range(count):
+        (scenarios / f'scenario_{i:02}.py').write_text(SCENARIO.format(allure_id=100 + i))
+
+
+def _expected_records(count):
+    return [
+        AllureIdRecord(str(100 + i), f'scenarios/scenario_{i:02}.py', 6, 'Scenario', ('Feature.Login', 'Priority.P1'))
+        for i in range(count)
+    ]
+
+
+def test_records_of_file_facts():
+    file_facts = FileFacts([
+        ScenarioFacts('Scenario', 10, 0, allure_id_position=(9, 1), allure_id='2', labels=['Feature.A']),
+        ScenarioFacts('Scenario', 3, 0),
+        ScenarioFacts('Scenario', 1, 0, allure_id_position=(1, 1), allure_id='1'),
+    ])
+
+    assert list(iter_id_records('./a.py', file_facts)) == [
+        AllureIdRecord('1', 'a.py', 1, 'Scenario', ()),
+        AllureIdRecord('2', 'a.py', 9, 'Scenario', ('Feature.A',)),
+    ]
+
+
+def test_parts_are_merged_by_path(tmp_path):
+    facts = FileFacts([ScenarioFacts('Scenario', 1, 0, allure_id_position=(1, 1), allure_id='1')])
+    first, second = IdManifestPart(str(tmp_path)), IdManifestPart(str(tmp_path))
+    second.path = str(tmp_path / 'other.ndjson')
+    for name in ('d.py', 'a.py'):
+        first.add_file(name, facts)
+    for name in ('c.py', 'b.py'):
+        second.add_file(name, facts)
+    first.close()
+    second.close()
+
+    assert [record.path for record in iter_merged_records(str(tmp_path))] == ['a.py', 'b.py', 'c.py', 'd.py']
+
+
+def test_cli_id_manifest_csv(tmp_path):
+    _write_scenarios(tmp_path, 5)
+
+    main(['--jobs', '2', '--batch-size', '1', '--id-manifest', str(tmp_path / 'ids.csv'),
+          '--id-manifest-format', 'csv', str(tmp_path / 'scenarios')])
+
+    with open(tmp_path / 'ids.csv') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['allure_id'] for row in rows] == [str(100 + i) for i in range(5)]
+    assert rows[0]['labels'] == 'Feature.Login;Priority.P1'
+
+
+def test_flake8_id_manifest_from_workers(tmp_path):
+    _write_scenarios(tmp_path, 6)
+
+    subprocess.run(
+        [sys.executable, '-m', 'flake8', '--select', 'ALR', '--jobs', '3',
+         '--vedro-allure-id-manifest', 'ids.ndjson', 'scenarios'],
+        cwd=tmp_path, capture_output=True, text=True
+    )
+
+    lines = (tmp_path / 'ids.ndjson').read_text().splitlines()
+    assert [AllureIdRecord.from_dict(json.loads(line)) for line in lines] == _expected_records(6)
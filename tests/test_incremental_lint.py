@@ -0,0 +1,99 @@
+import json
+import subprocess
+from textwrap import dedent
+
+import pytest
+
+from flake8_vedro_allure.runner.cli import main
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    DuplicateAllureIdChecker
+)
+
+SCENARIO = dedent('''
+import allure
+
+@allure.id({allure_id})
+class Scenario: pass
+''')
+
+
+@pytest.fixture(autouse=True)
+def id_checkers():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    ScenarioVisitor.register_scenario_checker(DuplicateAllureIdChecker)
+
+
+@pytest.fixture()
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'scenarios').mkdir()
+    for name, allure_id in (('a', 1), ('b', 2), ('c', 3)):
+        (tmp_path / 'scenarios' / f'{name}.py').write_text(SCENARIO.format(allure_id=allure_id))
+    _git('init', '-q')
+    _git('add', '.')
+    _git('commit', '-q', '-m', 'init')
+    return tmp_path
+
+
+def _git(*args):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@test', *args], check=True)
+
+
+def _lint(capsys, *args):
+    exit_code = main(['--is-allure-id-required', 'true', '--format', 'json', '--baseline', 'ids.ndjson', *args])
+    return exit_code, json.loads(capsys.readouterr().out)
+
+
+def _baseline(repo):
+    lines = (repo / 'ids.ndjson').read_text().splitlines()
+    return [(record['allure_id'], record['path']) for record in map(json.loads, lines)]
+
+
+def test_diff_lint_uses_baseline_for_unchanged_files(repo, capsys):
+    assert _lint(capsys, '--update-baseline', 'scenarios')[0] == 0
+    (repo / 'scenarios' / 'd.py').write_text(SCENARIO.format(allure_id=1))
+    (repo / 'scenarios' / 'b.py').write_text(SCENARIO.format(allure_id=4))
+
+    exit_code, errors = _lint(capsys, '--diff-ref', 'HEAD', '--update-baseline', 'scenarios')
+
+    assert exit_code == 1
+    assert [(error['filename'], error['code']) for error in errors] == [('scenarios/d.py', 'ALR005')]
+    assert 'scenarios/a.py' in errors[0]['text']
+    assert _baseline(repo) == [('1', 'scenarios/a.py'), ('4', 'scenarios/b.py'),
+                               ('3', 'scenarios/c.py'), ('1', 'scenarios/d.py')]
+
+
+def test_renamed_and_deleted_files_are_dropped_from_baseline(repo, capsys):
+    _lint(capsys, '--update-baseline', 'scenarios')
+    _git('mv', 'scenarios/a.py', 'scenarios/z.py')
+    _git('rm', '-q', 'scenarios/c.py')
+
+    exit_code, errors = _lint(capsys, '--diff-ref', 'HEAD', '--update-baseline')
+
+    assert (exit_code, errors) == (0, [])
+    assert _baseline(repo) == [('2', 'scenarios/b.py'), ('1', 'scenarios/z.py')]
+
+
+def test_full_run_drops_deleted_files_from_baseline(repo, capsys):
+    _lint(capsys, '--update-baseline', 'scenarios')
+    (repo / 'scenarios' / 'a.py').unlink()
+    (repo / 'scenarios' / 'd.py').write_text(SCENARIO.format(allure_id=1))
+
+    exit_code, errors = _lint(capsys, '--update-baseline', 'scenarios')
+
+    assert (exit_code, errors) == (0, [])
+    assert _baseline(repo) == [('2', 'scenarios/b.py'), ('3', 'scenarios/c.py'), ('1', 'scenarios/d.py')]
+
+
+def test_changed_list_from_file(repo, capsys):
+    _lint(capsys, '--update-baseline', 'scenarios')
+    (repo / 'scenarios' / 'a.py').write_text(SCENARIO.format(allure_id=3))
+    (repo / 'changed.txt').write_text('scenarios/a.py\nREADME.md\n')
+
+    exit_code, errors = _lint(capsys, '--changed', 'changed.txt')
+
+    # a.py has the lowest path, so it owns id 3 as in a full run and c.py is not linted
+    assert (exit_code, errors) == (0, [])
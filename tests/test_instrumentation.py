@@ -0,0 +1,104 @@
+import ast
+import json
+import subprocess
+import sys
+
+from flake8_plugin_utils import Error
+
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.instrumentation import Metrics
+from flake8_vedro_allure.runner.cli import main
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    AllureLabelsChecker
+)
+
+CODE = '''
+class Scenario: pass
+
+
+class Scenario: pass
+'''
+
+
+class FailingChecker(AllureLabelsChecker):
+    def check_scenario(self, context, config):
+        raise ValueError('broken checker')
+
+
+def _visit(metrics, checkers):
+    visitor = ScenarioVisitor(config=DefaultConfig(is_allure_id_required=True), filename='scenario.py',
+                              checkers=checkers, metrics=metrics)
+    visitor.visit(ast.parse(CODE))
+    return visitor.errors
+
+
+def test_metrics_per_checker_and_file():
+    metrics = Metrics()
+    errors = _visit(metrics, [AllureLabelsChecker(), AllureIdRequiredChecker()])
+
+    assert len(errors) == 2
+    assert metrics.checkers['AllureIdRequiredChecker'].to_dict()['calls'] == 2
+    assert metrics.checkers['AllureIdRequiredChecker'].errors == 2
+    assert metrics.checkers['AllureLabelsChecker'].errors == 0
+    assert metrics.files['scenario.py'].calls == 4
+    assert metrics.files['scenario.py'].seconds > 0
+
+
+def test_checker_exception_is_counted_and_other_checkers_run():
+    metrics = Metrics()
+    errors = _visit(metrics, [FailingChecker(), AllureIdRequiredChecker()])
+
+    assert len(errors) == 2
+    assert all(isinstance(error, Error) for error in errors)
+    assert metrics.checkers['FailingChecker'].exceptions == 2
+
+
+def test_merge_and_prometheus_format():
+    first, second = Metrics(), Metrics()
+    first.record('AllureLabelsChecker', 'a.py', 0.5, 1, False)
+    second.record('AllureLabelsChecker', 'b "quoted".py', 0.25, 0, True)
+    first.merge(second)
+
+    assert Metrics.from_dict(json.loads(first.to_json())).to_dict() == first.to_dict()
+    text = first.to_prometheus()
+    assert 'vedro_allure_checker_seconds_total{checker="AllureLabelsChecker"} 0.75\n' in text
+    assert 'vedro_allure_checker_exceptions_total{checker="AllureLabelsChecker"} 1\n' in text
+    assert 'vedro_allure_file_calls_total{file="b \\"quoted\\".py"} 1\n' in text
+    assert '# TYPE vedro_allure_file_errors_total counter\n' in text
+
+
+def test_cli_metrics_from_workers(tmp_path):
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    for i in range(6):
+        (tmp_path / f'scenario_{i}.py').write_text(f'class Scenario: pass  # {i}\n')
+    (tmp_path / 'scenario_copy.py').write_text('class Scenario: pass  # 0\n')
+    (tmp_path / 'helper.py').write_text('def helper(): pass\n')
+
+    main(['--is-allure-id-required', 'true', '--jobs', '2', '--batch-size', '1',
+          '--metrics', str(tmp_path / 'metrics.json'), str(tmp_path)])
+
+    metrics = json.loads((tmp_path / 'metrics.json').read_text())
+    assert metrics['checkers']['AllureIdRequiredChecker']['calls'] == 6
+    assert metrics['checkers']['AllureIdRequiredChecker']['errors'] == 6
+    assert len(metrics['files']) == 6
+    assert metrics['counters'] == {'identical_files': 1, 'prefilter_skipped': 1}
+
+
+def test_flake8_metrics_from_workers(tmp_path):
+    for i in range(4):
+        (tmp_path / f'scenario_{i}.py').write_text('import allure\n\n\n@allure.id(1)\nclass Scenario: pass\n')
+    (tmp_path / 'helper.py').write_text('def helper(): pass\n')
+
+    subprocess.run(
+        [sys.executable, '-m', 'flake8', '--select', 'ALR', '--jobs', '2', '--is-allure-id-required', 'true',
+         '--vedro-allure-metrics', 'metrics.prom', '--vedro-allure-metrics-format', 'prometheus', '.'],
+        cwd=tmp_path, capture_output=True, text=True
+    )
+
+    text = (tmp_path / 'metrics.prom').read_text()
+    assert 'vedro_allure_checker_calls_total{checker="DuplicateAllureIdChecker"} 4\n' in text
+    assert 'vedro_allure_checker_errors_total{checker="DuplicateAllureIdChecker"} 3\n' in text
+    assert 'vedro_allure_prefilter_skipped_total 1\n' in text
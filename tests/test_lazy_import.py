@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from importlib import import_module
+
+from flake8_vedro_allure.visitors.checkers_manifest import CHECKERS_MANIFEST
+
+LAZY_MODULES = ('sqlite3', 'flake8_vedro_allure.cache', 'flake8_vedro_allure.id_index',
+                'flake8_vedro_allure.visitors.scenario_allure_checkers.')
+
+
+def _imported_modules(code: str):
+    output = subprocess.check_output([
+        sys.executable, '-c', f'import sys; {code}; print("\\n".join(sys.modules))'
+    ])
+    return set(output.decode().split())
+
+
+def test_plugin_load_does_not_import_checkers_and_sqlite():
+    modules = _imported_modules('import flake8_vedro_allure.plugins')
+    assert 'flake8_vedro_allure.plugins' in modules
+    assert not [module for module in modules if module.startswith(LAZY_MODULES)]
+
+
+def test_disabled_checkers_are_not_imported():
+    modules = _imported_modules(
+        'from flake8_vedro_allure.visitors import ScenarioVisitor; '
+        'ScenarioVisitor.get_checker_plan(frozenset({"ALR004"}))'
+    )
+    assert 'flake8_vedro_allure.visitors.scenario_allure_checkers.allure_id_checker' in modules
+    assert 'flake8_vedro_allure.visitors.scenario_allure_checkers.duplicate_allure_id_checker' not in modules
+    assert 'sqlite3' not in modules
+
+
+def test_manifest_matches_checkers():
+    for spec in CHECKERS_MANIFEST:
+        checker_cls = getattr(import_module(spec.module), spec.class_name)
+        assert checker_cls.error_codes == spec.error_codes
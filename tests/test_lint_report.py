@@ -0,0 +1,123 @@
+import argparse
+import io
+import json
+from textwrap import dedent
+
+import pytest
+from flake8.violation import Violation
+
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.lint_report import NdjsonWriter, SarifWriter, make_record
+from flake8_vedro_allure.lint_report.formatters import SarifFormatter
+from flake8_vedro_allure.plugins import VedroAllurePlugin
+from flake8_vedro_allure.runner.cli import main
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    AllureRequiredTagsChecker,
+    DuplicateAllureIdChecker
+)
+
+SCENARIO = dedent('''
+import allure
+
+@allure_labels(Feature.House)
+@allure.id(7)
+class Scenario: pass
+''')
+
+
+@pytest.fixture(autouse=True)
+def checkers():
+    ScenarioVisitor.deregister_all()
+    for checker in (AllureRequiredTagsChecker, AllureIdRequiredChecker, DuplicateAllureIdChecker):
+        ScenarioVisitor.register_scenario_checker(checker)
+
+
+def _lint(tmp_path, capsys, output_format):
+    capsys.readouterr()
+    main(['--format', output_format, '--is-allure-id-required', 'true', '--required-allure-labels', 'Feature,Story',
+          str(tmp_path)])
+    return capsys.readouterr().out
+
+
+def test_sarif_log(tmp_path, capsys):
+    (tmp_path / 'first.py').write_text(SCENARIO)
+    (tmp_path / 'second.py').write_text(SCENARIO)
+
+    log = json.loads(_lint(tmp_path, capsys, 'sarif'))
+
+    run, = log['runs']
+    assert log['version'] == '2.1.0'
+    assert [rule['id'] for rule in run['tool']['driver']['rules']] == ['ALR001', 'ALR002', 'ALR003', 'ALR004',
+                                                                       'ALR005']
+    assert [result['ruleId'] for result in run['results']] == ['ALR002', 'ALR002', 'ALR005']
+    result = run['results'][-1]
+    assert result['locations'][0]['physicalLocation']['region'] == {'startLine': 6, 'startColumn': 1}
+    assert result['properties'] == {'allureId': '7'}
+    assert len({result['partialFingerprints']['vedroAllure/v1'] for result in run['results']}) == 3
+
+
+def test_fingerprints_do_not_depend_on_lines(tmp_path, capsys):
+    (tmp_path / 'scenario.py').write_text(SCENARIO)
+    before = [json.loads(line) for line in _lint(tmp_path, capsys, 'ndjson').splitlines()]
+    (tmp_path / 'scenario.py').write_text('\n\n' + SCENARIO)
+    after = [json.loads(line) for line in _lint(tmp_path, capsys, 'ndjson').splitlines()]
+
+    assert [record['line'] for record in after] == [record['line'] + 2 for record in before]
+    assert [record['fingerprint'] for record in after] == [record['fingerprint'] for record in before]
+    assert before[0]['allure_id'] == '7'
+
+
+def test_writers_stream_records():
+    output = io.StringIO()
+    writer = SarifWriter(output, '1.0.0')
+    writer.write(make_record('scenario.py', 1, 0, 'ALR004', 'no id'))
+    first = output.getvalue()
+    writer.write(make_record('scenario.py', 2, 0, 'ALR004', 'no id'))
+
+    assert output.getvalue().startswith(first)
+    writer.close()
+    assert len(json.loads(output.getvalue())['runs'][0]['results']) == 2
+
+    output = io.StringIO()
+    NdjsonWriter(output, '1.0.0').write(make_record('scenario.py', 1, 0, 'ALR004', 'no id'))
+    assert json.loads(output.getvalue())['code'] == 'ALR004'
+
+
+def test_flake8_formatter(tmp_path):
+    (tmp_path / 'scenario.py').write_text(SCENARIO)
+    output_file = tmp_path / 'report.sarif'
+    formatter = SarifFormatter(argparse.Namespace(output_file=str(output_file), color='never', show_source=False))
+
+    formatter.start()
+    formatter.beginning(str(tmp_path / 'scenario.py'))
+    formatter.handle(Violation('ALR002', str(tmp_path / 'scenario.py'), 4, 2, 'missing Story', None))
+    formatter.finished(str(tmp_path / 'scenario.py'))
+    formatter.stop()
+
+    result, = json.loads(output_file.read_text())['runs'][0]['results']
+    assert result['ruleId'] == 'ALR002'
+    assert result['properties'] == {'allureId': '7'}
+    assert result['locations'][0]['physicalLocation']['region'] == {'startLine': 4, 'startColumn': 2}
+
+
+def test_flake8_formatter_finds_scenarios_by_bases(tmp_path, monkeypatch):
+    (tmp_path / 'helpers').mkdir()
+    (tmp_path / 'helpers' / 'base.py').write_text('import vedro\n\nclass ApiScenario(vedro.Scenario): pass\n')
+    scenario = SCENARIO.replace('class Scenario:', 'class Login(ApiScenario):')
+    scenario = scenario.replace('import allure', 'import allure\nfrom helpers.base import ApiScenario')
+    (tmp_path / 'login.py').write_text(scenario)
+    monkeypatch.chdir(tmp_path)
+    output_file = tmp_path / 'report.sarif'
+    formatter = SarifFormatter(argparse.Namespace(output_file=str(output_file), color='never', show_source=False))
+
+    with VedroAllurePlugin.test_config(DefaultConfig(scenario_base_paths=['helpers'])):
+        formatter.start()
+    formatter.beginning('login.py')
+    formatter.handle(Violation('ALR002', 'login.py', 5, 2, 'missing Story', None))
+    formatter.finished('login.py')
+    formatter.stop()
+
+    result, = json.loads(output_file.read_text())['runs'][0]['results']
+    assert result['properties'] == {'allureId': '7'}
@@ -0,0 +1,67 @@
+import json
+from textwrap import dedent
+
+import pytest
+
+from flake8_vedro_allure.id_index import ShardEntry, merge_shards, write_shard
+from flake8_vedro_allure.runner.cli import main
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker,
+    DuplicateAllureIdChecker
+)
+
+SCENARIO = dedent('''
+import allure
+
+@allure.id({allure_id})
+class Scenario: pass
+''')
+
+
+@pytest.fixture(autouse=True)
+def id_checkers():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureIdRequiredChecker)
+    ScenarioVisitor.register_scenario_checker(DuplicateAllureIdChecker)
+
+
+def test_merge_reports_duplicates_between_shards_only(tmp_path):
+    write_shard([ShardEntry('1', 'b.py', 5, 0), ShardEntry('1', 'a.py', 5, 0), ShardEntry('2', 'a.py', 9, 0)],
+                str(tmp_path / 'first.ndjson'))
+    write_shard([ShardEntry('1', 'c.py', 5, 0), ShardEntry('1', 'c.py', 9, 0), ShardEntry('1', 'e.py', 5, 0),
+                 ShardEntry('3', 'd.py', 5, 0)], str(tmp_path / 'second.ndjson'))
+
+    with open(tmp_path / 'first.ndjson') as first, open(tmp_path / 'second.ndjson') as second:
+        duplicates = list(merge_shards([first, second]))
+
+    # b.py and e.py were reported against a.py and c.py when their shards were linted
+    assert duplicates == [(ShardEntry('1', 'c.py', 5, 0), ShardEntry('1', 'a.py', 5, 0)),
+                          (ShardEntry('1', 'c.py', 9, 0), ShardEntry('1', 'a.py', 5, 0))]
+
+
+def test_merge_rejects_unsorted_shard(tmp_path):
+    (tmp_path / 'shard.ndjson').write_text('["2","a.py",1,0]\n["1","a.py",1,0]\n')
+
+    with open(tmp_path / 'shard.ndjson') as shard, pytest.raises(ValueError, match='not sorted'):
+        list(merge_shards([shard]))
+
+
+def test_merge_index_command(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    for shard, allure_ids in (('api', (1, 2)), ('web', (2, 3))):
+        (tmp_path / shard).mkdir()
+        for allure_id in allure_ids:
+            (tmp_path / shard / f'scenario_{allure_id}.py').write_text(SCENARIO.format(allure_id=allure_id))
+        assert main([shard, '--is-allure-id-required', 'true', '--id-index-shard', f'{shard}.ndjson']) == 0
+    capsys.readouterr()
+
+    assert main(['merge-index', 'web.ndjson', 'api.ndjson', '--output', 'all.ndjson']) == 1
+
+    assert capsys.readouterr().out == (
+        'web/scenario_2.py:5:1: ALR005 duplicate allure id 2 was found in api/scenario_2.py\n'
+    )
+    assert [json.loads(line)[:2] for line in (tmp_path / 'all.ndjson').read_text().splitlines()] == [
+        ['1', 'api/scenario_1.py'], ['2', 'api/scenario_2.py'], ['2', 'web/scenario_2.py'],
+        ['3', 'web/scenario_3.py'],
+    ]
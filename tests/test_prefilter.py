@@ -0,0 +1,49 @@
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.prefilter import (
+    is_in_scenarios_folder,
+    might_have_errors,
+    should_check_file
+)
+from flake8_vedro_allure.runner.cli import main
+
+
+def test_file_without_scenario_is_skipped():
+    source = b'import allure\n\nclass Helper: pass\n'
+    assert not might_have_errors(source, DefaultConfig(is_allure_id_required=True))
+
+
+def test_scenario_subclass_name_is_not_scenario():
+    source = b'import allure\n\nclass ScenarioHelper: pass\n'
+    assert not might_have_errors(source, DefaultConfig(is_allure_id_required=True))
+
+
+def test_scenario_without_allure_is_checked_when_rules_need_it():
+    source = b'class Scenario(vedro.Scenario): pass\n'
+
+    assert might_have_errors(source, DefaultConfig(is_allure_labels_optional=False))
+    assert might_have_errors(source, DefaultConfig(is_allure_id_required=True))
+    assert not might_have_errors(source, DefaultConfig(required_allure_labels=['Feature']))
+
+
+def test_scenario_with_allure_is_checked():
+    source = b'@allure_labels(Feature.A)\nclass  Scenario: pass\n'
+    assert might_have_errors(source, DefaultConfig(required_allure_labels=['Feature']))
+
+
+def test_scenarios_folder_filter():
+    config = DefaultConfig(is_allure_id_required=True, is_scenarios_folder_only=True)
+    source = b'class Scenario: pass\n'
+
+    assert is_in_scenarios_folder('tests/scenarios/users/get_user.py')
+    assert not is_in_scenarios_folder('tests/helpers/scenarios.py')
+    assert should_check_file('scenarios/get_user.py', source, config)
+    assert not should_check_file('contexts/get_user.py', source, config)
+
+
+def test_cli_reports_skipped_files(tmp_path, capsys):
+    (tmp_path / 'scenario.py').write_text('class Scenario: pass\n')
+    (tmp_path / 'helper.py').write_text('def helper(): pass\n')
+
+    main(['--is-allure-id-required', 'true', '--statistics', str(tmp_path)])
+
+    assert capsys.readouterr().err == 'files: 2, checked: 1, skipped by prefilter: 1\n'
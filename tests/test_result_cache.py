@@ -0,0 +1,95 @@
+import ast
+from textwrap import dedent
+from unittest.mock import patch
+
+import pytest
+
+from flake8_vedro_allure.cache import ResultCache, get_result_cache
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.facts import FileFacts, ScenarioFacts
+from flake8_vedro_allure.instrumentation import Metrics
+from flake8_vedro_allure.plugins import VedroAllurePlugin
+from flake8_vedro_allure.visitors import ScenarioVisitor
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureRequiredTagsChecker,
+    DuplicateAllureIdChecker
+)
+
+CODE = dedent('''
+import allure
+
+@allure_labels(Feature.House)
+@allure.id(12345)
+class Scenario: pass
+''')
+
+
+@pytest.fixture(autouse=True)
+def checkers():
+    ScenarioVisitor.deregister_all()
+    ScenarioVisitor.register_scenario_checker(AllureRequiredTagsChecker)
+    ScenarioVisitor.register_scenario_checker(DuplicateAllureIdChecker)
+
+
+def _run_plugin(code: str, filename: str, config: DefaultConfig):
+    with VedroAllurePlugin.test_config(config):
+        plugin = VedroAllurePlugin(ast.parse(code), filename, lines=code.splitlines(True))
+        return [text for _, _, text, _ in plugin.run()]
+
+
+def test_key_depends_on_source_config_and_plugin_version(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.make_key(b'source', DefaultConfig(), '1.0.0')
+
+    assert key == cache.make_key(b'source', DefaultConfig(cache_dir='other'), '1.0.0')
+    assert key != cache.make_key(b'changed source', DefaultConfig(), '1.0.0')
+    assert key != cache.make_key(b'source', DefaultConfig(is_allure_id_required=True), '1.0.0')
+    assert key != cache.make_key(b'source', DefaultConfig(), '1.0.1')
+
+
+def test_result_roundtrip_counts_hits_and_misses(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    facts = FileFacts(scenarios=[ScenarioFacts('Scenario', 5, 0, allure_id='1')])
+
+    assert cache.get('key') is None
+    cache.put('key', [(5, 0, 'ALR002 scenario should has allure tags Story')], facts)
+    cached = cache.get('key')
+
+    assert cached.errors == [(5, 0, 'ALR002 scenario should has allure tags Story')]
+    assert cached.file_facts.to_dict() == facts.to_dict()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_plugin_replays_errors_without_visitor(tmp_path):
+    config = DefaultConfig(required_allure_labels=['Story'], cache_dir=str(tmp_path))
+
+    first_run = _run_plugin(CODE, 'scenario.py', config)
+    with patch.object(VedroAllurePlugin, '_create_visitor') as create_visitor:
+        second_run = _run_plugin(CODE, 'scenario.py', config)
+
+    create_visitor.assert_not_called()
+    assert first_run == second_run == ['ALR002 scenario should has allure tags Story']
+    cache = get_result_cache(str(tmp_path))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_duplicates_of_cached_file_are_never_stale(tmp_path):
+    config = DefaultConfig(is_allure_id_required=True, cache_dir=str(tmp_path))
+
+    assert _run_plugin(CODE, 'second.py', config) == []
+    assert _run_plugin(CODE, 'first.py', config) == []
+
+    assert _run_plugin(CODE, 'second.py', config) == [
+        'ALR005 duplicate allure id 12345 was found in first.py'
+    ]
+
+
+def test_metrics_counters_are_merged():
+    first, second = Metrics(), Metrics()
+    first.count('result_cache_hits')
+    second.count('result_cache_hits', 2)
+    second.count('result_cache_misses')
+    first.merge(second)
+
+    assert first.counters == {'result_cache_hits': 3, 'result_cache_misses': 1}
+    assert 'vedro_allure_result_cache_hits_total 3' in first.to_prometheus()
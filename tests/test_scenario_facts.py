@@ -0,0 +1,104 @@
+import ast
+from textwrap import dedent
+
+from flake8_vedro_allure.facts import (
+    CASE_ALLURE_ID,
+    SCENARIO_ALLURE_ID,
+    AstFactsExtractor,
+    ScenarioFacts
+)
+
+
+def _extract(code: str) -> ScenarioFacts:
+    tree = ast.parse(dedent(code))
+    import_from_nodes = [node for node in tree.body if isinstance(node, ast.ImportFrom)]
+    scenario_node = next(node for node in tree.body if isinstance(node, ast.ClassDef))
+    return AstFactsExtractor().extract_scenario_facts(scenario_node, import_from_nodes)
+
+
+def test_facts_from_decorators():
+    facts = _extract("""
+    @allure_labels(Feature.One, Feature.Two, Story.A)
+    @allure.id(12345)
+    class Scenario: pass
+    """)
+
+    assert facts.labels_position == (2, 1)
+    assert facts.tag_counts == {'Feature': 2, 'Story': 1}
+    assert facts.allure_id_position == (3, 1)
+    assert facts.allure_id == '12345'
+    assert facts.allure_id_calls == []
+    assert facts.lineno == 4
+
+
+def test_facts_from_imported_id_decorator():
+    facts = _extract("""
+    from allure import id
+
+    @id(123)
+    class Scenario: pass
+    """)
+
+    assert facts.allure_id == '123'
+
+
+def test_facts_ignore_id_decorator_not_from_allure():
+    facts = _extract("""
+    from any_other_lib import id
+
+    @id(123)
+    class Scenario: pass
+    """)
+
+    assert facts.allure_id_position is None
+    assert not facts.has_allure_id
+
+
+def test_facts_from_allure_id_calls():
+    facts = _extract("""
+    class Scenario:
+        def __init__(self):
+            allure.id(1)
+
+        async def setup(self):
+            allure.dynamic.id(2)
+    """)
+
+    assert facts.allure_id_calls == [(4, 8), (7, 8)]
+    assert facts.has_allure_id
+    assert facts.allure_id is None
+
+
+def test_facts_from_params_decorators():
+    facts = _extract("""
+    class Scenario:
+        @params("admin", 1)
+        @vedro.params.skip("guest", allure_id=2)
+        @params("user", get_id())
+        @params("bot")
+        def __init__(self, role, allure_id=None):
+            allure.dynamic.id(allure_id)
+    """)
+
+    assert facts.params_allure_ids == [('1', 3, 5), ('2', 4, 5)]
+    assert list(facts.iter_allure_ids()) == [('1', 3, 5, CASE_ALLURE_ID), ('2', 4, 5, CASE_ALLURE_ID)]
+    assert ScenarioFacts.from_dict(facts.to_dict()).params_allure_ids == facts.params_allure_ids
+
+
+def test_facts_are_slotted():
+    facts = ScenarioFacts('Scenario', 1, 0)
+    assert not hasattr(facts, '__dict__')
+
+
+def test_allure_id_occurrences_have_kinds():
+    facts = _extract("""
+    @allure.id(7)
+    class Scenario:
+        @params(allure_id=7)
+        def __init__(self, allure_id):
+            pass
+    """)
+
+    assert [(occurrence.lineno, occurrence.kind) for occurrence in facts.iter_allure_ids()] == [
+        (3, SCENARIO_ALLURE_ID), (4, CASE_ALLURE_ID)
+    ]
@@ -0,0 +1,59 @@
+from textwrap import dedent
+
+from flake8_vedro_allure import LintSession
+from flake8_vedro_allure.config import DefaultConfig
+from flake8_vedro_allure.visitors.scenario_allure_checkers import (
+    AllureIdRequiredChecker
+)
+
+SCENARIO = dedent('''
+import allure
+
+@allure.id({allure_id})
+class Scenario: pass
+''')
+
+
+def _codes(errors):
+    return [(error.filename, error.code) for error in errors]
+
+
+def test_sessions_do_not_share_allure_ids(tmp_path):
+    config = DefaultConfig(is_allure_id_required=True)
+    first, second = LintSession(config), LintSession(config)
+
+    assert list(first.lint_source(SCENARIO.format(allure_id=1), 'a.py')) == []
+    assert _codes(first.lint_source(SCENARIO.format(allure_id=1), 'b.py')) == [('b.py', 'ALR005')]
+    assert list(second.lint_source(SCENARIO.format(allure_id=1), 'b.py')) == []
+
+    first.reset()
+    assert list(first.lint_source(SCENARIO.format(allure_id=1), 'b.py')) == []
+
+
+def test_relinted_file_replaces_its_ids():
+    session = LintSession(DefaultConfig(is_allure_id_required=True))
+    list(session.lint_source(SCENARIO.format(allure_id=1), 'a.py'))
+    list(session.lint_source(SCENARIO.format(allure_id=2), 'a.py'))
+
+    assert list(session.lint_source(SCENARIO.format(allure_id=1), 'b.py')) == []
+
+
+def test_lint_paths_yields_errors_lazily(tmp_path):
+    for name in ('b', 'a', 'c'):
+        (tmp_path / f'{name}.py').write_text(SCENARIO.format(allure_id=1))
+    (tmp_path / 'd.py').write_text('import allure\n\nclass Scenario: pass\n')
+    session = LintSession(DefaultConfig(is_allure_id_required=True))
+
+    errors = session.lint_paths([str(tmp_path)])
+    first = next(errors)
+
+    assert first.code == 'ALR004'
+    assert sorted(_codes(errors)) == [(str(tmp_path / 'b.py'), 'ALR005'), (str(tmp_path / 'c.py'), 'ALR005')]
+
+
+def test_checkers_and_codes_of_session():
+    session = LintSession(DefaultConfig(is_allure_id_required=True), checker_classes=[AllureIdRequiredChecker])
+    assert _codes(session.lint_source('import allure\nclass Scenario: pass\n')) == [('stdin.py', 'ALR004')]
+
+    session = LintSession(DefaultConfig(is_allure_id_required=True, enabled_codes=['ALR005']))
+    assert list(session.lint_source('import allure\nclass Scenario: pass\n')) == []
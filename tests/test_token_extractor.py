@@ -0,0 +1,136 @@
+import ast
+from textwrap import dedent
+
+import pytest
+from benchmarks.corpus import CorpusMix, generate_corpus
+
+from flake8_vedro_allure.facts import FileFacts, TokenFactsExtractor
+from flake8_vedro_allure.visitors import ScenarioVisitor
+
+
+def _ast_facts(source: bytes) -> FileFacts:
+    visitor = ScenarioVisitor(checkers=[])
+    visitor.visit(ast.parse(source))
+    return visitor.file_facts
+
+
+def _assert_same_facts(source: bytes) -> None:
+    facts = TokenFactsExtractor().extract_file_facts(source)
+    assert facts is not None
+    assert facts.to_dict() == _ast_facts(source).to_dict()
+
+
+@pytest.mark.parametrize('mix', [
+    CorpusMix(),
+    CorpusMix(allure_id_decorator=0.4, imported_id_decorator=0.3, dynamic_id_call=0.2, duplicate_id=0.1),
+    CorpusMix(allure_id_decorator=0.0, imported_id_decorator=0.0, dynamic_id_call=1.0),
+    CorpusMix(allure_id_decorator=0.0, imported_id_decorator=0.0, dynamic_id_call=1.0, params_cases=3),
+])
+def test_extractors_agree_on_benchmark_corpus(mix):
+    for corpus_file in generate_corpus(300, mix):
+        _assert_same_facts(corpus_file.source.encode())
+
+
+@pytest.mark.parametrize('code', [
+    """
+    import vedro, allure as a
+    from allure import id as aid, dynamic
+    from contexts import *  # comment with class Scenario
+
+    @allure_labels(Feature.Login, Story.Logout,
+                   Priority.P1, 'text', f"{x}", r'x',)
+    @aid(123)
+    @a.id(456)
+    class Scenario(vedro.Scenario):
+        subject = "Вход с паролем"  # Ünïcode
+
+        @vedro.params(1)
+        @vedro.params(2)
+        def __init__(self, value, allure_id):
+            a.dynamic.id(allure_id); dynamic.id(allure_id)
+            if value:
+                a.id(value)
+            self.value = value
+
+        async def then(self):
+            assert self.value
+    """,
+    """
+    import allure
+    @allure_labels(Feature.A, b'x', Feature.A)
+    @allure.id("0x11")
+    class Scenario: x = 1; allure.id(2)
+    """,
+    """
+    import allure
+    @allure.id(id=f'{1}')
+    @allure.id(b'1')
+    class Scenario(
+        vedro.Scenario,
+    ):
+        '''
+        class Scenario
+        '''
+        def __init__(self):
+            allure.dynamic.id(str(1))
+    """,
+    """
+    from allure import (
+        id,
+    )
+    @id(True)
+    class Scenario:
+        x = \\
+            1
+    """,
+    """
+    from vedro import params
+    class Scenario:
+        @params("a", 'b', 1)
+        @params.skip("c", "d", allure_id="2")
+        @params(x, y, z)
+        @vedro.params.only(1, 2, 3, allure_id=None)
+        @params(1, 2, -3)
+        @skip(1, 2, 4)
+        async def __init__(self, a, b, allure_id: int = 0) -> None:
+            pass
+
+        @params(1, 2, 5)
+        def given(self, a, b, allure_id):
+            pass
+    """,
+])
+def test_extractors_agree_on_tricky_code(code):
+    _assert_same_facts(dedent(code).encode())
+
+
+@pytest.mark.parametrize('code', [
+    """
+    if True:
+        class Scenario: pass
+    """,
+    """
+    def f():
+        import allure
+    """,
+    """
+    class Scenario:
+        def __init__(self): allure.id(1)
+    """,
+    "class Scenario:\n\tdef __init__(self):\n\t\tallure.id(1)\n",
+    "class Scenario:\n    x = '''\n",
+    "class Scenario:\n    x = (\n",
+    """
+    import allure
+    @allure.id(('1'))
+    class Scenario: pass
+    """,
+    """
+    class Scenario:
+        @params(*case)
+        def __init__(self, allure_id):
+            pass
+    """,
+])
+def test_ambiguous_code_falls_back_to_ast(code):
+    assert TokenFactsExtractor().extract_file_facts(dedent(code).encode()) is None